@@ -0,0 +1,72 @@
+# backend/config.py
+import os
+
+# 환경변수로 덮어쓸 수 있는 backend 설정값
+
+# 서버 측 replay 스트림 (/api/stream/scored)
+# - REPLAY_INTERVAL_SEC: 채점된 wafer 를 클라이언트에 내보내는 간격 (초)
+# - REPLAY_BATCH_SIZE: 한 번에 읽어서 채점하는 micro-batch 크기
+REPLAY_INTERVAL_SEC = float(os.getenv("REPLAY_INTERVAL_SEC", "2.0"))
+REPLAY_BATCH_SIZE = int(os.getenv("REPLAY_BATCH_SIZE", "16"))
+
+# DB 연결 (Postgres 등으로 바꿀 때는 DATABASE_URL 만 교체)
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./backend/db/alerts.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# SQLite 연결마다 적용하는 PRAGMA
+# - WAL: 읽기가 쓰기(alert 저장)에 막히지 않음, NORMAL 은 WAL 에서 안전한 fsync 수준
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+# 응답 캐시 (/api/reports/summary, /api/settings/admins)
+# 쓰기 때 같은 프로세스의 캐시는 바로 무효화되고, 다른 worker 는 TTL 안에 갱신된다
+RESPONSE_CACHE_TTL_SEC = float(os.getenv("RESPONSE_CACHE_TTL_SEC", "30"))
+RESPONSE_CACHE_MAXSIZE = int(os.getenv("RESPONSE_CACHE_MAXSIZE", "256"))
+
+# 모델 레지스트리
+# - MODEL_DEFAULT_VERSION: backend/models 자체를 가리키는 기본 버전 이름
+# - MODEL_VERSIONS_DIR: 추가 버전 디렉토리 (<dir>/<version>/ 에 stageI artifact 또는 bundle/)
+# - MODEL_VERSION_POLL_SEC: 다른 worker 가 바꾼 활성 버전(settings 테이블)을 확인하는 주기, 0 이면 끔
+MODEL_DEFAULT_VERSION = os.getenv("MODEL_DEFAULT_VERSION", "stageI")
+MODEL_VERSIONS_DIR = os.getenv(
+    "MODEL_VERSIONS_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "versions"),
+)
+MODEL_VERSION_POLL_SEC = float(os.getenv("MODEL_VERSION_POLL_SEC", "5"))
+
+# /api/predict 단건 요청 micro-batching
+# 동시에 들어온 단건 요청을 최대 PREDICT_BATCH_WINDOW_MS 동안 (또는 PREDICT_BATCH_MAX_ROWS 개까지) 모아서 한 번에 예측
+PREDICT_MICROBATCH = os.getenv("PREDICT_MICROBATCH", "1") == "1"
+PREDICT_BATCH_WINDOW_MS = float(os.getenv("PREDICT_BATCH_WINDOW_MS", "2"))
+PREDICT_BATCH_MAX_ROWS = int(os.getenv("PREDICT_BATCH_MAX_ROWS", "64"))
+
+# 프로세스 풀 추론 (GIL 회피)
+# - INFERENCE_WORKERS: 0 이면 요청 스레드에서 바로 예측, N 이면 worker 프로세스 N 개
+# - INFERENCE_SHM_ROWS: worker 와 주고받는 shared memory 버퍼 한 칸의 최대 row 수
+# - INFERENCE_MP_START: worker 시작 방식 (spawn / forkserver / fork)
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "0"))
+INFERENCE_SHM_ROWS = int(os.getenv("INFERENCE_SHM_ROWS", "1024"))
+INFERENCE_MP_START = os.getenv("INFERENCE_MP_START", "spawn")
+
+# 응답 JSON 인코딩
+# 1 이면 기본 응답 클래스를 FastJSONResponse 로 (orjson 이 설치되어 있으면 orjson, 없으면 compact 표준 json)
+FAST_JSON_RESPONSE = os.getenv("FAST_JSON_RESPONSE", "0") == "1"
+
+# IQR / P95 flag 용 rolling 분위수 sketch (core 센서별 P², 0.25 / 0.75 / 0.95)
+# - FLAG_SKETCH: 1 이면 최근 FLAG_SKETCH_WINDOW 개 wafer 기준 분위수로 flag 계산 (0 이면 기존 row 단위 flag)
+# - FLAG_SKETCH_MIN_COUNT: 이만큼 관측되기 전(warm-up)에는 row 단위 flag
+# - FLAG_SKETCH_PATH / FLAG_SKETCH_SAVE_EVERY: 상태 파일, 이 개수만큼 채점될 때마다 + 종료 시 저장
+# - sketch 는 프로세스 하나의 상태라서 FLAG_SKETCH=1 은 uvicorn worker 1 개로만 실행
+#   (FLAG_SKETCH_PATH.lock 을 먼저 잡은 worker 외에는 시작하지 않는다)
+FLAG_SKETCH = os.getenv("FLAG_SKETCH", "0") == "1"
+FLAG_SKETCH_WINDOW = int(os.getenv("FLAG_SKETCH_WINDOW", "500"))
+FLAG_SKETCH_MIN_COUNT = int(os.getenv("FLAG_SKETCH_MIN_COUNT", "50"))
+FLAG_SKETCH_PATH = os.getenv(
+    "FLAG_SKETCH_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "db", "flag_sketch.npz"),
+)
+FLAG_SKETCH_SAVE_EVERY = int(os.getenv("FLAG_SKETCH_SAVE_EVERY", "256"))
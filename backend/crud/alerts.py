@@ -1,15 +1,26 @@
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Optional
 import json
 import sqlite3
-from sqlalchemy import or_
+from sqlalchemy import and_, exists, insert, literal, or_, select, text, update
 
 from backend import models
 from backend import schemas
+from backend.crud.reports import EXCLUDED_MONTH
+from backend.crud.rollups import bump_rollups
+from backend.services.cache import invalidate_report_months
+from backend.services.serialize import ALERT_COLUMNS
 
 from sqlalchemy.orm import Session
 from backend.models import Alert
 
+
+def _invalidate_reports(timestamps):
+    # 리포트에서 빠지는 달(데모 스트리밍)만 바뀌었으면 캐시된 리포트는 그대로 유효
+    months = {ts.strftime('%Y-%m') for ts in timestamps}
+    invalidate_report_months(months - {EXCLUDED_MONTH})
+
 # (1) Create Alert
 def create_alert(db: Session, alert_data: dict):
     # The router ensures top_sensors is a JSON string.
@@ -22,23 +33,170 @@ def create_alert(db: Session, alert_data: dict):
         resolved_at=None
     )
     db.add(db_alert)
+    bump_rollups(db, [(db_alert.timestamp, 1, 1 if db_alert.resolved else 0)])
     db.commit()
+    _invalidate_reports([db_alert.timestamp])
     db.refresh(db_alert)
     return db_alert
 
-# (2) Get All Alerts
-def get_alerts(db: Session):
-    return db.query(models.Alert).order_by(models.Alert.id.desc()).all()
+# (1-1) Create Alerts in one transaction
+def create_alerts(db: Session, alerts_data: list):
+    """
+    여러 alert 를 executemany 방식의 INSERT 한 번 + commit 한 번으로 저장하고,
+    입력 순서대로 부여된 id 리스트를 반환합니다. (top_sensors 는 JSON 문자열)
+    """
+    if not alerts_data:
+        return []
+    rows = [
+        {
+            "timestamp": data["timestamp"],
+            "product_id": data["product_id"],
+            "top_sensors": data["top_sensors"],
+            "prob": data.get("prob"),
+            "resolved": data.get("resolved", False),
+            "resolved_at": None,
+        }
+        for data in alerts_data
+    ]
+    try:
+        result = db.execute(
+            insert(models.Alert).returning(models.Alert.id, sort_by_parameter_order=True),
+            rows,
+        )
+        ids = list(result.scalars())
+        bump_rollups(db, ((r["timestamp"], 1, 1 if r["resolved"] else 0) for r in rows))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    _invalidate_reports(r["timestamp"] for r in rows)
+    return ids
+
+# (1-2) Create Alerts once per wafer
+def create_alerts_once(db: Session, alerts_data: list):
+    """
+    create_alerts 와 같지만 (product_id, timestamp) 가 같은 alert 가 이미 있으면 다시 넣지 않고
+    기존 id 를 돌려줍니다. 서버 replay 는 uvicorn worker 마다 돌기 때문에 같은 wafer 가
+    worker 수만큼 저장되지 않도록 사용합니다. 롤업은 실제로 넣은 alert 만 반영합니다.
+    """
+    if not alerts_data:
+        return []
+    Alert = models.Alert
+    ids, inserted = [], []
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            # 확인 ~ INSERT 사이에 다른 worker 가 끼어들지 않게 (SQLite 는 첫 INSERT 부터 쓰기 lock 을 잡아 직렬)
+            db.execute(text("SELECT pg_advisory_xact_lock(hashtext('alerts.create_alerts_once'))"))
+        for data in alerts_data:
+            row = {
+                "timestamp": data["timestamp"],
+                "product_id": data["product_id"],
+                "top_sensors": data["top_sensors"],
+                "prob": data.get("prob"),
+                "resolved": data.get("resolved", False),
+            }
+            same = and_(Alert.product_id == row["product_id"], Alert.timestamp == row["timestamp"])
+            # INSERT ... SELECT <값> WHERE NOT EXISTS (같은 wafer): 확인과 저장이 한 문장
+            stmt = insert(Alert).from_select(
+                list(row),
+                select(*(literal(v, getattr(Alert, k).type) for k, v in row.items()))
+                .where(~exists().where(same)),
+            ).returning(Alert.id)
+            alert_id = db.execute(stmt).scalar()
+            if alert_id is None:
+                alert_id = db.execute(select(Alert.id).where(same).order_by(Alert.id).limit(1)).scalar()
+            else:
+                inserted.append(row)
+            ids.append(alert_id)
+        bump_rollups(db, ((r["timestamp"], 1, 1 if r["resolved"] else 0) for r in inserted))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    _invalidate_reports(r["timestamp"] for r in inserted)
+    return ids
+
+# (2) Get Alerts (keyset pagination + filters)
+def _filter_alerts(query, before_id, limit, resolved, start_time, end_time, product_id):
+    if before_id is not None:
+        query = query.filter(models.Alert.id < before_id)
+    if resolved is not None:
+        query = query.filter(models.Alert.resolved == resolved)
+    if start_time is not None:
+        query = query.filter(models.Alert.timestamp >= start_time)
+    if end_time is not None:
+        query = query.filter(models.Alert.timestamp < end_time)
+    if product_id is not None:
+        query = query.filter(models.Alert.product_id == product_id)
+
+    query = query.order_by(models.Alert.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def get_alerts(
+    db: Session,
+    before_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    resolved: Optional[bool] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    product_id: Optional[int] = None,
+):
+    """
+    최신순(id desc) alert 조회.
+    - before_id: 이전 페이지의 마지막 id (keyset cursor, id < before_id)
+    - start_time / end_time: [start_time, end_time) 구간 필터
+    - 인자를 모두 생략하면 기존처럼 전체를 반환합니다.
+    """
+    return _filter_alerts(
+        db.query(models.Alert), before_id, limit, resolved, start_time, end_time, product_id
+    ).all()
+
+
+def get_alert_rows(
+    db: Session,
+    before_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    resolved: Optional[bool] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    product_id: Optional[int] = None,
+):
+    """
+    get_alerts 와 같은 조회를 ORM 객체 없이 ALERT_COLUMNS 순서의 row 튜플로 반환
+    (목록 응답을 바로 JSON 으로 만들 때 사용).
+    """
+    columns = [getattr(models.Alert, c) for c in ALERT_COLUMNS]
+    return _filter_alerts(
+        db.query(*columns), before_id, limit, resolved, start_time, end_time, product_id
+    ).all()
 
 # (3) Resolve an Alert
 def resolve_alert(db: Session, alert_id: int):
-    db_alert = db.query(models.Alert).filter(models.Alert.id == alert_id).first()
-    if db_alert and not db_alert.resolved:
-        db_alert.resolved = True
-        db_alert.resolved_at = datetime.utcnow()
+    # 미조치일 때만 바꾸는 조건부 UPDATE: 같은 alert 를 동시에 조치해도 한 요청만 rowcount=1 이 되어
+    # 롤업의 resolved 가 한 번만 올라간다 (읽고 파이썬에서 바꾸면 둘 다 미조치로 보고 두 번 올림)
+    result = db.execute(
+        update(models.Alert)
+        .where(models.Alert.id == alert_id, models.Alert.resolved.is_(False))
+        .values(resolved=True, resolved_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 1:
+        timestamp = db.query(models.Alert.timestamp).filter(models.Alert.id == alert_id).scalar()
+        bump_rollups(db, [(timestamp, 0, 1)])
         db.commit()
-        db.refresh(db_alert)
-    return db_alert
+        _invalidate_reports([timestamp])
+    else:
+        db.rollback()
+    return db.query(models.Alert).filter(models.Alert.id == alert_id).first()
+
+# 데모 리셋 때 지우는 구간 [start, end)
+DEMO_RESET_RANGES = (
+    (datetime(2008, 11, 25), datetime(2008, 11, 26)),  # Today's demo streaming data
+    (datetime(2025, 1, 1), datetime(2026, 1, 1)),      # Current year test data for development
+)
 
 # 데모 데이터 리셋을 위한 새로운 함수
 def delete_demo_data(db: Session):
@@ -49,18 +207,20 @@ def delete_demo_data(db: Session):
     - 과거 시드 데이터(7-10월, 11월 초)는 보존됩니다.
     """
     try:
-        deleted_rows = (
-            db.query(Alert)
-            .filter(
-                or_(
-                    Alert.timestamp.like("2008-11-25%"), # Today's demo streaming data
-                    Alert.timestamp.like("2025-%")      # Current year test data for development
-                )
-            )
-            .delete(synchronize_session=False)
-        )
+        # 인덱스(ix_alerts_timestamp)를 타는 [start, end) 구간 비교
+        demo_filter = or_(*(
+            and_(Alert.timestamp >= start, Alert.timestamp < end)
+            for start, end in DEMO_RESET_RANGES
+        ))
+
+        # 지워질 alert 만큼 리포트 집계에서도 빼기
+        removed = db.query(Alert.timestamp, Alert.resolved).filter(demo_filter).all()
+        bump_rollups(db, ((ts, -1, -1 if resolved else 0) for ts, resolved in removed))
+
+        deleted_rows = db.query(Alert).filter(demo_filter).delete(synchronize_session=False)
 
         db.commit()
+        _invalidate_reports(ts for ts, _ in removed)
         if deleted_rows > 0:
             print(f"[DEMO RESET] Deleted {deleted_rows} session rows (2008-11-25, 2025-).")
         return {"status": "ok", "deleted_rows": deleted_rows}
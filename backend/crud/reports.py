@@ -1,46 +1,68 @@
-from sqlalchemy import func, case, extract
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
-from ..models import Alert
+from ..models import AlertRollup
 import datetime
 from calendar import monthrange
+from types import SimpleNamespace
 from typing import Optional
 
+# 리포트에서 항상 제외하는 월 (데모 스트리밍 데이터)
+EXCLUDED_MONTH = "2008-11"
+
+
+def _month_range(month_str: Optional[str]):
+    """"YYYY-MM" → (시작 키, 다음 달 키). 잘못된 값이면 None."""
+    try:
+        year, month = map(int, month_str.split('-'))
+        start = datetime.date(year, month, 1)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    end = start.replace(day=monthrange(year, month)[1]) + datetime.timedelta(days=1)
+    return start.strftime('%Y-%m'), end.strftime('%Y-%m')
+
+
+def _aggregate_rollups(db: Session, grain: str, month_str: Optional[str], label):
+    """
+    alert_rollups 에서 grain 단위 행을 읽어 label(period) 기준으로 합산.
+    반환: period 오름차순 (period, total_defects, resolved_count) 리스트
+    """
+    query = db.query(AlertRollup).filter(
+        AlertRollup.grain == grain,
+        # 제외 월: period 가 EXCLUDED_MONTH 로 시작하는 행 제외 (문자열 범위 비교)
+        or_(AlertRollup.period < EXCLUDED_MONTH, AlertRollup.period >= EXCLUDED_MONTH + "~"),
+    )
+    month_range = _month_range(month_str) if month_str else None
+    if month_range:
+        query = query.filter(
+            AlertRollup.period >= month_range[0],
+            AlertRollup.period < month_range[1],
+        )
+
+    totals = {}
+    for row in query:
+        key = label(row.period)
+        total, resolved = totals.get(key, (0, 0))
+        totals[key] = (total + row.total, resolved + row.resolved)
+
+    return [
+        SimpleNamespace(period=k, total_defects=t, resolved_count=r)
+        for k, (t, r) in sorted(totals.items())
+        if t > 0
+    ]
+
+
 def get_summary_data(db: Session, period_type: str, month_str: Optional[str] = None):
-    # Base query excludes '2008-11' data for all report types
-    query = db.query(Alert).filter(func.strftime('%Y-%m', Alert.timestamp) != '2008-11')
-    
-    # Date filtering
-    if period_type != 'all' and month_str:
-        try:
-            year, month = map(int, month_str.split('-'))
-            start_date = datetime.date(year, month, 1)
-            end_date = start_date.replace(day=monthrange(year, month)[1])
-            query = query.filter(Alert.timestamp.between(
-                datetime.datetime.combine(start_date, datetime.time.min),
-                datetime.datetime.combine(end_date, datetime.time.max)
-            ))
-        except (ValueError, TypeError):
-            # Fallback for invalid month_str or if not provided for relevant period_types
-            pass
-
-    # Determine grouping label
-    if period_type == 'monthly':
-        grouping_label = func.strftime('%Y-%m', Alert.timestamp)
-    elif period_type == 'weekly':
-        grouping_label = (extract('day', Alert.timestamp) - 1) / 7 + 1
+    # alerts 를 매번 스캔하지 않고 alert 저장/조치 때 갱신되는 alert_rollups 에서 읽는다.
+    # '2008-11' 데이터는 모든 리포트에서 제외
+    if period_type == 'all':
+        month_str = None
+
+    if period_type == 'weekly':
+        aggregation = _aggregate_rollups(db, 'week', month_str, lambda p: int(p.rsplit('-W', 1)[1]))
     elif period_type == 'daily':
-        grouping_label = func.strftime('%d', Alert.timestamp)
-    else: # 'all'
-        grouping_label = func.strftime('%Y-%m', Alert.timestamp)
-
-    # Base aggregation
-    subquery = query.subquery()
-    
-    aggregation = db.query(
-        grouping_label.label('period'),
-        func.count(subquery.c.id).label('total_defects'),
-        func.sum(case((subquery.c.resolved == True, 1), else_=0)).label('resolved_count')
-    ).group_by('period').order_by('period').all()
+        aggregation = _aggregate_rollups(db, 'day', month_str, lambda p: p[-2:])
+    else: # 'monthly' / 'all'
+        aggregation = _aggregate_rollups(db, 'month', month_str, lambda p: p)
 
     # Process aggregated data
     chart_data = []
@@ -0,0 +1,68 @@
+from collections import defaultdict
+from sqlalchemy.orm import Session
+
+from backend.models import Alert, AlertRollup
+from backend.services.cache import invalidate_report_months
+
+def period_keys(ts):
+    """
+    timestamp → {grain: period key} (day / week / month)
+    week 는 리포트와 같은 "월 내 주차" ((일-1)//7 + 1)
+    """
+    return {
+        "day": ts.strftime("%Y-%m-%d"),
+        "week": f"{ts:%Y-%m}-W{(ts.day - 1) // 7 + 1}",
+        "month": ts.strftime("%Y-%m"),
+    }
+
+
+def bump_rollups(db: Session, changes):
+    """
+    changes: (timestamp, total 증감, resolved 증감) 반복자.
+    같은 기간끼리 먼저 합친 뒤 기간당 UPSERT 한 번으로 반영합니다.
+    commit 은 호출한 쪽 트랜잭션에서 alert 변경과 함께 합니다.
+    """
+    deltas = defaultdict(lambda: [0, 0])
+    for ts, d_total, d_resolved in changes:
+        for grain, period in period_keys(ts).items():
+            delta = deltas[(grain, period)]
+            delta[0] += d_total
+            delta[1] += d_resolved
+    if not deltas:
+        return
+
+    rows = [
+        {"grain": g, "period": p, "total": t, "resolved": r}
+        for (g, p), (t, r) in deltas.items()
+    ]
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as upsert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as upsert
+
+    stmt = upsert(AlertRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AlertRollup.grain, AlertRollup.period],
+        set_={
+            "total": AlertRollup.total + stmt.excluded.total,
+            "resolved": AlertRollup.resolved + stmt.excluded.resolved,
+        },
+    )
+    db.execute(stmt, rows)
+
+
+def rebuild_rollups(db: Session, batch_size: int = 10000):
+    """alerts 테이블 전체를 다시 읽어서 집계 테이블을 새로 만듭니다 (backfill 용)."""
+    db.query(AlertRollup).delete(synchronize_session=False)
+    query = db.query(Alert.timestamp, Alert.resolved).yield_per(batch_size)
+    bump_rollups(db, ((ts, 1, 1 if resolved else 0) for ts, resolved in query))
+    db.commit()
+    invalidate_report_months()
+
+
+def rollups_missing(db: Session):
+    """alert 는 있는데 집계가 비어 있으면 True (집계 테이블 도입 전 DB)."""
+    has_rollups = db.query(AlertRollup.grain).first() is not None
+    has_alerts = db.query(Alert.id).first() is not None
+    return has_alerts and not has_rollups
@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
 from ..models import Setting
+from ..services.cache import invalidate_setting
 import json
 
+# 모델 레지스트리 활성 버전 (모든 worker 가 주기적으로 읽어서 맞춘다)
+ACTIVE_MODEL_VERSION_KEY = "active_model_version"
+
 def get_setting(db: Session, key: str):
     return db.query(Setting).filter(Setting.key == key).first()
 
@@ -13,5 +17,10 @@ def update_setting(db: Session, key: str, value: str):
         db_setting = Setting(key=key, value=value)
         db.add(db_setting)
     db.commit()
+    invalidate_setting(key)
     db.refresh(db_setting)
     return db_setting
+
+def get_active_model_version(db: Session):
+    setting = get_setting(db, ACTIVE_MODEL_VERSION_KEY)
+    return setting.value if setting else None
@@ -1,12 +1,52 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-DATABASE_URL = "sqlite:///./backend/db/alerts.db"
+from backend import config
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
-)
+DATABASE_URL = config.DATABASE_URL
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """SQLite 연결이 열릴 때마다 WAL / 동기화 / 캐시 PRAGMA 적용."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={config.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={config.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA cache_size=-{config.SQLITE_CACHE_SIZE_KB}")
+    cursor.execute(f"PRAGMA mmap_size={config.SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA busy_timeout={config.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def make_engine(url: str = DATABASE_URL, tuned: bool = True):
+    """
+    DATABASE_URL 에 맞는 engine 생성.
+    - SQLite 파일 DB: 스레드 공유 허용 + 연결 풀 + (tuned=True 면) PRAGMA 적용
+    - 그 외(Postgres 등): 연결 풀 + pre_ping
+    """
+    pool_kwargs = {
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+    }
+
+    if not url.startswith("sqlite"):
+        return create_engine(url, pool_pre_ping=True, **pool_kwargs)
+
+    connect_args = {
+        "check_same_thread": False,
+        "timeout": config.SQLITE_BUSY_TIMEOUT_MS / 1000,
+    }
+    in_memory = url in ("sqlite://", "sqlite:///:memory:")
+    sqlite_engine = create_engine(
+        url, connect_args=connect_args, **({} if in_memory else pool_kwargs)
+    )
+    if tuned and not in_memory:
+        event.listen(sqlite_engine, "connect", _set_sqlite_pragmas)
+    return sqlite_engine
+
+
+engine = make_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -6,7 +6,7 @@
 import warnings
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import pandas as pd
+from fastapi.responses import JSONResponse
 from pathlib import Path
 import sys
 
@@ -15,28 +15,40 @@ import sys
 # to ensure consistent module resolution.
 # ... (sys.path logic)
 
-from .database import engine, Base
-from .routers import predict, stream, alerts, reports, settings
+from . import config
+from .database import engine, Base, SessionLocal
+from .models import Alert
+from .crud.rollups import rebuild_rollups, rollups_missing
+from .crud.settings import get_active_model_version
+from .routers import predict, stream, alerts, reports, settings, cache, models
+from .services.pipeline import FLAG_SKETCHES, MODEL_REGISTRY
+from .services.executor import shutdown_inference_executor
+from .services.serialize import FastJSONResponse
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+# create_all 은 이미 있는 테이블에 새 인덱스를 추가하지 않으므로 따로 보장
+for index in Alert.__table__.indexes:
+    index.create(bind=engine, checkfirst=True)
+
+# 리포트 집계 테이블 도입 전 DB 라면 한 번 backfill
+with SessionLocal() as _db:
+    if rollups_missing(_db):
+        rebuild_rollups(_db)
+
 
 # Suppress specific warnings
 warnings.filterwarnings("ignore", category=UserWarning, module='sklearn')
 warnings.filterwarnings("ignore", category=FutureWarning, module='sklearn')
 warnings.filterwarnings("ignore", category=UserWarning, module='joblib')
-try:
-    from pandas.errors import PerformanceWarning
-    warnings.filterwarnings("ignore", category=PerformanceWarning)
-except ImportError:
-    pass
 
 
 app = FastAPI(
     title="ZeroQ Factory Monitoring API",
     description="API for real-time monitoring of manufacturing processes.",
     version="1.0.0",
+    default_response_class=FastJSONResponse if config.FAST_JSON_RESPONSE else JSONResponse,
 )
 
 # CORS Middleware setup
@@ -57,10 +69,34 @@ app.include_router(stream.router, prefix="/api")
 app.include_router(alerts.router, prefix="/api")
 app.include_router(reports.router, prefix="/api")
 app.include_router(settings.router, prefix="/api")
+app.include_router(cache.router, prefix="/api")
+app.include_router(models.router, prefix="/api")
+
+def _saved_model_version():
+    with SessionLocal() as db:
+        return get_active_model_version(db)
+
 
 @app.on_event("startup")
 async def startup_event():
-    pass
+    # rolling 분위수 sketch 는 worker 1 개만 (다른 worker 가 이미 잡고 있으면 여기서 시작 실패)
+    FLAG_SKETCHES.claim()
+    # 저장된 활성 모델 버전을 백그라운드에서 미리 로드 (첫 예측 요청의 로드 지연 방지)
+    version = _saved_model_version()
+    try:
+        MODEL_REGISTRY.path(version)
+    except KeyError:
+        version = MODEL_REGISTRY.active_version
+    MODEL_REGISTRY.activate_when_ready(version)
+    # 다른 worker 에서 바꾼 활성 버전 따라가기
+    MODEL_REGISTRY.start_polling(_saved_model_version, config.MODEL_VERSION_POLL_SEC)
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    MODEL_REGISTRY.stop_polling()
+    shutdown_inference_executor()
+    FLAG_SKETCHES.save()
 
 @app.get("/")
 def read_root():
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import Boolean, Column, Integer, String, Float, DateTime, Text, Index
 from backend.database import Base
 import json
 
@@ -13,6 +13,14 @@ class Alert(Base):
     resolved = Column(Boolean, default=False, nullable=False)
     resolved_at = Column(DateTime, nullable=True)
 
+    # 목록/리포트 조회용 인덱스 (미조치 필터 + 기간 필터)
+    # (resolved, id) 는 미조치 목록을 id desc 순서 그대로 읽게 해서 정렬(temp b-tree)을 없앤다
+    __table_args__ = (
+        Index("ix_alerts_resolved_timestamp", "resolved", "timestamp"),
+        Index("ix_alerts_resolved_id", "resolved", "id"),
+        Index("ix_alerts_timestamp", "timestamp"),
+    )
+
     @property
     def top_sensors_list(self):
         return json.loads(self.top_sensors)
@@ -21,6 +29,15 @@ class Alert(Base):
     def top_sensors_list(self, value):
         self.top_sensors = json.dumps(value)
 
+class AlertRollup(Base):
+    """리포트용 alert 집계 (일/주/월 단위 누적 카운트)."""
+    __tablename__ = "alert_rollups"
+
+    grain = Column(String, primary_key=True)   # "day" | "week" | "month"
+    period = Column(String, primary_key=True)  # "2008-07-19" | "2008-07-W3" | "2008-07"
+    total = Column(Integer, nullable=False, default=0)
+    resolved = Column(Integer, nullable=False, default=0)
+
 class Setting(Base):
     __tablename__ = "settings"
 
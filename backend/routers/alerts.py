@@ -1,30 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 import json
-import ast # ast 모듈 추가
 
 from backend import schemas
 from backend.database import get_db
 from backend.crud import alerts as alerts_crud
+from backend.services.serialize import alert_rows_json, parse_top_sensors
 
 router = APIRouter()
 
 def convert_db_alert(db_alert):
     """DB Alert 객체를 Pydantic 모델로 변환하고, top_sensors 파싱을 안전하게 처리합니다."""
-    sensors = []
-    if db_alert.top_sensors:
-        try:
-            # 1. 유효한 JSON으로 파싱 시도
-            sensors = json.loads(db_alert.top_sensors)
-        except json.JSONDecodeError:
-            try:
-                # 2. 실패 시, Python 리스트 문자열로 안전하게 평가
-                sensors = ast.literal_eval(db_alert.top_sensors)
-            except (ValueError, SyntaxError):
-                # 두 방법 모두 실패 시 빈 리스트로 처리 (또는 에러 로깅)
-                sensors = []
-    
+    # JSON 파싱 → 실패 시 Python 리스트 문자열로 안전하게 평가 → 그래도 실패하면 빈 리스트
+    sensors = parse_top_sensors(db_alert.top_sensors)
+
     return schemas.AlertResponse(
         id=db_alert.id,
         timestamp=db_alert.timestamp.isoformat(),
@@ -45,10 +36,61 @@ def create_alert_endpoint(alert: schemas.AlertCreate, db: Session = Depends(get_
     db_alert = alerts_crud.create_alert(db=db, alert_data=data)
     return convert_db_alert(db_alert)
 
-@router.get("/alerts", response_model=List[schemas.AlertResponse])
-def get_alerts_endpoint(db: Session = Depends(get_db)):
-    db_alerts = alerts_crud.get_alerts(db)
-    return [convert_db_alert(alert) for alert in db_alerts]
+@router.post("/alerts/bulk", response_model=schemas.AlertBulkResponse)
+def create_alerts_bulk_endpoint(alerts: List[schemas.AlertCreate], db: Session = Depends(get_db)):
+    """여러 alert 를 한 트랜잭션으로 저장하고, 입력 순서대로 부여된 id 를 반환합니다."""
+    data = []
+    for alert in alerts:
+        item = alert.dict()
+        item['top_sensors'] = json.dumps(item.get('top_sensors', []))
+        data.append(item)
+
+    ids = alerts_crud.create_alerts(db=db, alerts_data=data)
+    return {"ids": ids}
+
+@router.get(
+    "/alerts",
+    # 응답은 alert_rows_json 이 직접 만든 bytes (response_model 검증 없음). 스키마는 문서용으로만.
+    responses={
+        200: {
+            "model": List[schemas.AlertResponse],
+            "description": "최신순 alert 목록",
+            "headers": {
+                "X-Next-Before-Id": {
+                    "description": "다음 페이지 before_id (limit 만큼 찼을 때만)",
+                    "schema": {"type": "integer"},
+                },
+            },
+        },
+    },
+)
+def get_alerts_endpoint(
+    before_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    resolved: Optional[bool] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    product_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    최신순 alert 목록. limit 을 주면 keyset 페이지 단위로 반환하고,
+    다음 페이지 cursor 를 X-Next-Before-Id 헤더로 알려줍니다.
+    목록은 row 튜플에서 바로 JSON 으로 만들어 AlertResponse 생성/검증을 건너뜁니다.
+    """
+    rows = alerts_crud.get_alert_rows(
+        db,
+        before_id=before_id,
+        limit=limit,
+        resolved=resolved,
+        start_time=start_time,
+        end_time=end_time,
+        product_id=product_id,
+    )
+    headers = {}
+    if limit is not None and len(rows) == limit:
+        headers["X-Next-Before-Id"] = str(rows[-1][0])
+    return Response(content=alert_rows_json(rows), media_type="application/json", headers=headers)
 
 @router.patch("/alerts/{alert_id}/resolve", response_model=schemas.AlertResponse)
 def resolve_alert_endpoint(alert_id: int, db: Session = Depends(get_db)):
@@ -0,0 +1,13 @@
+# backend/routers/cache.py
+
+from fastapi import APIRouter
+
+from ..services.cache import RESPONSE_CACHE
+
+router = APIRouter()
+
+
+@router.get("/cache/stats")
+def get_cache_stats():
+    """리포트/설정 응답 캐시 hit/miss 카운터 (이 worker 프로세스 기준)"""
+    return RESPONSE_CACHE.stats()
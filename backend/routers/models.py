@@ -0,0 +1,61 @@
+# backend/routers/models.py
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from ..crud import settings as crud_settings
+from ..database import get_db
+from ..services.pipeline import MODEL_REGISTRY
+
+router = APIRouter()
+
+# 교체할 버전 로드를 기다리는 최대 시간 (초)
+ACTIVATE_TIMEOUT_SEC = 120
+
+
+class ModelActivateInput(BaseModel):
+    version: str
+
+
+def _check_version(version: str):
+    try:
+        MODEL_REGISTRY.path(version)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown model version: {version}")
+
+
+@router.get("/models")
+def list_models():
+    """등록된 모델 버전 목록 + 로드 상태 + 활성 버전"""
+    return {
+        "active": MODEL_REGISTRY.active_version,
+        "versions": MODEL_REGISTRY.versions(),
+    }
+
+
+@router.post("/models/{version}/preload", status_code=202)
+def preload_model(version: str):
+    """버전을 백그라운드에서 미리 로드 (교체 전에 호출하면 교체가 즉시 끝난다)"""
+    _check_version(version)
+    MODEL_REGISTRY.preload(version)
+    return {"version": version, "status": MODEL_REGISTRY.status(version)}
+
+
+@router.put("/models/active")
+def activate_model(data: ModelActivateInput, db: Session = Depends(get_db)):
+    """
+    활성 모델 버전 교체. 로드가 끝난 뒤에 한 번에 바꾸므로 진행 중인 예측은 이전 버전으로 끝난다.
+    settings 테이블에 저장해서 다른 worker 도 MODEL_VERSION_POLL_SEC 안에 같은 버전으로 바뀐다.
+    """
+    _check_version(data.version)
+    try:
+        previous = MODEL_REGISTRY.activate(data.version, timeout=ACTIVATE_TIMEOUT_SEC)
+    except FutureTimeoutError:
+        raise HTTPException(status_code=504, detail=f"Model {data.version} is still loading")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to load model {data.version}: {e}")
+
+    crud_settings.update_setting(db, crud_settings.ACTIVE_MODEL_VERSION_KEY, data.version)
+    return {"active": data.version, "previous": previous}
@@ -1,14 +1,37 @@
 # backend/routers/predict.py
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from typing import List, Literal, Optional
 from pydantic import BaseModel
-from backend.services.pipeline import run_prediction
+from starlette.concurrency import run_in_threadpool
+from backend import config
+from backend.services.batcher import MicroBatcher
+from backend.services.compact import FULL_SENSORS, CompactInputError, decode_b64, decode_values
+from backend.services.pipeline import (
+    MODEL_REGISTRY,
+    run_prediction,
+    run_prediction_batch,
+)
 
 router = APIRouter()
 
+# 동시에 들어온 /predict 단건 요청을 모아서 run_prediction_batch 한 번으로 예측
+PREDICT_BATCHER = MicroBatcher(
+    run_prediction_batch,
+    max_batch=config.PREDICT_BATCH_MAX_ROWS,
+    max_wait_ms=config.PREDICT_BATCH_WINDOW_MS,
+)
+
 class PredictInput(BaseModel):
     timestamp: str
     product_id: int
-    sensors: dict  # sensor_001 ~ sensor_590
+    sensors: Optional[dict] = None  # sensor_001 ~ sensor_590
+    # compact 입력 (sensors 대신 둘 중 하나):
+    # - values: layout 순서의 float 배열 (null = 결측)
+    # - values_b64: layout 순서의 little-endian float32 버퍼 (base64, NaN = 결측)
+    # layout "core" = /predict/schema 의 core_features 40개, "full" = sensor_001 ~ sensor_590
+    layout: Literal["core", "full"] = "core"
+    values: Optional[List[Optional[float]]] = None
+    values_b64: Optional[str] = None
 
 class PredictOutput(BaseModel):
     product_id: int
@@ -16,11 +39,59 @@ class PredictOutput(BaseModel):
     prob: float
     pred: int
     top_sensors: list
+    model_version: str
+
+class PredictBatchInput(BaseModel):
+    rows: List[PredictInput]
+
+class PredictBatchOutput(BaseModel):
+    results: List[PredictOutput]
+
+def _model_input(data: PredictInput):
+    """sensors dict 또는 compact 입력(SensorVector) 하나를 꺼낸다."""
+    given = [f for f in ("sensors", "values", "values_b64") if getattr(data, f) is not None]
+    if len(given) != 1:
+        raise HTTPException(
+            status_code=422,
+            detail="sensors, values, values_b64 중 정확히 하나만 보내야 합니다.",
+        )
+    if data.sensors is not None:
+        return data.sensors
+
+    # core layout 길이는 예측할 때 활성 엔진 기준으로 확인 (async 핸들러에서 엔진 로드를 기다리지 않도록)
+    try:
+        if data.values is not None:
+            return decode_values(data.values, data.layout)
+        return decode_b64(data.values_b64, data.layout)
+    except CompactInputError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.get("/predict/schema")
+def predict_schema():
+    """compact 입력(values / values_b64)의 센서 순서"""
+    version, engine = MODEL_REGISTRY.active()
+    return {
+        "model_version": version,
+        "layouts": {
+            "core": engine.core_features,
+            "full": FULL_SENSORS,
+        },
+        "values_b64_dtype": "<f4",
+    }
+
 
 @router.post("/predict", response_model=PredictOutput)
-def predict(data: PredictInput):
+async def predict(data: PredictInput):
 
-    result = run_prediction(data.sensors)
+    item = _model_input(data)
+    try:
+        if config.PREDICT_MICROBATCH:
+            result = await PREDICT_BATCHER.submit(item)
+        else:
+            result = await run_in_threadpool(run_prediction, item)
+    except CompactInputError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
     return {
         "timestamp": data.timestamp,
@@ -28,4 +99,27 @@ def predict(data: PredictInput):
         "prob": result["prob"],
         "pred": result["pred"],
         "top_sensors": result["top_sensors"],
-    }
\ No newline at end of file
+        "model_version": result["model_version"],
+    }
+
+@router.post("/predict/batch", response_model=PredictBatchOutput)
+def predict_batch(data: PredictBatchInput):
+
+    try:
+        results = run_prediction_batch([_model_input(row) for row in data.rows])
+    except CompactInputError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return {
+        "results": [
+            {
+                "timestamp": row.timestamp,
+                "product_id": row.product_id,
+                "prob": result["prob"],
+                "pred": result["pred"],
+                "top_sensors": result["top_sensors"],
+                "model_version": result["model_version"],
+            }
+            for row, result in zip(data.rows, results)
+        ]
+    }
@@ -1,20 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from ..database import get_db
 from ..crud import reports as crud_reports
+from ..services.cache import cached_json_response, report_key
 from typing import Optional
 
 router = APIRouter()
 
 @router.get("/reports/summary")
 def get_reports_summary(
+    request: Request,
     period_type: str = "monthly",
     month: Optional[str] = None, # "YYYY-MM"
     db: Session = Depends(get_db)
 ):
+    # 같은 결과를 내는 요청은 같은 캐시 키로 ('all'/잘못된 month 는 월 필터 없음과 동일)
+    month_range = crud_reports._month_range(month) if period_type != 'all' else None
+    key = report_key(period_type, month_range[0] if month_range else None)
     try:
-        summary_data = crud_reports.get_summary_data(db, period_type, month)
-        return summary_data
+        return cached_json_response(
+            request, key,
+            lambda: crud_reports.get_summary_data(db, period_type, month),
+        )
     except Exception as e:
         # Log the error e for debugging
         print(f"Error fetching summary data: {e}")
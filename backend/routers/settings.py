@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
 from ..database import get_db
 from ..crud import settings as crud_settings
+from ..services.cache import cached_json_response, setting_key
 from typing import Optional
 import json
 
@@ -20,11 +21,10 @@ class AdminSettings(BaseModel):
     quality_manager: AdminInfo
 
 
-@router.get("/settings/admins", response_model=AdminSettings)
-def get_admin_settings(db: Session = Depends(get_db)):
+def _load_admin_settings(db: Session):
     settings_json = crud_settings.get_setting(db, "admin_settings")
     if settings_json:
-        return json.loads(settings_json.value)
+        return AdminSettings.model_validate(json.loads(settings_json.value))
     
     # Return default structure if not found
     default_info = {
@@ -33,6 +33,13 @@ def get_admin_settings(db: Session = Depends(get_db)):
     return AdminSettings(monitor_admin=default_info, quality_manager=default_info)
 
 
+@router.get("/settings/admins", response_model=AdminSettings)
+def get_admin_settings(request: Request, db: Session = Depends(get_db)):
+    return cached_json_response(
+        request, setting_key("admin_settings"), lambda: _load_admin_settings(db)
+    )
+
+
 @router.put("/settings/admins", response_model=AdminSettings)
 def update_admin_settings(settings: AdminSettings, db: Session = Depends(get_db)):
     settings_json_str = settings.model_dump_json()
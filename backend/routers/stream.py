@@ -1,9 +1,14 @@
 # backend/routers/stream.py
 
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from ..database import get_db
-from ..services.stream import load_stream_rows
+from ..services.stream import load_stream_rows_json, iter_stream_ndjson
+from ..services.replay import REPLAY
 from ..crud.alerts import delete_demo_data
 
 router = APIRouter()
@@ -17,5 +22,53 @@ def reset_demo(db: Session = Depends(get_db)):
 def get_all_stream_rows():
     """
     Returns all rows from the raw_stream.csv file at once.
+    The encoded body is reused until the file changes.
     """
-    return load_stream_rows()
\ No newline at end of file
+    return Response(content=load_stream_rows_json(), media_type="application/json")
+
+@router.get("/stream/rows")
+def stream_rows(
+    since_product_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
+):
+    """
+    Streams raw_stream.csv rows as NDJSON (one JSON object per line).
+    Rows are read lazily; pass the last received product_id as
+    since_product_id to fetch only newer rows.
+    """
+    return StreamingResponse(
+        iter_stream_ndjson(since_product_id=since_product_id, limit=limit),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get("/stream/scored")
+async def stream_scored(request: Request):
+    """
+    Server-Sent Events stream of wafers scored on the server.
+    Rows are scored in micro-batches through run_prediction_batch, defects are
+    saved to alerts in bulk, and every connected client receives the same
+    results at the configured replay rate (REPLAY_INTERVAL_SEC).
+    """
+    queue = REPLAY.subscribe()
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    kind, payload = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if kind == "end":
+                    yield "event: end\ndata: {}\n\n"
+                    break
+                yield f"id: {payload['product_id']}\nevent: scored\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            REPLAY.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
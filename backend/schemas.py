@@ -13,6 +13,10 @@ class AlertBase(BaseModel):
 class AlertCreate(AlertBase):
     pass
 
+# Response body for bulk create
+class AlertBulkResponse(BaseModel):
+    ids: List[int]
+
 # Pydantic model for response body (read)
 class AlertResponse(AlertBase):
     id: int
@@ -0,0 +1,16 @@
+# 실행 (프로젝트 루트에서): python -m backend.seed.rebuild_rollups
+# alerts 테이블 전체로 리포트 집계(alert_rollups)를 다시 만든다 (backfill / 수동 복구용)
+from backend.crud.rollups import rebuild_rollups
+from backend.database import Base, SessionLocal, engine
+from backend.models import AlertRollup
+
+
+if __name__ == "__main__":
+    Base.metadata.create_all(bind=engine, tables=[AlertRollup.__table__])
+    db = SessionLocal()
+    try:
+        rebuild_rollups(db)
+        count = db.query(AlertRollup).count()
+    finally:
+        db.close()
+    print(f"✅ alert_rollups 재생성 완료 ({count} rows)")
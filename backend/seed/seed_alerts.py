@@ -1,4 +1,4 @@
-import sqlite3
+# 실행 (프로젝트 루트에서): python -m backend.seed.seed_alerts
 import pandas as pd
 import numpy as np
 import json
@@ -6,37 +6,29 @@ import random
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from backend.database import SessionLocal, engine
+from backend.crud.alerts import create_alerts
+from backend.models import Alert, AlertRollup
+
 # --- CONFIG ---
 BASE_DIR = Path(__file__).resolve().parent.parent
-DB_PATH = BASE_DIR / "db" / "alerts.db"
 CSV_PATH = BASE_DIR / "data" / "secom_raw.csv"
 
-def get_db_connection():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+def insert_alerts(alerts_data):
+    """API 의 POST /api/alerts/bulk 와 같은 bulk insert 경로로 저장."""
+    db = SessionLocal()
+    try:
+        return create_alerts(db, alerts_data)
+    finally:
+        db.close()
 
 def init_db():
     """Initialize alerts table (reset)."""
-    conn = get_db_connection()
-    cur = conn.cursor()
-
-    cur.execute("DROP TABLE IF EXISTS alerts")
-
-    cur.execute("""
-        CREATE TABLE alerts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            product_id INTEGER NOT NULL,
-            top_sensors TEXT NOT NULL,
-            prob REAL,
-            resolved BOOLEAN NOT NULL DEFAULT 0,
-            resolved_at TEXT
-        )
-    """)
-
-    conn.commit()
-    conn.close()
+    Alert.__table__.drop(bind=engine, checkfirst=True)
+    Alert.__table__.create(bind=engine)
+    # alert 를 비웠으니 리포트 집계도 같이 초기화 (이후 insert 때 다시 누적됨)
+    AlertRollup.__table__.drop(bind=engine, checkfirst=True)
+    AlertRollup.__table__.create(bind=engine)
     print("🧹 DB 초기화 완료 (alerts 테이블 재생성).")
 
 def seed_data():
@@ -59,43 +51,24 @@ def seed_data():
     # sensor 칼럼 자동 탐색
     sensor_columns = [c for c in df.columns if c.startswith("sensor_")]
 
-    conn = get_db_connection()
-    cur = conn.cursor()
-
-    insert_sql = """
-        INSERT INTO alerts (timestamp, product_id, top_sensors, prob, resolved, resolved_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """
-
-    for _, row in df_bad.iterrows():
-        ts = row["timestamp"].isoformat()
-        product_id = int(row["product_id"])
-
-        # 더미 top_sensors (랜덤 3개) - 수정된 부분
-        top3 = random.sample(sensor_columns, 3)
-        top_sensors_json = json.dumps(top3)
-
-        # 임시 예측 확률
-        prob = round(0.75 + (0.25 * (hash(ts) % 100) / 100), 4)
-
-        cur.execute(insert_sql, (
-            ts,
-            product_id,
-            top_sensors_json,
-            prob,
-            0,      # resolved FALSE
-            None    # resolved_at
-        ))
-
-    conn.commit()
-    conn.close()
+    # 더미 top_sensors (랜덤 3개) + 임시 예측 확률
+    alerts_data = []
+    for ts, product_id in zip(df_bad["timestamp"], df_bad["product_id"]):
+        ts_iso = ts.isoformat()
+        alerts_data.append({
+            "timestamp": ts.to_pydatetime(),
+            "product_id": int(product_id),
+            "top_sensors": json.dumps(random.sample(sensor_columns, 3)),
+            "prob": round(0.75 + (0.25 * (hash(ts_iso) % 100) / 100), 4),
+            "resolved": False,
+        })
+
+    insert_alerts(alerts_data)
     print("🎉 Seed Insert 완료! AlertsPage에서 데이터 확인하세요!")
 
 def append_dummy_november_data():
     """Appends 20 synthetic defect data points for November 2008, ensuring they are sequential."""
     print("\n appending 20 sequential synthetic November data points...")
-    conn = get_db_connection()
-    cur = conn.cursor()
 
     # Get sensor column names
     try:
@@ -116,33 +89,18 @@ def append_dummy_november_data():
         current_time += timedelta(hours=random.randint(8, 36), minutes=random.randint(0, 59))
         timestamps.append(current_time)
 
-    insert_sql = """
-        INSERT INTO alerts (timestamp, product_id, top_sensors, prob, resolved, resolved_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """
-
+    alerts_data = []
     for i in range(20):
-        timestamp = timestamps[i].isoformat()
-        product_id = product_ids[i]
-        
-        # Select 3 random sensors
-        top_sensors = random.sample(sensor_columns, 3)
-        top_sensors_json = json.dumps(top_sensors)
-        
-        # Generate random probability
-        prob = round(random.uniform(0.80, 0.98), 4)
-
-        cur.execute(insert_sql, (
-            timestamp,
-            product_id,
-            top_sensors_json,
-            prob,
-            0,      # resolved = FALSE
-            None    # resolved_at
-        ))
-
-    conn.commit()
-    conn.close()
+        # Select 3 random sensors + random probability
+        alerts_data.append({
+            "timestamp": timestamps[i],
+            "product_id": product_ids[i],
+            "top_sensors": json.dumps(random.sample(sensor_columns, 3)),
+            "prob": round(random.uniform(0.80, 0.98), 4),
+            "resolved": False,
+        })
+
+    insert_alerts(alerts_data)
     print(f"✅ Successfully appended 20 dummy alerts for November.")
 
 
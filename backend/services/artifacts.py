@@ -0,0 +1,42 @@
+# backend/services/artifacts.py
+import json
+from functools import lru_cache
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+MODELS_DIR = BASE_DIR / "models"
+
+# 추론에 필요한 artifact 파일 (digest 계산 순서 고정)
+ARTIFACT_FILES = (
+    "stageI_final_features.json",
+    "stageI_full_feature_list.json",
+    "stageI_final_threshold.json",
+    "sensors_mean_std_median.json",
+    "stageI_final_scaler.pkl",
+    "stageI_final_lgbm_model.pkl",
+)
+
+
+@lru_cache(maxsize=None)
+def _read_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_core_features(models_dir=MODELS_DIR):
+    """Top40 core 센서 리스트 (stageI_final_features.json)"""
+    return list(_read_json(Path(models_dir) / "stageI_final_features.json")["feature_list"])
+
+
+def load_final_features(models_dir=MODELS_DIR):
+    """모델 입력 순서의 파생변수 329개 (stageI_full_feature_list.json)"""
+    return list(_read_json(Path(models_dir) / "stageI_full_feature_list.json")["features"])
+
+
+def load_threshold(models_dir=MODELS_DIR):
+    return float(_read_json(Path(models_dir) / "stageI_final_threshold.json")["threshold_value"])
+
+
+def load_sensor_stats(models_dir=MODELS_DIR):
+    """센서별 mean / std / median (학습 시 저장한 값, 수정하지 말 것)"""
+    return _read_json(Path(models_dir) / "sensors_mean_std_median.json")
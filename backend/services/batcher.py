@@ -0,0 +1,102 @@
+# backend/services/batcher.py
+import asyncio
+
+from starlette.concurrency import run_in_threadpool
+
+
+class MicroBatcher:
+    """
+    동시에 들어온 단건 요청을 모아서 batch_fn 을 한 번만 호출하는 asyncio micro-batcher.
+
+    - 첫 요청이 들어오면 max_wait_ms 동안 (또는 max_batch 개가 찰 때까지) 더 모은 뒤
+      batch_fn(items) 을 threadpool 에서 실행하고 각 요청의 future 에 결과를 돌려준다.
+    - batch_fn 은 items 와 같은 길이의 리스트를 반환한다. 원소가 Exception 이면
+      그 요청만 예외로 끝난다. 길이가 다르면 어느 결과가 어느 요청 것인지 알 수 없으므로
+      배치 전체를 예외로 끝낸다 (future 를 기다리는 채로 두지 않음).
+    - batch_fn 자체가 실패하면 한 건씩 다시 실행해서 문제 있는 요청만 실패시킨다.
+    """
+
+    def __init__(self, batch_fn, max_batch=64, max_wait_ms=2.0):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = None
+        self._task = None
+        self._loop = None
+        self.batches = 0
+        self.items = 0
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def submit(self, item):
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _collect(self):
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            # 이미 쌓여 있는 요청은 기다리지 않고 바로 가져온다
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            # 연결이 끊긴 요청은 빼고 예측
+            batch = [(item, fut) for item, fut in batch if not fut.done()]
+            if not batch:
+                continue
+            items = [item for item, _ in batch]
+            try:
+                results = await run_in_threadpool(self.batch_fn, items)
+            except Exception:
+                results = await run_in_threadpool(self._run_one_by_one, items)
+
+            if len(results) != len(items):
+                error = RuntimeError(
+                    f"[batcher] batch_fn 결과 개수가 요청 수와 다릅니다: {len(results)} != {len(items)}"
+                )
+                results = [error] * len(items)
+
+            self.batches += 1
+            self.items += len(items)
+            for (_, fut), result in zip(batch, results):
+                if fut.done():
+                    continue
+                if isinstance(result, BaseException):
+                    fut.set_exception(result)
+                else:
+                    fut.set_result(result)
+
+    def _run_one_by_one(self, items):
+        results = []
+        for item in items:
+            try:
+                results.append(self.batch_fn([item])[0])
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch": self.items / self.batches if self.batches else 0.0,
+        }
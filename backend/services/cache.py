@@ -0,0 +1,142 @@
+# backend/services/cache.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from backend import config
+from backend.services.serialize import dumps
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes   # 미리 인코딩해 둔 JSON
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    프로세스 내 TTL + LRU 응답 캐시.
+    JSON 인코딩과 ETag 계산은 저장할 때 한 번만 하고, 조회는 dict lookup 한 번.
+    """
+
+    def __init__(self, maxsize=None, ttl=None):
+        self.maxsize = maxsize or config.RESPONSE_CACHE_MAXSIZE
+        self.ttl = config.RESPONSE_CACHE_TTL_SEC if ttl is None else ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # invalidate 때마다 +1: 만드는 도중 무효화된 (오래된) 값은 저장하지 않기 위함
+        self.generation = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item.expires_at < time.monotonic():
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def set(self, key, payload, generation=None):
+        """payload 를 인코딩해 저장. generation 이 그 사이 바뀌었으면 저장하지 않고 반환만."""
+        body = dumps(payload)
+        item = CachedResponse(
+            body=body,
+            etag='"' + hashlib.sha1(body).hexdigest() + '"',
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return item
+            self._items[key] = item
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return item
+
+    def invalidate(self, predicate=None):
+        """predicate(key) 가 True 인 항목 (없으면 전체) 삭제."""
+        with self._lock:
+            keys = [k for k in self._items if predicate is None or predicate(k)]
+            for k in keys:
+                del self._items[k]
+            self.invalidations += len(keys)
+            self.generation += 1
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "invalidations": self.invalidations,
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+                "ttl_sec": self.ttl,
+            }
+
+
+RESPONSE_CACHE = ResponseCache()
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag for t in tags)
+
+
+def cached_json_response(request: Request, key, build):
+    """
+    key 로 캐시된 JSON 응답을 돌려준다. 없으면 build() 결과를 인코딩해서 저장.
+    If-None-Match 가 현재 ETag 와 같으면 본문 없이 304.
+    """
+    item = RESPONSE_CACHE.get(key)
+    if item is None:
+        generation = RESPONSE_CACHE.generation
+        item = RESPONSE_CACHE.set(key, jsonable_encoder(build()), generation=generation)
+
+    headers = {"ETag": item.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), item.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=item.body, media_type="application/json", headers=headers)
+
+
+def report_key(period_type, month):
+    return ("reports", period_type, month)
+
+
+def setting_key(key):
+    return ("settings", key)
+
+
+def invalidate_report_months(months=None):
+    """
+    alert 변경으로 영향받는 리포트 키 삭제.
+    months(YYYY-MM 집합)가 주어지면 그 달 + 월 필터 없는 키만, 없으면 리포트 전체.
+    """
+    if months is None:
+        RESPONSE_CACHE.invalidate(lambda k: k[0] == "reports")
+        return
+    months = set(months)
+    if not months:
+        return
+    RESPONSE_CACHE.invalidate(
+        lambda k: k[0] == "reports" and (k[2] is None or k[2] in months)
+    )
+
+
+def invalidate_setting(key):
+    RESPONSE_CACHE.invalidate(lambda k: k == setting_key(key))
@@ -0,0 +1,140 @@
+# backend/services/cascade.py
+import json
+import os
+
+import numpy as np
+
+# bundle 디렉토리 안의 cascade 밴드 파일 (scripts/calibrate_cascade.py 가 생성)
+CASCADE_FILENAME = "cascade.json"
+
+
+class CascadeBand:
+    """
+    조기 종료(cascade) 추론 밴드.
+
+    앞쪽 n_trees 개 트리의 부분 log-odds 가 low 보다 작으면 정상(0), high 보다 크면 불량(1) 로
+    바로 확정하고, 그 사이(threshold 근처 애매한 wafer)만 나머지 트리까지 평가한다.
+    low / high 는 holdout 에서 부분 합 기준으로 라벨이 바뀌는 wafer 가 없도록 잡은 뒤 margin 만큼 넓힌 값.
+
+    조기 종료한 wafer 의 prob 은 부분 합 + (holdout 의 나머지 트리 평균 기여) 로 추정하고,
+    pred 와 어긋나지 않도록 threshold 반대쪽으로 넘어가지 않게 자른다.
+    """
+
+    __slots__ = ("n_trees", "low", "high", "low_offset", "high_offset", "threshold", "digest")
+
+    def __init__(self, n_trees, low, high, low_offset, high_offset, threshold, digest=None):
+        self.n_trees = int(n_trees)
+        self.low = float(low)
+        self.high = float(high)
+        self.low_offset = float(low_offset)
+        self.high_offset = float(high_offset)
+        self.threshold = float(threshold)
+        self.digest = digest
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data.get(name) for name in cls.__slots__})
+
+    def save(self, bundle_dir):
+        path = os.path.join(bundle_dir, CASCADE_FILENAME)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=1)
+        return path
+
+    @classmethod
+    def load(cls, bundle_dir, digest=None):
+        """bundle 의 cascade.json (없거나 다른 artifact 로 만든 밴드면 None)"""
+        path = os.path.join(bundle_dir, CASCADE_FILENAME)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            band = cls.from_dict(json.load(f))
+        if digest is not None and band.digest != digest:
+            return None
+        return band
+
+    # ─────────────────────────────────────────
+    # 예측
+    # ─────────────────────────────────────────
+    def predict_proba(self, trees, X):
+        """
+        (N, n_features) 모델 입력 → (prob, exited)
+        exited=False 인 row 의 prob 은 TreeEnsemble.predict_proba 와 같은 값 (같은 순서로 leaf 값을 더함)
+        """
+        X = np.asarray(X, dtype=np.float64)
+        k = self.n_trees
+
+        # 1️⃣ 앞쪽 k 개 트리만 평가
+        head = trees.leaf_indices(X, 0, k)
+        partial = trees.leaf_value[head].sum(axis=1)
+
+        # 2️⃣ 밴드 밖이면 조기 종료 (추정 prob 은 threshold 반대쪽으로 넘어가지 않게)
+        low = partial < self.low
+        high = partial > self.high
+        margin = np.where(low, partial + self.low_offset, partial + self.high_offset)
+        prob = 1.0 / (1.0 + np.exp(-trees.sigmoid * margin))
+        below = np.nextafter(self.threshold, 0.0)
+        prob[low] = np.minimum(prob[low], below)
+        prob[high] = np.maximum(prob[high], self.threshold)
+
+        # 3️⃣ 애매한 row 만 나머지 트리까지 (앞쪽 leaf 와 이어 붙여서 전체 합)
+        rest = np.flatnonzero(~(low | high))
+        if rest.size:
+            tail = trees.leaf_indices(X[rest], k)
+            raw = trees.leaf_value[np.concatenate([head[rest], tail], axis=1)].sum(axis=1)
+            prob[rest] = 1.0 / (1.0 + np.exp(-trees.sigmoid * raw))
+        return prob, low | high
+
+
+def calibrate_band(trees, X, threshold, candidates, margin=1.0, digest=None):
+    """
+    holdout 모델 입력 X 로 cascade 밴드 보정.
+
+    후보 k 마다
+      low  = 전체 앙상블이 불량(1) 로 본 wafer 들의 부분 합 최소값 - margin
+      high = 정상(0) 으로 본 wafer 들의 부분 합 최대값 + margin
+    (margin=0 이어도 X 안에서는 조기 종료 라벨이 전체 앙상블과 항상 같다)
+    그중 평가하는 트리 수 기대값 (k + 애매한 비율 × 나머지) 이 가장 작은 k 를 고른다.
+
+    반환: (CascadeBand, [{"n_trees", "exit_rate", "tree_cost"}, ...])
+    """
+    X = np.asarray(X, dtype=np.float64)
+    leaves = trees.leaf_indices(X)
+    values = trees.leaf_value[leaves]
+    full = values.sum(axis=1)
+    pred = 1.0 / (1.0 + np.exp(-trees.sigmoid * full)) >= threshold
+    if pred.all() or not pred.any():
+        raise ValueError("[cascade] holdout 에 두 라벨이 모두 있어야 밴드를 잡을 수 있습니다")
+
+    best, report = None, []
+    for k in sorted(set(int(k) for k in candidates)):
+        if not 0 < k < trees.n_trees:
+            continue
+        partial = values[:, :k].sum(axis=1)
+        low = partial[pred].min()
+        high = partial[~pred].max()
+        if low > high:
+            # 부분 합만으로 완전히 갈리는 경우: 가운데 한 점으로
+            low = high = (low + high) / 2.0
+        low, high = low - margin, high + margin
+
+        rest = full - partial
+        exit_low, exit_high = partial < low, partial > high
+        exit_rate = float((exit_low | exit_high).mean())
+        cost = (k + (1.0 - exit_rate) * (trees.n_trees - k)) / trees.n_trees
+        report.append({"n_trees": k, "exit_rate": exit_rate, "tree_cost": cost})
+
+        if best is None or cost < best[0]:
+            band = CascadeBand(
+                n_trees=k, low=low, high=high,
+                low_offset=rest[exit_low].mean() if exit_low.any() else 0.0,
+                high_offset=rest[exit_high].mean() if exit_high.any() else 0.0,
+                threshold=threshold, digest=digest,
+            )
+            best = (cost, band)
+    if best is None:
+        raise ValueError(f"[cascade] 유효한 k 후보가 없습니다 (트리 {trees.n_trees} 개)")
+    return best[1], report
@@ -0,0 +1,85 @@
+# backend/services/compact.py
+import base64
+import binascii
+
+import numpy as np
+
+# compact 입력 layout
+# - "core": 모델 core 센서 40개 (GET /api/predict/schema 의 core_features 순서)
+# - "full": raw 센서 590개 (sensor_001 ~ sensor_590 순서)
+N_FULL_SENSORS = 590
+FULL_SENSORS = [f"sensor_{i:03d}" for i in range(1, N_FULL_SENSORS + 1)]
+LAYOUTS = ("core", "full")
+
+
+class CompactInputError(ValueError):
+    """compact 입력 형식 오류 (라우터에서 422 로 응답)"""
+
+
+class SensorVector:
+    """compact 입력 한 건: layout 순서의 float64 센서 벡터 (NaN = 결측)"""
+
+    __slots__ = ("values", "layout")
+
+    def __init__(self, values, layout):
+        self.values = values
+        self.layout = layout
+
+
+def _expected_len(layout, n_core):
+    if layout not in LAYOUTS:
+        raise CompactInputError(f"layout 은 {LAYOUTS} 중 하나여야 합니다: {layout!r}")
+    return n_core if layout == "core" else N_FULL_SENSORS
+
+
+def check_length(vec, n_core):
+    """core layout 길이 확인 (decode 때 n_core=None 으로 미뤄 둔 검사, 엔진이 정해진 뒤에)"""
+    expected = _expected_len(vec.layout, n_core)
+    if vec.values.shape != (expected,):
+        raise CompactInputError(
+            f"센서 값이 {expected}개여야 합니다 (layout={vec.layout}): {vec.values.shape[0]}개"
+        )
+
+
+def decode_values(values, layout, n_core=None):
+    """
+    [float | null, ...] → SensorVector (null 은 NaN)
+    n_core=None 이면 core layout 길이는 엔진에서 (InferenceEngine.select) 확인한다.
+    """
+    arr = np.array(values, dtype=np.float64)
+    expected = _expected_len(layout, n_core)
+    if arr.ndim != 1:
+        raise CompactInputError(f"values 는 1차원 배열이어야 합니다: {arr.shape}")
+    if expected is not None and arr.shape != (expected,):
+        raise CompactInputError(f"values 길이가 {expected} 이어야 합니다 (layout={layout}): {arr.shape}")
+    return SensorVector(arr, layout)
+
+
+def decode_b64(data, layout, n_core=None):
+    """
+    base64 little-endian float32 버퍼 → SensorVector (NaN 그대로 결측)
+    n_core=None 이면 core layout 길이는 엔진에서 (InferenceEngine.select) 확인한다.
+    """
+    try:
+        raw = base64.b64decode(data, validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise CompactInputError(f"values_b64 가 올바른 base64 가 아닙니다: {e}")
+    expected = _expected_len(layout, n_core)
+    if len(raw) % 4:
+        raise CompactInputError(f"values_b64 는 float32 버퍼 (4 bytes 단위) 여야 합니다: {len(raw)} bytes")
+    if expected is not None and len(raw) != expected * 4:
+        raise CompactInputError(
+            f"values_b64 는 float32 {expected}개 ({expected * 4} bytes) 여야 합니다 "
+            f"(layout={layout}): {len(raw)} bytes"
+        )
+    return SensorVector(np.frombuffer(raw, dtype="<f4").astype(np.float64), layout)
+
+
+def encode_b64(values):
+    """클라이언트용: float 배열 → base64 little-endian float32 문자열"""
+    return base64.b64encode(np.asarray(values, dtype="<f4").tobytes()).decode("ascii")
+
+
+def core_index(core_features):
+    """full layout(sensor_001 ~ sensor_590) 에서 core 센서의 열 번호"""
+    return np.array([int(name.rsplit("_", 1)[1]) - 1 for name in core_features], dtype=np.intp)
@@ -0,0 +1,412 @@
+# backend/services/engine.py
+import hashlib
+import json
+import threading
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+from backend.services.artifacts import (
+    ARTIFACT_FILES,
+    MODELS_DIR,
+    load_core_features,
+    load_final_features,
+    load_sensor_stats,
+    load_threshold,
+)
+from backend.services.cascade import CascadeBand
+from backend.services.compact import SensorVector, check_length, core_index
+from backend.services.feature_engine import FeatureEngine, compile_sensor_stats, impute_and_clip
+from backend.services.scaler_fold import fill_nan, fold_model_text
+from backend.services.shap_utils import build_sensor_matrix, top_sensor_indices
+from backend.services.tree_eval import TREE_ARRAYS, TreeEnsemble
+
+# <models_dir>/bundle/ : pickle 없이 바로 읽는 배포용 artifact 묶음
+#   manifest.json  : feature 리스트, threshold, 원본 artifact digest
+#   *.npy          : 통계 / 스케일러 / 센서 행렬 (np.load(mmap_mode="r") 로 worker 간 page cache 공유)
+#   trees_*.npy    : TreeEnsemble 평가기용 트리 배열 (manifest 의 "trees" 에 n_features / sigmoid)
+#   model.txt      : LightGBM text 모델 (기여도 계산이 필요할 때만 로드)
+#   manifest 의 "scaler_folded" 가 true 면 model.txt / 트리 배열의 threshold 에 StandardScaler 가
+#   접혀 있어서 파생변수 행렬을 스케일링 없이 바로 넣는다 (NaN 만 scaler mean 으로)
+#   cascade.json   : (선택) 조기 종료 추론 밴드 (scripts/calibrate_cascade.py 가 holdout 으로 보정)
+BUNDLE_DIRNAME = "bundle"
+BUNDLE_FORMAT = 1
+BUNDLE_ARRAYS = ("stats_mean", "stats_std", "stats_median",
+                 "scaler_mean", "scaler_scale", "sensor_matrix")
+
+
+def artifact_digest(models_dir=MODELS_DIR):
+    """artifact 파일 내용 기준 sha1. 경로가 달라도 내용이 같으면 같은 값."""
+    h = hashlib.sha1()
+    for name in ARTIFACT_FILES:
+        h.update(name.encode())
+        with open(Path(models_dir) / name, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+class InferenceEngine:
+    """
+    raw 센서 → Top40 선택 → 전처리 → 파생변수 → 스케일링 → 예측(+기여도) 을
+    한 객체에 담은 추론 엔진. backend/ 와 src/monitoring_api/ 가 같이 사용한다.
+
+    from_bundle (기본) 또는 from_pickles 로 만든다. 두 경로의 예측 결과는 같다.
+    """
+
+    def __init__(self, core_features, final_features, threshold, stats_tables,
+                 scaler_mean, scaler_scale, booster=None, sensor_matrix=None,
+                 digest=None, source_dir=None, model_file=None, tree_ensemble=None,
+                 scaler_folded=False, cascade=None):
+        self.core_features = list(core_features)
+        self.final_features = list(final_features)
+        self.threshold = float(threshold)
+        # Top40 순서로 정렬한 mean / std(0 → inf) / median
+        self.mean, self.std, self.median = stats_tables
+        # StandardScaler.transform 과 같은 (x - mean_) / scale_
+        self.scaler_mean = scaler_mean
+        self.scaler_scale = scaler_scale
+        # True 면 모델(booster / tree_ensemble)이 raw 파생변수를 바로 받는다 (export_bundle 의 fold)
+        self.scaler_folded = bool(scaler_folded)
+        # booster 가 없으면 model_file (LightGBM text) 에서 처음 쓸 때 로드
+        self._booster = booster
+        self.model_file = model_file
+        self._tree_ensemble = tree_ensemble
+        # predict_prob(cascade=True) 용 조기 종료 밴드 (없으면 항상 전체 앙상블)
+        self.cascade = cascade
+        self.digest = digest
+        # 이 엔진을 로드한 artifact 디렉토리 (get_engine(source_dir) 이 같은 digest 의 엔진을 준다)
+        self.source_dir = Path(source_dir) if source_dir is not None else None
+
+        self.feature_engine = FeatureEngine(self.core_features, self.final_features)
+        # 파생변수 기여도 → Top40 원본 센서 기여도 합산용 (329, 40) 행렬
+        if sensor_matrix is None:
+            sensor_matrix = build_sensor_matrix(self.final_features, self.core_features)
+        self.sensor_matrix = sensor_matrix
+        # compact "full" 입력(590개)에서 core 센서를 꺼낼 열 번호
+        self.core_index = core_index(self.core_features)
+
+        self._pickled = {}
+
+    # ─────────────────────────────────────────
+    # 생성
+    # ─────────────────────────────────────────
+    @classmethod
+    def from_pickles(cls, models_dir=MODELS_DIR, digest=None):
+        """joblib pickle (stageI_final_*.pkl) 에서 생성. sklearn / lightgbm 이 import 된다."""
+        from joblib import load
+
+        models_dir = Path(models_dir)
+        core = load_core_features(models_dir)
+        scaler = load(models_dir / "stageI_final_scaler.pkl")
+        model = load(models_dir / "stageI_final_lgbm_model.pkl")
+
+        engine = cls(
+            core_features=core,
+            final_features=load_final_features(models_dir),
+            threshold=load_threshold(models_dir),
+            stats_tables=compile_sensor_stats(core, load_sensor_stats(models_dir)),
+            scaler_mean=_scaler_mean(scaler),
+            scaler_scale=_scaler_scale(scaler),
+            booster=model.booster_,
+            digest=digest or artifact_digest(models_dir),
+            source_dir=models_dir,
+        )
+        engine._pickled = {"scaler": scaler, "model": model}
+        return engine
+
+    @classmethod
+    def from_bundle(cls, bundle_dir):
+        """
+        export_bundle 로 만든 디렉토리에서 생성. 배열은 mmap, 모델은 LightGBM text.
+        확률만 쓰는 경로(predict_prob)는 트리 배열로 평가하므로 lightgbm 을 import 하지 않는다.
+        """
+        bundle_dir = Path(bundle_dir)
+        with open(bundle_dir / "manifest.json", "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"[engine] 지원하지 않는 bundle format: {manifest.get('format')}")
+
+        arrays = {
+            name: np.load(bundle_dir / f"{name}.npy", mmap_mode="r")
+            for name in BUNDLE_ARRAYS
+        }
+        trees = None
+        if "trees" in manifest:
+            trees = TreeEnsemble.from_arrays(
+                {
+                    name: np.load(bundle_dir / f"trees_{name}.npy", mmap_mode="r")
+                    for name in TREE_ARRAYS if (bundle_dir / f"trees_{name}.npy").exists()
+                },
+                **manifest["trees"],
+            )
+        return cls(
+            core_features=manifest["core_features"],
+            final_features=manifest["final_features"],
+            threshold=manifest["threshold"],
+            stats_tables=(arrays["stats_mean"], arrays["stats_std"], arrays["stats_median"]),
+            scaler_mean=arrays["scaler_mean"],
+            scaler_scale=arrays["scaler_scale"],
+            sensor_matrix=arrays["sensor_matrix"],
+            digest=manifest["source_digest"],
+            source_dir=bundle_dir.parent,
+            model_file=bundle_dir / "model.txt",
+            tree_ensemble=trees,
+            scaler_folded=manifest.get("scaler_folded", False),
+            cascade=CascadeBand.load(bundle_dir, digest=manifest["source_digest"]),
+        )
+
+    # ─────────────────────────────────────────
+    # 원본 sklearn 객체 / 통계 dict (필요할 때만 pickle 로드)
+    # ─────────────────────────────────────────
+    def _load_pickled(self, name, filename):
+        if name not in self._pickled:
+            from joblib import load
+            self._pickled[name] = load(self.source_dir / filename)
+        return self._pickled[name]
+
+    @property
+    def booster(self):
+        """LightGBM Booster (pred_contrib 용). bundle 에서 만든 엔진은 처음 쓸 때 로드."""
+        if self._booster is None:
+            import lightgbm as lgb
+            self._booster = lgb.Booster(model_file=str(self.model_file))
+        return self._booster
+
+    @property
+    def tree_ensemble(self):
+        """NumPy 트리 평가기 (bundle 에 배열이 없으면 booster 에서 한 번 변환)"""
+        if self._tree_ensemble is None:
+            nan_value = self.scaler_mean if self.scaler_folded else None
+            self._tree_ensemble = TreeEnsemble.from_booster(self.booster, nan_value=nan_value)
+        return self._tree_ensemble
+
+    @property
+    def scaler(self):
+        return self._load_pickled("scaler", "stageI_final_scaler.pkl")
+
+    @property
+    def model(self):
+        return self._load_pickled("model", "stageI_final_lgbm_model.pkl")
+
+    @property
+    def sensor_stats(self):
+        return load_sensor_stats(self.source_dir)
+
+    # ─────────────────────────────────────────
+    # 추론
+    # ─────────────────────────────────────────
+    def select(self, raw_dicts):
+        """
+        N개 입력 → core 센서 순서의 (N, 40) float 행렬 (없는 값/None 은 NaN)
+        입력은 raw dict 또는 compact SensorVector (core / full layout) 를 섞어서 받을 수 있다.
+        SensorVector 길이가 layout 과 맞지 않으면 CompactInputError.
+        """
+        if all(type(raw) is SensorVector for raw in raw_dicts):
+            X40 = np.empty((len(raw_dicts), len(self.core_features)), dtype=float)
+            for i, vec in enumerate(raw_dicts):
+                X40[i] = self._row(vec)
+            return X40
+        return np.array(
+            [self._row(raw) for raw in raw_dicts], dtype=float,
+        ).reshape(len(raw_dicts), len(self.core_features))
+
+    def _row(self, raw):
+        if type(raw) is SensorVector:
+            check_length(raw, len(self.core_features))
+            return raw.values if raw.layout == "core" else raw.values[self.core_index]
+        return [raw.get(k, np.nan) for k in self.core_features]
+
+    def preprocess(self, X40):
+        """NaN → mean, |z| > 3 → median. 반환: (행렬, mean 대치 개수, median 대치 개수)"""
+        return impute_and_clip(X40, self.mean, self.std, self.median)
+
+    def features(self, X40, flag_quantiles=None, preprocessed=False):
+        """
+        (N, 40) raw core 행렬 → 전처리 + 파생변수 (N, 329) 행렬
+        flag_quantiles: IQR / P95 flag 용 (3, 40) 분위수 (None 이면 row 단위 flag)
+        preprocessed: True 면 X40 이 이미 preprocess 결과 (rolling 분위수 갱신에 같은 행렬을 쓸 때)
+        """
+        X_clean = X40 if preprocessed else self.preprocess(X40)[0]
+        return self.feature_engine.transform(X_clean, flag_quantiles=flag_quantiles)
+
+    def scale(self, X_final):
+        """StandardScaler.transform 과 같은 연산 (새로 만든 X_final 을 제자리에서 변환)"""
+        X_final -= self.scaler_mean
+        X_final /= self.scaler_scale
+        return X_final
+
+    def model_input(self, X40, flag_quantiles=None, preprocessed=False):
+        """
+        (N, 40) raw core 행렬 → 모델에 넣는 (N, 329) 행렬
+        scaler 가 모델에 접혀 있으면 스케일링 대신 NaN → scaler mean 만 (scaled 공간의 NaN → 0.0 과 같은 split)
+        """
+        # 1️⃣ 전처리 + 파생변수 → 모델 입력 순서의 (N, 329)
+        X_final = self.features(X40, flag_quantiles, preprocessed)
+
+        # 2️⃣ 스케일링
+        if self.scaler_folded:
+            return fill_nan(X_final, self.scaler_mean)
+        return self.scale(X_final)
+
+    def predict_matrix(self, X40, flag_quantiles=None, preprocessed=False):
+        """
+        (N, 40) raw core 행렬 → (prob, pred, contrib)
+        contrib 는 LightGBM pred_contrib (마지막 열 bias, row 합 = log-odds)
+        """
+        X_model = self.model_input(X40, flag_quantiles, preprocessed)
+
+        # 3️⃣ 예측 + row 별 기여도 (LightGBM pred_contrib, 한 번의 호출)
+        contrib = self.booster.predict(X_model, pred_contrib=True)
+        prob = 1.0 / (1.0 + np.exp(-contrib.sum(axis=1)))
+        pred = (prob >= self.threshold).astype(int)
+        return prob, pred, contrib
+
+    def predict_prob(self, X40, flag_quantiles=None, cascade=False, preprocessed=False):
+        """
+        (N, 40) raw core 행렬 → (prob, pred). 기여도(top_sensors)가 필요 없을 때.
+        LightGBM 대신 TreeEnsemble (NumPy) 로 평가한다 (predict_matrix 와 prob 차이 ~1e-15).
+        cascade=True 이고 밴드가 있으면 threshold 에서 먼 wafer 는 앞쪽 트리만으로 확정
+        (pred 는 보정한 holdout 에서 전체 앙상블과 같고, 조기 종료한 row 의 prob 은 추정값)
+        밴드는 row 단위 flag (flag_quantiles=None) 모델 입력으로 보정했으므로,
+        rolling 분위수 flag 를 쓰면 보장이 없어서 항상 전체 앙상블로 평가한다.
+        """
+        X_model = self.model_input(X40, flag_quantiles, preprocessed)
+        if cascade and self.cascade is not None and flag_quantiles is None:
+            prob, _ = self.cascade.predict_proba(self.tree_ensemble, X_model)
+        else:
+            prob = self.tree_ensemble.predict_proba(X_model)
+        pred = (prob >= self.threshold).astype(int)
+        return prob, pred
+
+    def predict_arrays(self, X40, top_k=3, flag_quantiles=None, preprocessed=False):
+        """(N, 40) raw core 행렬 → (prob, pred, top_sensor 열 번호 (N, top_k))"""
+        prob, pred, contrib = self.predict_matrix(X40, flag_quantiles, preprocessed)
+        return prob, pred, top_sensor_indices(contrib[:, :-1], self.sensor_matrix, top_k)
+
+    def format_results(self, prob, pred, top_idx):
+        """predict_arrays 결과 → [{"prob", "pred", "top_sensors"}, ...]"""
+        names = self.core_features
+        return [
+            {"prob": float(p), "pred": int(y), "top_sensors": [names[j] for j in row]}
+            for p, y, row in zip(prob, pred, top_idx)
+        ]
+
+    def predict_batch(self, raw_dicts):
+        """N개 raw dict → [{"prob", "pred", "top_sensors"}, ...]"""
+        if not raw_dicts:
+            return []
+        return self.format_results(*self.predict_arrays(self.select(raw_dicts)))
+
+
+def _scaler_mean(scaler):
+    n = scaler.n_features_in_
+    return np.asarray(scaler.mean_ if scaler.with_mean else np.zeros(n), dtype=float)
+
+
+def _scaler_scale(scaler):
+    n = scaler.n_features_in_
+    return np.asarray(scaler.scale_ if scaler.with_std else np.ones(n), dtype=float)
+
+
+def export_bundle(models_dir=MODELS_DIR, bundle_dir=None, fold_scaler=True):
+    """
+    models_dir 의 pickle/JSON artifact → <models_dir>/bundle/ (배포 전에 한 번 실행)
+    fold_scaler=True 면 StandardScaler 를 모델 threshold 에 접어서 저장 (추론 때 스케일링 생략)
+    """
+    models_dir = Path(models_dir)
+    bundle_dir = Path(bundle_dir) if bundle_dir is not None else models_dir / BUNDLE_DIRNAME
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    engine = InferenceEngine.from_pickles(models_dir)
+    arrays = {
+        "stats_mean": engine.mean,
+        "stats_std": engine.std,
+        "stats_median": engine.median,
+        "scaler_mean": engine.scaler_mean,
+        "scaler_scale": engine.scaler_scale,
+        "sensor_matrix": engine.sensor_matrix,
+    }
+    for name, arr in arrays.items():
+        np.save(bundle_dir / f"{name}.npy", np.ascontiguousarray(arr, dtype=np.float64))
+    model_str = engine.booster.model_to_string()
+    trees = engine.tree_ensemble
+    if fold_scaler:
+        model_str = fold_model_text(model_str, engine.scaler_mean, engine.scaler_scale)
+        trees = trees.fold_scaler(engine.scaler_mean, engine.scaler_scale)
+    with open(bundle_dir / "model.txt", "w", encoding="utf-8") as f:
+        f.write(model_str)
+    for name, arr in trees.to_arrays().items():
+        np.save(bundle_dir / f"trees_{name}.npy", arr)
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "source_digest": engine.digest,
+        "threshold": engine.threshold,
+        "core_features": engine.core_features,
+        "final_features": engine.final_features,
+        "trees": {"n_features": trees.n_features, "sigmoid": trees.sigmoid},
+        "scaler_folded": fold_scaler,
+    }
+    with open(bundle_dir / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    return bundle_dir
+
+
+def _bundle_digest(bundle_dir):
+    manifest_path = Path(bundle_dir) / "manifest.json"
+    if not manifest_path.exists():
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f).get("source_digest")
+
+
+_ENGINES = {}           # digest → engine
+_ENGINES_BY_DIR = {}    # (models_dir, bundle_dir) → engine (같은 경로는 digest 재계산 없이)
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_engine(models_dir=MODELS_DIR, bundle_dir=None):
+    """
+    models_dir 의 추론 엔진. 처음 호출될 때 로드하고 이후에는 캐시를 돌려준다.
+
+    - bundle_dir (기본 <models_dir>/bundle/) 이 있고 원본 artifact 와 digest 가 같으면 bundle 에서 로드
+      (없거나 오래된 bundle 이면 경고 후 pickle 에서 로드)
+      models/ 처럼 backend/models 와 같은 artifact 를 둔 디렉토리는 bundle 을 따로 만들지 않고
+      backend/models/bundle 을 bundle_dir 로 넘겨서 같이 쓴다 (digest 가 다르면 pickle 로 로드).
+    - artifact 내용(digest)별로 하나만 만든다. backend/models 와 models/ 처럼
+      같은 파일이면 두 API 가 같은 엔진을 쓴다.
+    """
+    bundle_dir = Path(bundle_dir) if bundle_dir is not None else Path(models_dir) / BUNDLE_DIRNAME
+    key = (str(Path(models_dir).resolve()), str(bundle_dir.resolve()))
+    engine = _ENGINES_BY_DIR.get(key)
+    if engine is not None:
+        return engine
+
+    with _ENGINES_LOCK:
+        if key in _ENGINES_BY_DIR:
+            return _ENGINES_BY_DIR[key]
+
+        try:
+            digest = artifact_digest(models_dir)
+        except FileNotFoundError:
+            # pickle 없이 bundle 만 배포한 경우
+            digest = _bundle_digest(bundle_dir)
+            if digest is None:
+                raise
+        engine = _ENGINES.get(digest)
+        if engine is None:
+            bundle_digest = _bundle_digest(bundle_dir)
+            if bundle_digest == digest:
+                engine = InferenceEngine.from_bundle(bundle_dir)
+            else:
+                if bundle_digest is not None:
+                    warnings.warn(
+                        f"[engine] {bundle_dir} 가 현재 artifact 와 다릅니다 "
+                        "(scripts/build_artifact_bundle.py 로 다시 생성). pickle 에서 로드합니다."
+                    )
+                engine = InferenceEngine.from_pickles(models_dir, digest=digest)
+            _ENGINES[digest] = engine
+        _ENGINES_BY_DIR[key] = engine
+        return engine
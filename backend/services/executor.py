@@ -0,0 +1,161 @@
+# backend/services/executor.py
+import multiprocessing as mp
+import queue
+import threading
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from backend import config
+
+TOP_K = 3
+
+# ─────────────────────────────────────────
+# worker 프로세스 쪽
+# ─────────────────────────────────────────
+_WORKER_SHM = {}   # shared memory 이름 → 붙여 둔 SharedMemory (worker 마다 한 번만 attach)
+
+
+def _attach(name):
+    shm = _WORKER_SHM.get(name)
+    if shm is None:
+        try:
+            # 만든 쪽(부모)이 unlink 하므로 worker 의 resource tracker 에는 등록하지 않음
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13
+            shm = shared_memory.SharedMemory(name=name)
+        _WORKER_SHM[name] = shm
+    return shm
+
+
+def _worker_init(models_dir):
+    warnings.filterwarnings("ignore", category=UserWarning)
+    from backend.services.engine import get_engine
+
+    get_engine(models_dir)  # artifact 는 worker 마다 시작할 때 한 번만 로드
+
+
+def _worker_predict(models_dir, in_name, out_name, n_rows, n_core, top_k, flag_quantiles=None,
+                    preprocessed=False):
+    """in 버퍼의 (n_rows, n_core) → out 버퍼의 (n_rows, 2 + top_k) [prob, pred, top 열 번호...]"""
+    from backend.services.engine import get_engine
+
+    engine = get_engine(models_dir)
+    X40 = np.ndarray((n_rows, n_core), dtype=np.float64, buffer=_attach(in_name).buf)
+    out = np.ndarray((n_rows, 2 + top_k), dtype=np.float64, buffer=_attach(out_name).buf)
+
+    prob, pred, top_idx = engine.predict_arrays(X40, top_k, flag_quantiles, preprocessed)
+    out[:, 0] = prob
+    out[:, 1] = pred
+    out[:, 2:] = top_idx
+    return n_rows
+
+
+# ─────────────────────────────────────────
+# 부모 프로세스 쪽
+# ─────────────────────────────────────────
+class _Slot:
+    """worker 와 주고받는 입력/출력 shared memory 한 쌍"""
+
+    def __init__(self, max_rows, n_core, top_k):
+        self.max_rows = max_rows
+        self.inp = shared_memory.SharedMemory(create=True, size=max_rows * n_core * 8)
+        self.out = shared_memory.SharedMemory(create=True, size=max_rows * (2 + top_k) * 8)
+
+    def close(self):
+        for shm in (self.inp, self.out):
+            shm.close()
+            shm.unlink()
+
+
+class ProcessInferenceExecutor:
+    """
+    프로세스 풀 추론기. 전처리 ~ 예측 ~ top_sensors 를 worker 프로세스에서 실행해서
+    요청 스레드끼리 GIL 을 다투지 않게 한다.
+
+    - worker 는 시작할 때 artifact 를 한 번 로드 (이후 models_dir 별 엔진 캐시)
+    - 입력 (N, 40) / 출력 (N, 2 + top_k) 행렬은 pickle 대신 shared memory 슬롯으로 전달,
+      worker 에게는 슬롯 이름과 row 수만 보낸다.
+    - 큰 배치는 max_rows 단위로 나눠서 여러 worker 에 동시에 보낸다.
+    """
+
+    def __init__(self, workers, models_dir, n_core, max_rows=None, top_k=TOP_K, start_method=None):
+        self.workers = workers
+        self.n_core = n_core
+        self.top_k = top_k
+        self.max_rows = max_rows or config.INFERENCE_SHM_ROWS
+
+        ctx = mp.get_context(start_method or config.INFERENCE_MP_START)
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx,
+            initializer=_worker_init, initargs=(str(models_dir),),
+        )
+        # worker 당 2칸: 한 칸을 계산하는 동안 다른 칸에 다음 입력을 복사
+        self._slots = [_Slot(self.max_rows, n_core, top_k) for _ in range(workers * 2)]
+        self._free = queue.Queue()
+        for slot in self._slots:
+            self._free.put(slot)
+        self._dispatch = ThreadPoolExecutor(max_workers=len(self._slots),
+                                            thread_name_prefix="infer-dispatch")
+
+    def warmup(self):
+        """모든 worker 를 띄워서 artifact 로드까지 끝내 둔다."""
+        list(self._pool.map(int, range(self.workers * 2)))
+
+    def _run_chunk(self, models_dir, X40, flag_quantiles=None, preprocessed=False):
+        n = len(X40)
+        slot = self._free.get()
+        try:
+            np.ndarray((n, self.n_core), dtype=np.float64, buffer=slot.inp.buf)[:] = X40
+            self._pool.submit(
+                _worker_predict, str(models_dir), slot.inp.name, slot.out.name,
+                n, self.n_core, self.top_k, flag_quantiles, preprocessed,
+            ).result()
+            return np.ndarray((n, 2 + self.top_k), dtype=np.float64, buffer=slot.out.buf).copy()
+        finally:
+            self._free.put(slot)
+
+    def predict_arrays(self, X40, models_dir, flag_quantiles=None, preprocessed=False):
+        """(N, 40) → (prob, pred, top_idx). InferenceEngine.predict_arrays 와 같은 결과."""
+        X40 = np.asarray(X40, dtype=np.float64)
+        chunks = [X40[i:i + self.max_rows] for i in range(0, len(X40), self.max_rows)]
+        if len(chunks) == 1:
+            outs = [self._run_chunk(models_dir, chunks[0], flag_quantiles, preprocessed)]
+        else:
+            outs = list(self._dispatch.map(
+                lambda c: self._run_chunk(models_dir, c, flag_quantiles, preprocessed), chunks,
+            ))
+        out = np.vstack(outs)
+        return out[:, 0], out[:, 1].astype(int), out[:, 2:].astype(np.intp)
+
+    def shutdown(self):
+        self._dispatch.shutdown(wait=True)
+        self._pool.shutdown(wait=True)
+        for slot in self._slots:
+            slot.close()
+
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_inference_executor(models_dir, n_core):
+    """INFERENCE_WORKERS > 0 이면 프로세스 풀 (처음 호출될 때 생성), 아니면 None"""
+    global _EXECUTOR
+    if config.INFERENCE_WORKERS <= 0:
+        return None
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ProcessInferenceExecutor(config.INFERENCE_WORKERS, models_dir, n_core)
+    return _EXECUTOR
+
+
+def shutdown_inference_executor():
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown()
+            _EXECUTOR = None
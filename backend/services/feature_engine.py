@@ -0,0 +1,148 @@
+# backend/services/feature_engine.py
+import re
+import numpy as np
+
+# create_features 의 파생변수 이름 규칙
+_RAW = re.compile(r"^(sensor_\d+)$")
+_UNARY = re.compile(r"^(sensor_\d+)_(abs|sq|log)$")
+_PAIR = re.compile(r"^(sensor_\d+)_(minus|ratio)_(sensor_\d+)$")
+_FLAG = re.compile(r"^(sensor_\d+)_(iqr|p95)_flag$")
+
+RATIO_EPS = 1e-5
+
+
+def compile_sensor_stats(columns, stats):
+    """
+    센서 통계 dict 를 columns 순서에 맞춘 mean / std / median 배열로 변환.
+    std 가 0 이면 inf 로 바꿔서 z-score 가 0 이 되게 한다 (= 이상치 처리 생략).
+    """
+    mean = np.array([stats[c]["mean"] for c in columns], dtype=float)
+    std = np.array([stats[c]["std"] for c in columns], dtype=float)
+    median = np.array([stats[c]["median"] for c in columns], dtype=float)
+    std = np.where(std > 0, std, np.inf)
+    return mean, std, median
+
+
+def impute_and_clip(X, mean, std, median, z_threshold=3.0):
+    """
+    (N, K) 행렬에 NaN → mean, |z| > z_threshold → median 을 한 번에 적용.
+    반환: (처리된 행렬, mean 대치 개수, median 대치 개수)
+    """
+    X = np.array(X, dtype=float)  # 입력은 건드리지 않도록 한 번만 복사
+
+    nan_mask = np.isnan(X)
+    np.copyto(X, mean, where=nan_mask)
+
+    outlier_mask = np.abs((X - mean) / std) > z_threshold
+    np.copyto(X, median, where=outlier_mask)
+
+    return X, int(nan_mask.sum()), int(outlier_mask.sum())
+
+
+class FeatureEngine:
+    """
+    stageI_full_feature_list.json 기준으로 한 번 컴파일해 두는 파생변수 생성기.
+
+    create_features(df, rowwise_flags=True)[FINAL_FEATURES] 와 같은 값을
+    pandas 없이 (N, 40) → (N, 329) NumPy 연산 몇 번으로 만든다.
+
+    * dtype 기본값은 float64: 모델이 float64(StageG parquet)로 학습되어서
+      float32 로 내리면 split 경계 근처 wafer 의 예측 라벨이 바뀔 수 있다.
+    """
+
+    def __init__(self, core_features, final_features, dtype=np.float64):
+        self.core_features = list(core_features)
+        self.final_features = list(final_features)
+        self.dtype = np.dtype(dtype)
+
+        pos = {c: i for i, c in enumerate(self.core_features)}
+        plan = {k: ([], [], []) for k in
+                ("raw", "abs", "sq", "log", "minus", "ratio", "iqr", "p95")}
+
+        for j, name in enumerate(self.final_features):
+            if m := _RAW.match(name):
+                kind, a, b = "raw", m.group(1), None
+            elif m := _UNARY.match(name):
+                kind, a, b = m.group(2), m.group(1), None
+            elif m := _PAIR.match(name):
+                kind, a, b = m.group(2), m.group(1), m.group(3)
+            elif m := _FLAG.match(name):
+                kind, a, b = m.group(2), m.group(1), None
+            else:
+                raise ValueError(f"[feature_engine] 알 수 없는 파생변수 이름: {name}")
+
+            for s in (a, b):
+                if s is not None and s not in pos:
+                    raise ValueError(f"[feature_engine] core 센서가 아닌 컬럼 참조: {name}")
+
+            out_idx, src_a, src_b = plan[kind]
+            out_idx.append(j)
+            src_a.append(pos[a])
+            src_b.append(pos[b] if b is not None else 0)
+
+        # kind → (출력 위치, 입력 a, 입력 b) 인덱스 배열
+        self._plan = {
+            k: tuple(np.asarray(v, dtype=np.intp) for v in idx)
+            for k, idx in plan.items() if idx[0]
+        }
+
+    @property
+    def n_features(self):
+        return len(self.final_features)
+
+    def transform(self, X, out=None, flag_quantiles=None):
+        """
+        X: (N, 40) 전처리가 끝난 core 센서 행렬 (core_features 순서)
+        flag_quantiles: (3, 40) core 센서별 [q25, q75, q95] (quantile_sketch 의 rolling 분위수).
+                        None 이면 row 단위 flag (단건 create_features 와 같은 값)
+        반환: (N, 329) 모델 입력 순서의 행렬 (dtype=self.dtype)
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != len(self.core_features):
+            raise ValueError(
+                f"[feature_engine] 입력 shape 가 잘못되었습니다: {X.shape}, "
+                f"기대값=(N, {len(self.core_features)})"
+            )
+        if out is None:
+            out = np.empty((X.shape[0], self.n_features), dtype=self.dtype)
+
+        p = self._plan
+        if "raw" in p:
+            o, a, _ = p["raw"]
+            out[:, o] = X[:, a]
+        if "abs" in p:
+            o, a, _ = p["abs"]
+            out[:, o] = np.abs(X[:, a])
+        if "sq" in p:
+            o, a, _ = p["sq"]
+            out[:, o] = np.square(X[:, a])
+        if "log" in p:
+            o, a, _ = p["log"]
+            out[:, o] = np.log1p(np.maximum(X[:, a], 0))
+        if "minus" in p:
+            o, a, b = p["minus"]
+            out[:, o] = X[:, a] - X[:, b]
+        if "ratio" in p:
+            o, a, b = p["ratio"]
+            out[:, o] = X[:, a] / (X[:, b] + RATIO_EPS)
+        if flag_quantiles is not None:
+            q25, q75, q95 = np.asarray(flag_quantiles, dtype=np.float64)
+            iqr = q75 - q25
+            lower, upper = q25 - 1.5 * iqr, q75 + 1.5 * iqr
+            if "iqr" in p:
+                o, a, _ = p["iqr"]
+                out[:, o] = (X[:, a] < lower[a]) | (X[:, a] > upper[a])
+            if "p95" in p:
+                o, a, _ = p["p95"]
+                out[:, o] = X[:, a] >= q95[a]
+            return out
+
+        # row 단위 분위수 → iqr_flag 는 항상 0, p95_flag 는 값이 있으면 1
+        if "iqr" in p:
+            o, _, _ = p["iqr"]
+            out[:, o] = 0
+        if "p95" in p:
+            o, a, _ = p["p95"]
+            out[:, o] = ~np.isnan(X[:, a])
+
+        return out
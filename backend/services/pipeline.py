@@ -1,66 +1,90 @@
 # backend/services/pipeline.py
-import pickle
-import json
-import numpy as np
-from pathlib import Path
-
-from backend.services.preprocess import (
-    select_top40,
-    preprocess_top40,
-    create_features,
+from backend import config
+from backend.services.artifacts import MODELS_DIR
+from backend.services.executor import get_inference_executor
+from backend.services.quantile_sketch import FlagSketchStore
+from backend.services.registry import ModelRegistry
+
+# 모델 버전 레지스트리: 기본 버전은 backend/models, 추가 버전은 MODEL_VERSIONS_DIR/<version>/
+# 엔진은 import 시점이 아니라 preload (startup) 또는 첫 예측 때 로드된다.
+MODEL_REGISTRY = ModelRegistry(
+    default_dir=MODELS_DIR,
+    default_version=config.MODEL_DEFAULT_VERSION,
+    versions_dir=config.MODEL_VERSIONS_DIR,
 )
-from backend.services.shap_utils import select_top_sensors
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-MODELS_DIR = BASE_DIR / "models"
+# IQR / P95 flag 용 core 센서별 rolling 분위수 (FLAG_SKETCH=1 일 때만, 꺼져 있으면 row 단위 flag)
+FLAG_SKETCHES = FlagSketchStore(
+    path=config.FLAG_SKETCH_PATH,
+    window=config.FLAG_SKETCH_WINDOW,
+    min_count=config.FLAG_SKETCH_MIN_COUNT,
+    save_every=config.FLAG_SKETCH_SAVE_EVERY,
+    enabled=config.FLAG_SKETCH,
+)
 
-# Load artifacts
-with open(MODELS_DIR / "stageI_final_features.json", "r") as f:
-    TOP40 = json.load(f)["feature_list"]
+# TOP40 / FINAL_FEATURES 등 기존 모듈 상수는 접근할 때 활성 엔진에서 꺼내 준다.
+_ENGINE_ATTRS = {
+    "TOP40": "core_features",
+    "FINAL_FEATURES": "final_features",
+    "THRESHOLD": "threshold",
+    "SENSOR_STATS": "sensor_stats",
+    "SCALER": "scaler",
+    "MODEL": "model",
+    "FEATURE_ENGINE": "feature_engine",
+    "SENSOR_MATRIX": "sensor_matrix",
+}
 
-with open(MODELS_DIR / "stageI_full_feature_list.json", "r") as f:
-    FINAL_FEATURES = json.load(f)["features"]
 
-with open(MODELS_DIR / "stageI_final_threshold.json", "r") as f:
-    THRESHOLD = json.load(f)["threshold_value"]
+def get_pipeline_engine():
+    return MODEL_REGISTRY.active()[1]
 
-with open(MODELS_DIR / "sensors_mean_std_median.json", "r") as f:
-    SENSOR_STATS = json.load(f)
 
-# 계속 에러나서 이거 수정함 
-from joblib import load
-SCALER = load(MODELS_DIR / "stageI_final_scaler.pkl")
-MODEL = load(MODELS_DIR / "stageI_final_lgbm_model.pkl")
+def __getattr__(name):
+    if name == "ENGINE":
+        return get_pipeline_engine()
+    if name in _ENGINE_ATTRS:
+        return getattr(get_pipeline_engine(), _ENGINE_ATTRS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def run_prediction(raw_dict):
     """raw → Top40 → 전처리 → 파생변수 → 스케일링 → 예측 → top_sensors"""
-
-    # 1️⃣ Top40 선택
-    df40 = select_top40(raw_dict)
-
-    # 2️⃣ 전처리
-    df_clean = preprocess_top40(df40)
-
-    # 3️⃣ 파생변수 생성 → 330개
-    df_fe = create_features(df_clean)
-
-    # 3-1) 최종 모델에 사용된 329개 변수만 순서대로 선택
-    df_final = df_fe[FINAL_FEATURES]
-
-    # 4️⃣ 스케일링
-    X_scaled = SCALER.transform(df_final.values)
-
-    # 5️⃣ 모델 예측
-    y_prob = MODEL.predict_proba(X_scaled)[0][1]
-    y_pred = int(y_prob >= THRESHOLD)
-
-    # 6️⃣ 중요 센서 계산
-    fi = MODEL.feature_importances_
-    top_sens = select_top_sensors(fi, df_final.columns)
-
-    return {
-        "prob": float(y_prob),
-        "pred": y_pred,
-        "top_sensors": top_sens,
-    }
\ No newline at end of file
+    return run_prediction_batch([raw_dict])[0]
+
+
+def run_prediction_batch(raw_dicts):
+    """
+    N개 wafer를 한 번에 예측.
+    선택/전처리/파생변수/스케일링/예측(+기여도) 을 (N, 329) 행렬로 한 번씩만 수행한다.
+    각 결과에는 예측한 모델 버전(model_version)이 들어간다.
+    """
+    # 배치 전체를 같은 버전으로 (도중에 활성 버전이 바뀌어도 섞이지 않게 한 번만 잡음)
+    version, engine = MODEL_REGISTRY.active()
+    if not raw_dicts:
+        return []
+
+    X40 = engine.select(raw_dicts)
+
+    # flag 분위수는 이번 배치를 넣기 전 상태 기준 (warm-up 중이면 None → row 단위 flag)
+    # sketch 를 쓰면 전처리를 여기서 한 번만 하고, 예측과 분위수 갱신에 같은 행렬을 쓴다
+    sketch = FLAG_SKETCHES.get(engine.core_features)
+    flag_quantiles = sketch.quantiles() if sketch is not None else None
+    preprocessed = sketch is not None
+    if preprocessed:
+        X40 = engine.preprocess(X40)[0]
+
+    executor = get_inference_executor(engine.source_dir, len(engine.core_features))
+    if executor is not None:
+        # INFERENCE_WORKERS > 0: 전처리 ~ 예측을 worker 프로세스에서 (shared memory 로 전달)
+        # worker 는 엔진을 로드한 artifact 디렉토리(source_dir, digest 가 같음)에서 같은 엔진을 만든다
+        arrays = executor.predict_arrays(X40, engine.source_dir, flag_quantiles, preprocessed)
+    else:
+        arrays = engine.predict_arrays(X40, flag_quantiles=flag_quantiles, preprocessed=preprocessed)
+
+    if sketch is not None:
+        FLAG_SKETCHES.observe(sketch, X40)
+
+    results = engine.format_results(*arrays)
+    for result in results:
+        result["model_version"] = version
+    return results
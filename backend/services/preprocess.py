@@ -1,19 +1,14 @@
 # backend/services/preprocess.py
 import numpy as np
 import pandas as pd
-import json
-from pathlib import Path
-from scipy.stats import zscore
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-MODELS_DIR = BASE_DIR / "models"
+from backend.services.artifacts import MODELS_DIR, load_core_features, load_sensor_stats
+from backend.services.feature_engine import impute_and_clip
+from backend.services.feature_engine import compile_sensor_stats as _compile_sensor_stats
 
-# Load artifacts
-with open(MODELS_DIR / "stageI_final_features.json", "r") as f:
-    TOP40 = json.load(f)["feature_list"]
-
-with open(MODELS_DIR / "sensors_mean_std_median.json", "r") as f:
-    SENSOR_STATS = json.load(f)
+# Load artifacts (engine 과 같은 캐시된 JSON 을 공유)
+TOP40 = load_core_features(MODELS_DIR)
+SENSOR_STATS = load_sensor_stats(MODELS_DIR)
 
 
 def select_top40(raw_dict):
@@ -22,50 +17,86 @@ def select_top40(raw_dict):
     return pd.DataFrame([data])
 
 
+def select_top40_batch(raw_dicts):
+    """N개 wafer의 raw dict → (N, 40) Top40 DataFrame (float)."""
+    rows = [{k: raw.get(k, np.nan) for k in TOP40} for raw in raw_dicts]
+    return pd.DataFrame.from_records(rows, columns=TOP40).astype(float)
+
+
+def compile_sensor_stats(columns, stats=None):
+    """feature_engine.compile_sensor_stats 에 기본 SENSOR_STATS 를 넣어 주는 wrapper."""
+    return _compile_sensor_stats(columns, SENSOR_STATS if stats is None else stats)
+
+
+# Top40 순서로 미리 정렬해 둔 통계 테이블
+TOP40_MEAN, TOP40_STD, TOP40_MEDIAN = compile_sensor_stats(TOP40)
+
+
+def preprocess_top40_array(X):
+    """(N, 40) Top40 행렬 전처리. 반환: (행렬, mean 대치 개수, median 대치 개수)"""
+    return impute_and_clip(X, TOP40_MEAN, TOP40_STD, TOP40_MEDIAN)
+
+
 def preprocess_top40(df: pd.DataFrame):
     """결측치 처리 + 이상치 완화 (mean / median)."""
-    df = df.copy()
-    for col in df.columns:
-        mean_val = SENSOR_STATS[col]["mean"]
-        median_val = SENSOR_STATS[col]["median"]
-        std_val = SENSOR_STATS[col]["std"]
+    if list(df.columns) == TOP40:
+        tables = (TOP40_MEAN, TOP40_STD, TOP40_MEDIAN)
+    else:
+        tables = compile_sensor_stats(df.columns)
 
-        # NaN → mean
-        df[col] = df[col].fillna(mean_val)
+    X, _, _ = impute_and_clip(df.to_numpy(dtype=float), *tables)
+    return pd.DataFrame(X, columns=df.columns, index=df.index)
 
-        # 이상치 → median (Z-score > 3)
-        if std_val > 0:
-            z = abs((df[col] - mean_val) / std_val)
-            df.loc[z > 3, col] = median_val
 
-    return df
+def create_features(df: pd.DataFrame, rowwise_flags: bool = False, flag_quantiles=None):
+    """
+    파생변수 330개 생성 (pandas 기준 구현).
+    예측 경로는 같은 값을 내는 feature_engine.FeatureEngine 을 사용한다.
 
-
-def create_features(df: pd.DataFrame):
-    """파생변수 330개 생성."""
-    df_fe = df.copy()
+    rowwise_flags=True 이면 IQR/P95 flag 의 분위수를 컬럼 전체가 아니라
+    각 row 자기 자신 기준으로 계산한다. (배치 예측이 단건 예측과 같은 값을 내도록)
+    flag_quantiles 를 주면 ((3, len(df.columns)) 의 [q25, q75, q95], rolling sketch 값)
+    분위수를 계산하지 않고 그 값을 쓴다.
+    """
+    # 컬럼을 하나씩 df 에 붙이면 fragmentation 이 생기므로 모아서 한 번에 concat
+    new_cols = {}
 
     # 1) 절대값/제곱/로그
     for col in df.columns:
-        df_fe[f"{col}_abs"] = df[col].abs()
-        df_fe[f"{col}_sq"] = df[col] ** 2
-        df_fe[f"{col}_log"] = np.log1p(np.clip(df[col], a_min=0, a_max=None))
+        new_cols[f"{col}_abs"] = df[col].abs()
+        new_cols[f"{col}_sq"] = df[col] ** 2
+        new_cols[f"{col}_log"] = np.log1p(np.clip(df[col], a_min=0, a_max=None))
 
     # 2) 상위 10개 센서 조합 (차이/비율)
     top10 = TOP40[:10]
     for i in range(len(top10)):
         for j in range(i + 1, len(top10)):
             c1, c2 = top10[i], top10[j]
-            df_fe[f"{c1}_minus_{c2}"] = df[c1] - df[c2]
-            df_fe[f"{c1}_ratio_{c2}"] = df[c1] / (df[c2] + 1e-5)
+            new_cols[f"{c1}_minus_{c2}"] = df[c1] - df[c2]
+            new_cols[f"{c1}_ratio_{c2}"] = df[c1] / (df[c2] + 1e-5)
 
     # 3) IQR flag / P95 flag
-    for col in df.columns:
+    for k, col in enumerate(df.columns):
+        if flag_quantiles is not None:
+            Q1, Q3, P95 = (float(flag_quantiles[i][k]) for i in range(3))
+            IQR = Q3 - Q1
+            lower, upper = Q1 - 1.5 * IQR, Q3 + 1.5 * IQR
+            new_cols[f"{col}_iqr_flag"] = ((df[col] < lower) | (df[col] > upper)).astype(int)
+            new_cols[f"{col}_p95_flag"] = (df[col] >= P95).astype(int)
+            continue
+
+        if rowwise_flags:
+            # row 하나짜리 분위수는 값 자기 자신 → IQR=0 이라 iqr_flag 는 항상 0,
+            # p95_flag 는 값이 있으면 1 (단건 create_features 결과와 동일)
+            new_cols[f"{col}_iqr_flag"] = pd.Series(0, index=df.index)
+            new_cols[f"{col}_p95_flag"] = df[col].notna().astype(int)
+            continue
+
         Q1, Q3 = df[col].quantile(0.25), df[col].quantile(0.75)
         IQR = Q3 - Q1
         lower, upper = Q1 - 1.5 * IQR, Q3 + 1.5 * IQR
 
-        df_fe[f"{col}_iqr_flag"] = ((df[col] < lower) | (df[col] > upper)).astype(int)
-        df_fe[f"{col}_p95_flag"] = (df[col] >= df[col].quantile(0.95)).astype(int)
+        new_cols[f"{col}_iqr_flag"] = ((df[col] < lower) | (df[col] > upper)).astype(int)
+        new_cols[f"{col}_p95_flag"] = (df[col] >= df[col].quantile(0.95)).astype(int)
 
-    return df_fe
\ No newline at end of file
+    return pd.concat([df, pd.DataFrame(new_cols, index=df.index)], axis=1)
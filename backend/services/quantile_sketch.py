@@ -0,0 +1,265 @@
+# backend/services/quantile_sketch.py
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 없이 (worker 1 개 운영은 직접 지킨다)
+    fcntl = None
+
+# IQR / P95 flag 에 쓰는 분위수 (FeatureEngine.transform 의 flag_quantiles 행 순서)
+FLAG_PROBS = (0.25, 0.75, 0.95)
+
+
+class P2Quantiles:
+    """
+    P² 분위수 추정기 (Jain & Chlamtac, 1985) K개를 NumPy 로 한 번에 갱신.
+    추정기마다 marker 5개(높이 q, 위치 n)만 들고 있어서 관측 하나당 O(1), 메모리 O(K).
+    K개 추정기는 같은 시점에 관측을 하나씩 받는다 (센서 × 분위수).
+    """
+
+    def __init__(self, probs):
+        p = np.asarray(probs, dtype=np.float64)
+        self.p = p
+        self.count = 0
+        self.q = np.zeros((len(p), 5))
+        self.n = np.tile(np.arange(1.0, 6.0), (len(p), 1))
+        self._np0 = np.stack([np.ones_like(p), 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, np.full_like(p, 5.0)], axis=1)
+        self.dn = np.stack([np.zeros_like(p), p / 2, p, (1 + p) / 2, np.ones_like(p)], axis=1)
+        self.desired = self._np0.copy()
+
+    def update(self, x):
+        """x: (K,) 관측 하나씩"""
+        if self.count < 5:
+            # 처음 5개는 그대로 모았다가 정렬해서 marker 초기값으로
+            self.q[:, self.count] = x
+            self.count += 1
+            if self.count == 5:
+                self.q.sort(axis=1)
+            return
+        self.count += 1
+        q, n = self.q, self.n
+
+        # 1️⃣ 관측이 들어가는 칸 k (0~3), 양 끝 marker 는 min / max
+        np.minimum(q[:, 0], x, out=q[:, 0])
+        np.maximum(q[:, 4], x, out=q[:, 4])
+        k = (x[:, None] >= q[:, 1:4]).sum(axis=1)
+        n += np.arange(5) > k[:, None]
+        self.desired += self.dn
+
+        # 2️⃣ 가운데 marker 3개를 원하는 위치 쪽으로 한 칸씩 (포물선 보간, 안 되면 선형)
+        for i in (1, 2, 3):
+            d = self.desired[:, i] - n[:, i]
+            up = (d >= 1) & (n[:, i + 1] - n[:, i] > 1)
+            down = (d <= -1) & (n[:, i - 1] - n[:, i] < -1)
+            move = up | down
+            if not move.any():
+                continue
+            s = np.where(up, 1.0, -1.0)
+            qi, ni = q[:, i], n[:, i]
+            qa, qb = q[:, i - 1], q[:, i + 1]
+            na, nb = n[:, i - 1], n[:, i + 1]
+            qp = qi + s / (nb - na) * (
+                (ni - na + s) * (qb - qi) / (nb - ni) + (nb - ni - s) * (qi - qa) / (ni - na)
+            )
+            qj = np.where(up, qb, qa)
+            nj = np.where(up, nb, na)
+            ql = qi + s * (qj - qi) / (nj - ni)
+            new = np.where((qa < qp) & (qp < qb), qp, ql)
+            q[:, i] = np.where(move, new, qi)
+            n[:, i] += np.where(move, s, 0.0)
+
+    def estimate(self):
+        """(K,) 현재 분위수 추정값 (관측 5개 미만이면 None)"""
+        return self.q[:, 2].copy() if self.count >= 5 else None
+
+    def state(self):
+        return {"q": self.q, "n": self.n, "count": self.count}
+
+    def load_state(self, state):
+        self.q = np.array(state["q"], dtype=np.float64)
+        self.n = np.array(state["n"], dtype=np.float64)
+        self.count = int(state["count"])
+        # 원하는 위치는 관측 수로 정해진다
+        self.desired = self._np0 + max(self.count - 5, 0) * self.dn
+
+
+class RollingQuantileSketch:
+    """
+    컬럼(core 센서)별 분위수를 최근 window 개 wafer 기준으로 추정하는 sketch.
+
+    P² bank 두 개를 번갈아 쓴다: 현재 bank 가 window 개를 채우면 이전 bank 로 넘기고 새로 시작.
+    추정값은 이전 bank 와 현재 bank 를 현재 bank 의 채운 비율로 섞은 값
+    (= 대략 최근 window 개 기준, 오래된 관측은 최대 2 * window 개 뒤에 완전히 빠진다).
+    관측 수가 min_count 미만이면 quantiles() 는 None (→ row 단위 flag 로 대체).
+    """
+
+    def __init__(self, columns, window=500, min_count=50, probs=FLAG_PROBS):
+        self.columns = list(columns)
+        self.window = int(window)
+        self.min_count = max(int(min_count), 5)
+        self.probs = tuple(float(p) for p in probs)
+        self._p = np.repeat(self.probs, len(self.columns))
+        self._current = P2Quantiles(self._p)
+        self._previous = None
+        self._lock = threading.Lock()
+        self.observed = 0
+
+    def update(self, X):
+        """X: (N, len(columns)) 전처리가 끝난 값. 결측/무한대가 있는 row 는 건너뛴다."""
+        X = np.asarray(X, dtype=np.float64)
+        X = X[np.isfinite(X).all(axis=1)]
+        reps = len(self.probs)
+        with self._lock:
+            for row in X:
+                self._current.update(np.tile(row, reps))
+                if self._current.count >= self.window:
+                    self._previous = self._current
+                    self._current = P2Quantiles(self._p)
+            self.observed += len(X)
+
+    def quantiles(self):
+        """(len(probs), len(columns)) 분위수 추정값, warm-up 중이면 None"""
+        with self._lock:
+            cur = self._current.estimate() if self._current.count >= 5 else None
+            if self._previous is None:
+                if cur is None or self._current.count < self.min_count:
+                    return None
+                est = cur
+            else:
+                prev = self._previous.estimate()
+                if cur is None:
+                    est = prev
+                else:
+                    w = self._current.count / self.window
+                    est = (1 - w) * prev + w * cur
+        return est.reshape(len(self.probs), len(self.columns))
+
+    # ─────────────────────────────────────────
+    # 상태 저장 / 복원
+    # ─────────────────────────────────────────
+    def save(self, path):
+        """npz 로 저장 (임시 파일에 쓰고 교체해서, 도중에 죽어도 이전 파일은 온전)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            arrays = {
+                "columns": np.array(self.columns),
+                "probs": np.array(self.probs),
+                "window": np.array(self.window),
+                "observed": np.array(self.observed),
+            }
+            for prefix, bank in (("cur", self._current), ("prev", self._previous)):
+                if bank is None:
+                    continue
+                for key, value in bank.state().items():
+                    arrays[f"{prefix}_{key}"] = np.asarray(value)
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, columns, window=500, min_count=50, probs=FLAG_PROBS):
+        """
+        저장된 sketch 복원. 파일이 없거나 컬럼 / 분위수 / window 가 다르면
+        (모델 버전 변경 등) 새 sketch 를 반환한다.
+        """
+        sketch = cls(columns, window=window, min_count=min_count, probs=probs)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                saved = {k: data[k] for k in data.files}
+        except (FileNotFoundError, OSError, ValueError):
+            return sketch
+        if (
+            saved["columns"].tolist() != sketch.columns
+            or tuple(saved["probs"].tolist()) != sketch.probs
+            or int(saved["window"]) != sketch.window
+        ):
+            return sketch
+
+        def _bank(prefix):
+            bank = P2Quantiles(sketch._p)
+            bank.load_state({k: saved[f"{prefix}_{k}"] for k in ("q", "n", "count")})
+            return bank
+
+        sketch._current = _bank("cur")
+        if "prev_q" in saved:
+            sketch._previous = _bank("prev")
+        sketch.observed = int(saved["observed"])
+        return sketch
+
+
+class FlagSketchStore:
+    """
+    앱(프로세스)마다 하나: 활성 엔진의 core 센서 기준 sketch 를 만들고 / 복원하고 / 주기적으로 저장.
+    enabled=False 면 get() 이 항상 None (기존 row 단위 flag 그대로).
+
+    P² 상태는 합칠 수 없어서 sketch 파일은 프로세스 하나만 쓴다 (claim).
+    FLAG_SKETCH=1 은 uvicorn worker 1 개로 실행해야 하고, 두 번째 프로세스는 RuntimeError 로 시작하지 않는다.
+    """
+
+    def __init__(self, path, window, min_count, save_every, enabled=True):
+        self.path = Path(path)
+        self.window = window
+        self.min_count = min_count
+        self.save_every = save_every
+        self.enabled = enabled
+        self._sketch = None
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._owner = None   # sketch 파일 잠금 (claim 이후 프로세스가 끝날 때까지 유지)
+
+    def claim(self):
+        """
+        sketch 파일 소유권 확보 (<path>.lock 에 flock). 다른 프로세스가 이미 잡고 있으면 RuntimeError.
+        여러 worker 가 같은 파일에 저장하면 마지막에 종료한 worker 가 나머지 관측치를 덮어쓰기 때문.
+        """
+        if not self.enabled or fcntl is None or self._owner is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        owner = open(f"{self.path}.lock", "w")
+        try:
+            fcntl.flock(owner, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            owner.close()
+            raise RuntimeError(
+                f"[flag_sketch] {self.path} 를 다른 프로세스가 사용 중입니다. "
+                "FLAG_SKETCH=1 은 worker 1 개로 실행하세요 (uvicorn --workers 1)."
+            )
+        self._owner = owner
+
+    def get(self, columns):
+        if not self.enabled:
+            return None
+        columns = list(columns)
+        self.claim()
+        with self._lock:
+            if self._sketch is None or self._sketch.columns != columns:
+                if self._sketch is not None:
+                    self._sketch.save(self.path)
+                self._sketch = RollingQuantileSketch.load(
+                    self.path, columns, window=self.window, min_count=self.min_count,
+                )
+                self._unsaved = 0
+            return self._sketch
+
+    def observe(self, sketch, X_clean):
+        """채점이 끝난 wafer 들로 sketch 갱신, save_every 개마다 파일에 저장"""
+        sketch.update(X_clean)
+        with self._lock:
+            self._unsaved += len(X_clean)
+            if self.save_every <= 0 or self._unsaved < self.save_every:
+                return
+            self._unsaved = 0
+        sketch.save(self.path)
+
+    def save(self):
+        with self._lock:
+            sketch = self._sketch
+            self._unsaved = 0
+        if sketch is not None:
+            sketch.save(self.path)
@@ -0,0 +1,204 @@
+# backend/services/registry.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from backend.services.engine import get_engine
+
+
+class ModelRegistry:
+    """
+    여러 모델 버전(artifact 디렉토리)을 나란히 들고 있는 레지스트리.
+
+    - default_version 은 default_dir (예: backend/models) 자체
+      (bundle_dir 를 주면 default_version 은 그 bundle 을 읽는다. 예: models/ → backend/models/bundle)
+    - versions_dir/<version>/ 하위 디렉토리가 추가 버전
+    - preload(): 백그라운드 스레드에서 엔진 로드 (요청 경로에서는 로드하지 않음)
+    - activate(): 로드가 끝난 엔진으로 활성 버전을 한 번에 교체.
+      요청은 시작할 때 (version, engine) 을 한 번 잡으므로 교체 중인 요청에는 영향이 없다.
+      로드가 실패하면 이전 엔진(startup 이면 기본 버전)이 계속 활성이다.
+    """
+
+    def __init__(self, default_dir, default_version, versions_dir=None, bundle_dir=None):
+        self.default_dir = Path(default_dir)
+        self.bundle_dir = Path(bundle_dir) if bundle_dir else None
+        self.default_version = default_version
+        self.versions_dir = Path(versions_dir) if versions_dir else None
+
+        self._lock = threading.Lock()
+        self._active = (default_version, None)   # (version, engine) 를 한 번에 교체
+        self._futures = {}                        # version → 로드 Future
+        self._errors = {}                         # version → 마지막 로드 실패 메시지
+        self._target = default_version            # 마지막으로 요청된 활성 버전
+        self._poller = None
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="model-preload")
+
+    # ─────────────────────────────────────────
+    # 버전 목록
+    # ─────────────────────────────────────────
+    def _dirs(self):
+        dirs = {self.default_version: self.default_dir}
+        if self.versions_dir is not None and self.versions_dir.is_dir():
+            for path in sorted(self.versions_dir.iterdir()):
+                if path.is_dir() and not path.name.startswith((".", "_")):
+                    dirs.setdefault(path.name, path)
+        return dirs
+
+    def path(self, version):
+        dirs = self._dirs()
+        if version not in dirs:
+            raise KeyError(version)
+        return dirs[version]
+
+    def status(self, version):
+        future = self._futures.get(version)
+        if future is None:
+            return "failed" if version in self._errors else "available"
+        if not future.done():
+            return "loading"
+        return "failed" if future.exception() is not None else "ready"
+
+    def versions(self):
+        active = self.active_version
+        out = []
+        for version, path in self._dirs().items():
+            future = self._futures.get(version)
+            ready = future is not None and future.done() and future.exception() is None
+            out.append({
+                "version": version,
+                "path": str(path),
+                "status": self.status(version),
+                "active": version == active,
+                "digest": future.result().digest if ready else None,
+                "error": self._errors.get(version),
+            })
+        return out
+
+    # ─────────────────────────────────────────
+    # 로드 / 교체
+    # ─────────────────────────────────────────
+    def preload(self, version):
+        """백그라운드 로드 시작 (이미 로드 중/완료면 같은 Future). 반환: Future[engine]"""
+        path = self.path(version)
+        with self._lock:
+            future = self._futures.get(version)
+            if future is not None and not (future.done() and future.exception() is not None):
+                return future
+            self._errors.pop(version, None)
+            bundle_dir = self.bundle_dir if version == self.default_version else None
+            future = self._futures[version] = self._executor.submit(get_engine, path, bundle_dir)
+        future.add_done_callback(lambda f: self._record_error(version, f))
+        return future
+
+    def _record_error(self, version, future):
+        if future.exception() is not None:
+            self._errors[version] = str(future.exception())
+
+    def activate(self, version, timeout=None):
+        """
+        version 로드가 끝날 때까지 기다린 뒤 활성 버전으로 교체. 반환: 이전 버전
+        로드가 실패하거나 timeout 이면 예외를 그대로 올리고 지금 활성 버전을 유지한다.
+        """
+        self._target = version
+        try:
+            engine = self.preload(version).result(timeout=timeout)
+        except Exception:
+            with self._lock:
+                if self._target == version:
+                    self._target = self._active[0]
+            raise
+        with self._lock:
+            previous = self._active[0]
+            self._active = (version, engine)
+        return previous
+
+    def activate_when_ready(self, version):
+        """
+        로드가 끝나면 교체 (기다리지 않음). 로드하는 동안이나 로드가 실패하면 지금 활성 엔진을 그대로 쓴다.
+        이미 요청되어 로드 중/활성인 버전이거나, 로드에 실패했던 버전이면 아무것도 안 함
+        (poller 가 같은 깨진 버전을 계속 다시 로드하지 않도록. 다시 시도는 activate() / preload()).
+        처음 시작할 때의 기본 버전은 _target 이지만 아직 로드 전이므로 여기서 로드를 시작한다.
+        """
+        if version in self._errors:
+            return
+        loaded = self._active[0] == version and self._active[1] is not None
+        if version == self._target and (version in self._futures or loaded):
+            return
+        with self._lock:
+            self._target = version
+            if self._active[1] is None:
+                # 아직 아무 요청도 처리하지 않았으면 (startup) 첫 요청부터 이 버전으로.
+                # 로드가 실패하면 _fallback 이 기본 버전으로 되돌린다.
+                self._active = (version, None)
+
+        def _switch(future):
+            if future.exception() is not None:
+                self._fallback(version, future.exception())
+                return
+            # 로드하는 동안 다른 버전으로 다시 바뀌었으면 교체하지 않음
+            if self._target == version:
+                with self._lock:
+                    self._active = (version, future.result())
+
+        self.preload(version).add_done_callback(_switch)
+
+    def _fallback(self, version, error):
+        """version 로드 실패: 요청 대상을 지금 활성 버전으로 되돌리고, 엔진 없이 활성이던 버전이면 기본 버전으로"""
+        with self._lock:
+            if self._active == (version, None) and version != self.default_version:
+                print(f"[registry] {version} 로드 실패, 기본 버전 {self.default_version} 사용: {error}")
+                self._active = (self.default_version, None)
+            if self._target == version:
+                self._target = self._active[0]
+
+    @property
+    def active_version(self):
+        return self._active[0]
+
+    def active(self):
+        """
+        (version, engine). 활성 엔진이 아직 없으면 여기서 로드를 기다린다.
+        startup 에 지정된 버전 로드가 실패하면 기본 버전으로 (오류는 versions() 의 error 에 남는다).
+        """
+        version, engine = self._active
+        if engine is None:
+            try:
+                engine = self.preload(version).result()
+            except Exception as e:
+                if version == self.default_version:
+                    raise
+                self._fallback(version, e)
+                return self.active()
+            with self._lock:
+                if self._active[0] == version:
+                    self._active = (version, engine)
+        return version, engine
+
+    # ─────────────────────────────────────────
+    # 다른 worker 와 활성 버전 맞추기
+    # ─────────────────────────────────────────
+    def start_polling(self, read_active_version, interval_sec):
+        """
+        interval_sec 마다 read_active_version() (예: settings 테이블) 을 읽어서
+        바뀌었으면 백그라운드 로드 후 교체. 데몬 스레드, 한 번만 시작.
+        """
+        if interval_sec <= 0 or self._poller is not None:
+            return
+        stop = threading.Event()
+
+        def _loop():
+            while not stop.wait(interval_sec):
+                try:
+                    version = read_active_version()
+                    if version and version in self._dirs():
+                        self.activate_when_ready(version)
+                except Exception as e:
+                    print(f"[registry] 활성 버전 확인 실패: {e}")
+
+        self._poller = (threading.Thread(target=_loop, name="model-version-poll", daemon=True), stop)
+        self._poller[0].start()
+
+    def stop_polling(self):
+        if self._poller is not None:
+            self._poller[1].set()
+            self._poller = None
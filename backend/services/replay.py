@@ -0,0 +1,124 @@
+# backend/services/replay.py
+import asyncio
+import json
+from datetime import datetime
+
+from starlette.concurrency import run_in_threadpool
+
+from backend import config
+from backend.crud.alerts import create_alerts_once
+from backend.database import SessionLocal
+from backend.services.pipeline import run_prediction_batch
+from backend.services.stream import iter_stream_rows
+
+
+def _next_batch(rows, size):
+    """rows 이터레이터에서 최대 size 개를 꺼낸다."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+def score_and_persist(rows):
+    """
+    CSV row 묶음을 한 번에 채점하고, 불량(pred=1) 판정은 한 트랜잭션으로 alerts 에 저장.
+    replay 는 worker 마다 돌기 때문에 이미 저장된 wafer (product_id, timestamp) 는 다시 넣지 않고 기존 alert_id 를 쓴다.
+    반환: 클라이언트에 보낼 채점 결과 리스트
+    """
+    sensors = [
+        {k: (v if v != "" else None) for k, v in row.items() if k.startswith("sensor_")}
+        for row in rows
+    ]
+    results = run_prediction_batch(sensors)
+
+    scored = [
+        {
+            "product_id": int(row["product_id"]),
+            "timestamp": row["timestamp"],
+            "prob": res["prob"],
+            "pred": res["pred"],
+            "top_sensors": res["top_sensors"],
+            "model_version": res["model_version"],
+        }
+        for row, res in zip(rows, results)
+    ]
+
+    defects = [s for s in scored if s["pred"] == 1]
+    if defects:
+        db = SessionLocal()
+        try:
+            ids = create_alerts_once(db, [
+                {
+                    "timestamp": datetime.fromisoformat(s["timestamp"]),
+                    "product_id": s["product_id"],
+                    "top_sensors": json.dumps(s["top_sensors"]),
+                    "prob": s["prob"],
+                }
+                for s in defects
+            ])
+        finally:
+            db.close()
+        for s, alert_id in zip(defects, ids):
+            s["alert_id"] = alert_id
+
+    return scored
+
+
+class ReplayBroadcaster:
+    """
+    raw_stream.csv 를 서버에서 micro-batch 로 채점하면서 연결된 모든 클라이언트에
+    같은 결과를 replay 속도(interval_sec)에 맞춰 내보낸다.
+
+    - 첫 구독자가 붙을 때 replay 를 시작하고, 마지막 구독자가 나가면 다음 wafer 전에 멈춘다.
+    - worker 마다 따로 돌지만 alert 저장은 wafer 당 한 번 (score_and_persist).
+    - 느린 클라이언트의 큐가 가득 차면 가장 오래된 이벤트를 버린다.
+    """
+
+    def __init__(self, batch_size=None, interval_sec=None, queue_size=256):
+        self.batch_size = batch_size or config.REPLAY_BATCH_SIZE
+        self.interval_sec = config.REPLAY_INTERVAL_SEC if interval_sec is None else interval_sec
+        self.queue_size = queue_size
+        self.subscribers = set()
+        self._task = None
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+    def _publish(self, event):
+        for queue in list(self.subscribers):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _run(self):
+        rows = iter_stream_rows()
+        try:
+            while self.subscribers:
+                batch = await run_in_threadpool(_next_batch, rows, self.batch_size)
+                if not batch:
+                    break
+                scored = await run_in_threadpool(score_and_persist, batch)
+                for item in scored:
+                    # 구독자가 모두 나갔으면 남은 wafer 를 기다리지 않고 바로 종료
+                    if not self.subscribers:
+                        return
+                    self._publish(("scored", item))
+                    await asyncio.sleep(self.interval_sec)
+        except Exception as e:
+            print(f"[REPLAY ERROR] {e}")
+        finally:
+            rows.close()
+            self._publish(("end", None))
+
+
+REPLAY = ReplayBroadcaster()
@@ -0,0 +1,126 @@
+# backend/services/scaler_fold.py
+import re
+
+import numpy as np
+
+# LightGBM decision_type 비트: 1 = 범주형, 2 = default_left, (>> 2) & 3 = missing type (0 None, 1 Zero, 2 NaN)
+_CATEGORICAL_MASK = 1
+_MISSING_ZERO = 1
+
+
+def _scaled(x, mean, scale):
+    # InferenceEngine.scale / StandardScaler.transform 과 같은 연산 순서
+    return (x - mean) / scale
+
+
+_SIGN = np.int64(0x7FFFFFFFFFFFFFFF)
+
+
+def _to_key(x):
+    """double → 크기 순서가 같은 int64 (인접한 double 은 key 가 1 차이)"""
+    i = np.ascontiguousarray(x, dtype=np.float64).view(np.int64)
+    return np.where(i >= 0, i, -(i & _SIGN))
+
+
+def _from_key(k):
+    i = np.where(k >= 0, k, (-k) | ~_SIGN)
+    return i.astype(np.int64).view(np.float64)
+
+
+def fold_thresholds(feature, threshold, mean, scale):
+    """
+    scaled 공간 split  (x - mean) / scale <= t  →  raw 공간 split  x <= T.
+
+    T 는 부동소수 연산 그대로 (x - mean) / scale <= t 를 만족하는 가장 큰 double
+    (double 순서 key 위에서 이분 탐색). (x - mean) / scale 는 x 에 대해 단조라서
+    모든 입력 x 에서 split 방향이 완전히 같다.
+    """
+    feature = np.asarray(feature, dtype=np.intp)
+    t = np.asarray(threshold, dtype=np.float64)
+    m = np.asarray(mean, dtype=np.float64)[feature]
+    s = np.asarray(scale, dtype=np.float64)[feature]
+    if (s <= 0).any() or not np.isfinite(t).all():
+        raise ValueError("[scaler_fold] scale 은 양수, threshold 는 유한해야 합니다")
+
+    # 1️⃣ 근사값 t * s + m 주변에서 lo (조건 만족) / hi (불만족) 구간 잡기
+    T = t * s + m
+    width = np.maximum(np.abs(T), 1.0) * 1e-9
+    for _ in range(64):
+        lo, hi = T - width, T + width
+        ok = (_scaled(lo, m, s) <= t) & (_scaled(hi, m, s) > t)
+        if ok.all():
+            break
+        width = np.where(ok, width, width * 16)
+    else:
+        raise ValueError("[scaler_fold] threshold 를 raw 공간으로 옮기지 못했습니다")
+
+    # 2️⃣ key 공간 이분 탐색: lo 는 항상 만족, hi 는 항상 불만족
+    lo, hi = _to_key(lo), _to_key(hi)
+    while (hi - lo > 1).any():
+        mid = lo + (hi - lo) // 2
+        fits = _scaled(_from_key(mid), m, s) <= t
+        lo = np.where(fits, mid, lo)
+        hi = np.where(fits, hi, mid)
+    return _from_key(lo)
+
+
+def _format_doubles(values):
+    return " ".join(repr(float(v)) for v in values)
+
+
+def fold_model_text(model_str, mean, scale):
+    """
+    LightGBM text 모델(scaled 입력)의 split threshold 를 raw 입력 기준으로 바꾼 text 모델.
+    (feature_infos 범위와 tree_sizes 도 같이 갱신)
+
+    missing type None 의 NaN → 0.0 은 raw 공간에서는 NaN → mean 이어야 하므로
+    이 모델을 쓰는 쪽에서 입력 NaN 을 mean 으로 채워야 한다.
+    """
+    mean = np.asarray(mean, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+
+    head, sep, rest = model_str.partition("\nTree=0\n")
+    if not sep:
+        raise ValueError("[scaler_fold] LightGBM text 모델 형식이 아닙니다")
+    trees_part, end_sep, tail = ("Tree=0\n" + rest).partition("end of trees")
+    blocks = re.split(r"(?m)^(?=Tree=\d+$)", trees_part)
+    blocks = [b for b in blocks if b]
+
+    new_blocks = []
+    for block in blocks:
+        lines = block.split("\n")
+        fields = {line.split("=", 1)[0]: i for i, line in enumerate(lines) if "=" in line}
+        if "split_feature" in fields:
+            value = lambda key: lines[fields[key]].split("=", 1)[1].split()
+            feature = np.array(value("split_feature"), dtype=np.intp)
+            decision = np.array(value("decision_type"), dtype=np.int64)
+            if (decision & _CATEGORICAL_MASK).any():
+                raise ValueError("[scaler_fold] 범주형 split 이 있는 모델은 접을 수 없습니다")
+            if (((decision >> 2) & 3) == _MISSING_ZERO).any():
+                raise ValueError("[scaler_fold] missing_type=Zero split 이 있는 모델은 접을 수 없습니다")
+            folded = fold_thresholds(feature, np.array(value("threshold"), dtype=np.float64), mean, scale)
+            lines[fields["threshold"]] = "threshold=" + _format_doubles(folded)
+        new_blocks.append("\n".join(lines))
+
+    head_lines = head.split("\n")
+    for i, line in enumerate(head_lines):
+        if line.startswith("tree_sizes="):
+            head_lines[i] = "tree_sizes=" + " ".join(str(len(b)) for b in new_blocks)
+        elif line.startswith("feature_infos="):
+            infos = line.split("=", 1)[1].split()
+            for j, info in enumerate(infos):
+                if info.startswith("[") and ":" in info:
+                    lo, hi = (float(v) for v in info[1:-1].split(":"))
+                    lo, hi = float(lo * scale[j] + mean[j]), float(hi * scale[j] + mean[j])
+                    infos[j] = f"[{lo!r}:{hi!r}]"
+            head_lines[i] = "feature_infos=" + " ".join(infos)
+
+    return "\n".join(head_lines) + "\n" + "".join(new_blocks) + end_sep + tail
+
+
+def fill_nan(X, mean):
+    """raw 공간 모델 입력: NaN → mean (scaled 공간의 NaN → 0.0 과 같은 split). 제자리 변경."""
+    nan = np.isnan(X)
+    if nan.any():
+        np.copyto(X, np.broadcast_to(mean, X.shape), where=nan)
+    return X
@@ -0,0 +1,90 @@
+# backend/services/serialize.py
+import ast
+import json
+from functools import lru_cache
+
+from fastapi.responses import JSONResponse
+
+try:  # 선택 의존성: 설치되어 있으면 사용, 없으면 표준 json
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj):
+    """JSON 인코딩 → bytes (orjson 이 있으면 orjson, 없으면 표준 json 의 compact 출력)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(
+        obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    ORJSONResponse 와 같은 역할의 응답 클래스 (config.FAST_JSON_RESPONSE=1 일 때 기본값).
+    orjson 이 없어도 동작하고, 그때는 공백 없는 표준 json 으로 인코딩한다.
+    """
+
+    def render(self, content):
+        return dumps(content)
+
+
+# ─────────────────────────────────────────
+# alert 목록: DB row → JSON bytes (Pydantic 모델 생성 없이)
+# ─────────────────────────────────────────
+ALERT_COLUMNS = ("id", "timestamp", "product_id", "top_sensors", "prob", "resolved", "resolved_at")
+
+
+def parse_top_sensors(raw):
+    """
+    DB 의 top_sensors 문자열 → list[str] (AlertResponse.top_sensors 와 같은 타입)
+    JSON 이 아니면 Python 리스트 문자열로 해석, 실패하거나 리스트가 아니면 [].
+    """
+    if not raw:
+        return []
+    try:
+        value = json.loads(raw)
+    except json.JSONDecodeError:
+        try:
+            value = ast.literal_eval(raw)
+        except (ValueError, SyntaxError):
+            return []
+    if not isinstance(value, (list, tuple)):
+        return []
+    return [str(v) for v in value]
+
+
+@lru_cache(maxsize=4096)
+def _top_sensors_json(raw):
+    # top_sensors 조합은 반복이 많아서, 같은 문자열은 한 번만 파싱/인코딩
+    return json.dumps(parse_top_sensors(raw), ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_float(value):
+    if value is None or value != value or value in (float("inf"), float("-inf")):
+        return "null"
+    return repr(float(value))
+
+
+def alert_rows_json(rows):
+    """
+    ALERT_COLUMNS 순서의 row 튜플들 → AlertResponse 목록과 같은 JSON 배열 bytes.
+    (top_sensors 는 parse_top_sensors 로 항상 문자열 리스트)
+    convert_db_alert + response_model 검증 + jsonable_encoder 를 row 마다 거치지 않는다.
+    """
+    parts = []
+    for id_, ts, product_id, top_sensors, prob, resolved, resolved_at in rows:
+        parts.append(
+            '{"timestamp":"%s","product_id":%d,"top_sensors":%s,"prob":%s,'
+            '"resolved":%s,"id":%d,"resolved_at":%s}' % (
+                ts.isoformat(),
+                product_id,
+                _top_sensors_json(top_sensors),
+                _json_float(prob),
+                "true" if resolved else "false",
+                id_,
+                '"%s"' % resolved_at.isoformat() if resolved_at is not None else "null",
+            )
+        )
+    return ("[" + ",".join(parts) + "]").encode("utf-8")
@@ -1,7 +1,6 @@
 # backend/services/shap_utils.py
 import re
 import numpy as np
-import pandas as pd
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -14,25 +13,69 @@ def extract_sensor_name(feature_name: str):
     return sensors  # 리스트 반환
 
 
+def build_feature_sensor_map(feature_names):
+    """파생변수명 → 포함된 sensor 리스트. (regex 는 여기서 한 번만 수행)"""
+    return {f: extract_sensor_name(f) for f in feature_names}
+
+
+def rank_sensors(feature_importances, feature_names, sensor_map=None):
+    """
+    파생변수 중요도를 원본 센서 단위로 합산해서 중요도 내림차순 센서 리스트 반환.
+    모델이 같으면 결과가 바뀌지 않으므로 artifact 로드 시 한 번만 계산해 두고 쓴다.
+    """
+    if sensor_map is None:
+        sensor_map = build_feature_sensor_map(feature_names)
+
+    fi = np.asarray(feature_importances, dtype=float)
+    order = np.argsort(-fi, kind="stable")
+
+    sensor_score = {}
+    for i in order:
+        for s in sensor_map[feature_names[i]]:
+            sensor_score[s] = sensor_score.get(s, 0) + fi[i]
+
+    sensor_ranked = sorted(sensor_score.items(), key=lambda x: x[1], reverse=True)
+    return [s[0] for s in sensor_ranked]
+
+
 def select_top_sensors(feature_importances, feature_names, top_k=3):
     """
     feature_importances: np.array (330개)
     feature_names: list (330개)
     """
-    fi_df = pd.DataFrame({
-        "feature": feature_names,
-        "importance": feature_importances
-    })
+    return rank_sensors(feature_importances, list(feature_names))[:top_k]
 
-    fi_df = fi_df.sort_values(by="importance", ascending=False)
 
-    sensor_score = {}
+def build_sensor_matrix(feature_names, sensors, sensor_map=None):
+    """
+    (F, S) 파생변수 → 원본 센서 배분 행렬.
+    sensor_X_minus_sensor_Y 처럼 센서 2개가 들어간 파생변수는 기여도를 반씩 나눈다.
 
-    for _, row in fi_df.iterrows():
-        sensors = extract_sensor_name(row["feature"])
-        for s in sensors:
-            sensor_score[s] = sensor_score.get(s, 0) + row["importance"]
+    원소 대부분이 0 인 희소 행렬이지만 329 x 40 밖에 안 되므로
+    scipy.sparse 대신 dense 배열 한 번의 matmul 로 합산하는 편이 빠르다.
+    """
+    if sensor_map is None:
+        sensor_map = build_feature_sensor_map(feature_names)
+
+    pos = {s: j for j, s in enumerate(sensors)}
+    M = np.zeros((len(feature_names), len(sensors)), dtype=float)
+    for i, f in enumerate(feature_names):
+        owners = [pos[s] for s in sensor_map[f] if s in pos]
+        for j in owners:
+            M[i, j] += 1.0 / len(owners)
+    return M
+
+
+def top_sensor_indices(feature_contrib, sensor_matrix, top_k=3):
+    """
+    LightGBM pred_contrib 결과(bias 열 제외, (N, F))를 센서 단위로 합산해서
+    row 별로 불량 쪽(+) 기여도가 가장 큰 센서의 열 번호 top_k 개 ((N, top_k) 배열).
+    """
+    sensor_contrib = np.asarray(feature_contrib) @ sensor_matrix  # (N, S)
+    return np.argsort(-sensor_contrib, axis=1, kind="stable")[:, :top_k]
 
-    sensor_ranked = sorted(sensor_score.items(), key=lambda x: x[1], reverse=True)
 
-    return [s[0] for s in sensor_ranked[:top_k]]
\ No newline at end of file
+def top_sensors_from_contrib(feature_contrib, sensor_matrix, sensors, top_k=3):
+    """top_sensor_indices 결과를 센서 이름으로 바꿔서 반환."""
+    top_idx = top_sensor_indices(feature_contrib, sensor_matrix, top_k)
+    return [[sensors[j] for j in row] for row in top_idx]
@@ -1,8 +1,11 @@
 # backend/services/stream.py
 
 import csv
+import json
+import threading
 from pathlib import Path
-import pandas as pd
+
+from .serialize import dumps
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
@@ -24,4 +27,67 @@ def load_stream_rows():
         return []
     except Exception as e:
         print(f"An error occurred while loading stream data: {e}")
-        return []
\ No newline at end of file
+        return []
+
+_ALL_ROWS_LOCK = threading.Lock()
+_ALL_ROWS_JSON = {}  # (mtime_ns, size) -> encoded body
+
+
+def load_stream_rows_json():
+    """
+    load_stream_rows() encoded as a JSON array (bytes).
+    The CSV only changes when the demo data is re-exported, so the body is
+    encoded once per file version instead of per request.
+    """
+    try:
+        stat = STREAM_FILE_PATH.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        version = None
+    with _ALL_ROWS_LOCK:
+        body = _ALL_ROWS_JSON.get(version)
+        if body is None:
+            body = dumps(load_stream_rows())
+            _ALL_ROWS_JSON.clear()
+            _ALL_ROWS_JSON[version] = body
+    return body
+
+
+def iter_stream_rows(since_product_id=None, limit=None):
+    """
+    Lazily yields rows from raw_stream.csv, one dict at a time.
+
+    - since_product_id: only rows with product_id > since_product_id (cursor)
+    - limit: stop after this many rows (the rest of the file is never read)
+
+    The stream file is exported in product_id order, so file order is used
+    as the cursor order instead of sorting everything in memory.
+    """
+    if limit is not None and limit <= 0:
+        return
+    try:
+        with open(STREAM_FILE_PATH, mode='r', encoding='utf-8', newline='') as infile:
+            reader = csv.reader(infile)
+            header = next(reader, None)
+            if header is None:
+                return
+            pid_idx = header.index('product_id')
+
+            sent = 0
+            for values in reader:
+                if since_product_id is not None and int(values[pid_idx]) <= since_product_id:
+                    continue
+                yield dict(zip(header, values))
+                sent += 1
+                if limit is not None and sent >= limit:
+                    return
+    except FileNotFoundError:
+        print(f"Error: Stream data file not found at {STREAM_FILE_PATH}")
+    except Exception as e:
+        print(f"An error occurred while streaming stream data: {e}")
+
+
+def iter_stream_ndjson(since_product_id=None, limit=None):
+    """Encodes iter_stream_rows() as NDJSON lines (one JSON object per line)."""
+    for row in iter_stream_rows(since_product_id=since_product_id, limit=limit):
+        yield json.dumps(row) + "\n"
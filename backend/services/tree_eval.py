@@ -0,0 +1,177 @@
+# backend/services/tree_eval.py
+import numpy as np
+
+# LightGBM missing_type 코드
+MISSING_NONE, MISSING_ZERO, MISSING_NAN = 0, 1, 2
+_MISSING_CODES = {"None": MISSING_NONE, "Zero": MISSING_ZERO, "NaN": MISSING_NAN}
+_ZERO_THRESHOLD = 1e-35  # LightGBM kZeroThreshold
+
+# bundle 에 저장하는 배열 (trees_<name>.npy)
+TREE_ARRAYS = ("feature", "threshold", "left", "right", "missing", "default_left",
+               "leaf_value", "roots", "nan_value")
+
+
+class TreeEnsemble:
+    """
+    LightGBM 이진 분류 모델을 평평한 NumPy 배열로 옮긴 평가기 (lightgbm / sklearn import 없음).
+
+    내부 노드 i (전체 트리 통틀어 번호):
+      feature[i], threshold[i]  : x[feature] <= threshold 이면 왼쪽
+      left[i], right[i]         : >= 0 이면 다음 내부 노드, < 0 이면 ~leaf 번호
+      missing[i], default_left[i]: 결측 처리 (None 이면 NaN → nan_value[feature] 로 비교)
+    roots[t]: 트리 t 의 시작 노드 (leaf 하나짜리 트리는 ~leaf)
+    nan_value: feature 별 NaN 대체값. 기본은 LightGBM 과 같은 0.0,
+               scaler 를 접은 모델(fold_scaler)은 scaler mean (= scaled 공간의 0.0)
+
+    예측은 (row, tree) 쌍 전체를 한 단계씩 내려보내고, leaf 에 닿은 쌍은 다음 단계에서 뺀다.
+    """
+
+    def __init__(self, feature, threshold, left, right, missing, default_left,
+                 leaf_value, roots, n_features, sigmoid=1.0, nan_value=None):
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.missing = np.asarray(missing, dtype=np.uint8)
+        self.default_left = np.asarray(default_left, dtype=bool)
+        self.leaf_value = np.asarray(leaf_value, dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.n_features = int(n_features)
+        self.sigmoid = float(sigmoid)
+        self.nan_value = (
+            np.zeros(self.n_features) if nan_value is None
+            else np.asarray(nan_value, dtype=np.float64)
+        )
+        # 전부 missing_type None 이면 NaN → 0 을 입력에 한 번만 적용하고 비교만 한다
+        self._plain = not self.missing.any()
+        # 예측용: gather 한 번으로 다음 노드를 찾도록 [right, left] 를 번갈아 놓은 배열
+        # (노드 i 의 다음 노드 = _children[2 * i + go_left])
+        self._children = np.stack([self.right, self.left], axis=1).ravel().astype(np.intp)
+        self._feature = self.feature.astype(np.intp)
+        self._roots = self.roots.astype(np.intp)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    # ─────────────────────────────────────────
+    # 생성 / 저장
+    # ─────────────────────────────────────────
+    @classmethod
+    def from_booster(cls, booster, nan_value=None):
+        """lightgbm.Booster → TreeEnsemble (배포 전 한 번, 또는 bundle 에 배열이 없을 때)"""
+        dump = booster.dump_model()
+        objective = dump.get("objective", "")
+        if not objective.startswith("binary") or dump.get("num_tree_per_iteration", 1) != 1:
+            raise ValueError(f"[tree_eval] 이진 분류 모델만 지원합니다: {objective}")
+        if dump.get("average_output"):
+            raise ValueError("[tree_eval] average_output (random forest) 모델은 지원하지 않습니다")
+        sigmoid = 1.0
+        for token in objective.split():
+            if token.startswith("sigmoid:"):
+                sigmoid = float(token.split(":", 1)[1])
+
+        nodes = {k: [] for k in ("feature", "threshold", "left", "right", "missing", "default_left")}
+        leaf_value, roots = [], []
+
+        def add(node):
+            """node 를 추가하고 자기 번호 반환 (leaf 는 ~leaf 번호)"""
+            if "split_index" not in node:
+                leaf_value.append(node["leaf_value"])
+                return ~(len(leaf_value) - 1)
+            if node["decision_type"] != "<=":
+                raise ValueError(f"[tree_eval] 범주형 split 은 지원하지 않습니다: {node['decision_type']}")
+            i = len(nodes["feature"])
+            nodes["feature"].append(node["split_feature"])
+            nodes["threshold"].append(node["threshold"])
+            nodes["missing"].append(_MISSING_CODES[node["missing_type"]])
+            nodes["default_left"].append(node["default_left"])
+            nodes["left"].append(0)
+            nodes["right"].append(0)
+            nodes["left"][i] = add(node["left_child"])
+            nodes["right"][i] = add(node["right_child"])
+            return i
+
+        for tree in dump["tree_info"]:
+            roots.append(add(tree["tree_structure"]))
+
+        return cls(**nodes, leaf_value=leaf_value, roots=roots,
+                   n_features=dump["max_feature_idx"] + 1, sigmoid=sigmoid, nan_value=nan_value)
+
+    def to_arrays(self):
+        """bundle 저장용 {name: ndarray} (+ meta 는 n_features / sigmoid)"""
+        return {name: getattr(self, name) for name in TREE_ARRAYS}
+
+    @classmethod
+    def from_arrays(cls, arrays, n_features, sigmoid=1.0):
+        """to_arrays 결과에서 복원 (nan_value 가 없는 예전 bundle 은 0.0)"""
+        return cls(**{name: arrays[name] for name in TREE_ARRAYS if name in arrays},
+                   n_features=n_features, sigmoid=sigmoid)
+
+    def fold_scaler(self, mean, scale):
+        """
+        StandardScaler 를 split threshold 에 접은 평가기: predict_proba(X) == 원래.predict_proba((X - mean) / scale)
+        (threshold 는 scaler_fold.fold_thresholds 로 옮겨서 모든 입력에서 split 방향이 같다)
+        """
+        from backend.services.scaler_fold import fold_thresholds
+
+        if (self.missing == MISSING_ZERO).any():
+            raise ValueError("[tree_eval] missing_type=Zero split 이 있는 모델은 접을 수 없습니다")
+        arrays = self.to_arrays()
+        arrays["threshold"] = fold_thresholds(self.feature, self.threshold, mean, scale)
+        arrays["nan_value"] = np.asarray(mean, dtype=np.float64) + self.nan_value * np.asarray(scale)
+        return TreeEnsemble(**arrays, n_features=self.n_features, sigmoid=self.sigmoid)
+
+    # ─────────────────────────────────────────
+    # 예측
+    # ─────────────────────────────────────────
+    def _go_left(self, x, nd):
+        if self._plain:
+            return x <= self.threshold.take(nd)
+        missing = self.missing[nd]
+        nan = np.isnan(x)
+        # None / Zero: NaN 은 0.0 으로 취급, NaN 타입만 NaN 을 기본 방향으로
+        x = np.where(nan & (missing != MISSING_NAN), self.nan_value.take(self._feature.take(nd)), x)
+        go_left = x <= self.threshold[nd]
+        use_default = ((missing == MISSING_NAN) & nan) | (
+            (missing == MISSING_ZERO) & (np.abs(x) <= _ZERO_THRESHOLD)
+        )
+        return np.where(use_default, self.default_left[nd], go_left)
+
+    def leaf_indices(self, X, start=0, stop=None):
+        """(N, n_features) → (N, stop - start) 트리 start ~ stop-1 에서 도착한 leaf 번호 (기본 전체)"""
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"[tree_eval] 입력 shape 가 잘못되었습니다: {X.shape}, 기대값=(N, {self.n_features})")
+        if self._plain:
+            X = np.where(np.isnan(X), self.nan_value, X)
+        Xf = np.ascontiguousarray(X).ravel()
+
+        roots = self._roots[start:stop]
+        n, t = X.shape[0], len(roots)
+        node = np.tile(roots, n)                     # (row, tree) 쌍 N*T 개
+        base = np.repeat(np.arange(n, dtype=np.intp) * self.n_features, t)
+        active = np.flatnonzero(node >= 0)
+        while active.size:
+            nd = node.take(active)
+            x = Xf.take(base.take(active) + self._feature.take(nd))
+            nxt = self._children.take(2 * nd + self._go_left(x, nd))
+            node[active] = nxt
+            active = active[nxt >= 0]
+        return (~node).reshape(n, t)
+
+    def raw_score(self, X, max_rows=2048, start=0, stop=None):
+        """
+        (N, n_features) → (N,) log-odds (모든 트리 leaf 값의 합). 큰 배치는 max_rows 씩 나눠서.
+        start / stop 을 주면 그 구간 트리만 더한 부분 합 (cascade 용)
+        """
+        X = np.asarray(X, dtype=np.float64)
+        out = np.empty(len(X))
+        for i in range(0, len(X), max_rows):
+            leaves = self.leaf_indices(X[i:i + max_rows], start, stop)
+            out[i:i + max_rows] = self.leaf_value[leaves].sum(axis=1)
+        return out
+
+    def predict_proba(self, X):
+        """(N, n_features) → (N,) 불량 확률 (LGBMClassifier.predict_proba(X)[:, 1])"""
+        return 1.0 / (1.0 + np.exp(-self.sigmoid * self.raw_score(X)))
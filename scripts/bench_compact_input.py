@@ -0,0 +1,94 @@
+# scripts/bench_compact_input.py
+"""
+/api/predict 입력 형식별 요청 크기 / 파싱 시간 비교 + 예측 parity 확인.
+
+- dict      : {"sensors": {"sensor_001": ..., ..., "sensor_590": ...}}
+- values    : {"layout": "core", "values": [40개]}  /  {"layout": "full", "values": [590개]}
+- values_b64: {"layout": "core", "values_b64": "<float32 40개>"}
+
+파싱 시간 = JSON 디코딩 + PredictInput 검증 + (N, 40) 행렬 만들기 (모델 추론 제외)
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_compact_input.py
+"""
+import json
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+from backend.routers.predict import PredictInput, _model_input
+from backend.services.compact import FULL_SENSORS, encode_b64
+from backend.services.pipeline import get_pipeline_engine
+
+STREAM_CSV = os.path.join(PROJECT_ROOT, "backend", "data", "raw_stream.csv")
+
+
+def _time_per_call(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def _bodies(row, core):
+    sensors = {k: (None if np.isnan(v) else float(v)) for k, v in row.items()}
+    full = [sensors.get(k) for k in FULL_SENSORS]
+    core_values = [sensors.get(k) for k in core]
+    base = {"timestamp": "2008-07-19 11:55:00", "product_id": 1}
+    return {
+        "dict": {**base, "sensors": sensors},
+        "values(full)": {**base, "layout": "full", "values": full},
+        "values(core)": {**base, "layout": "core", "values": core_values},
+        "b64(full)": {**base, "layout": "full",
+                      "values_b64": encode_b64([np.nan if v is None else v for v in full])},
+        "b64(core)": {**base, "layout": "core",
+                      "values_b64": encode_b64([np.nan if v is None else v for v in core_values])},
+    }
+
+
+def main():
+    engine = get_pipeline_engine()
+    df = pd.read_csv(STREAM_CSV)
+    sensor_cols = [c for c in df.columns if c.startswith("sensor_")]
+    row = df[sensor_cols].iloc[0]
+
+    bodies = {k: json.dumps(v).encode() for k, v in _bodies(row, engine.core_features).items()}
+
+    # ─────────────────────────────────────────
+    # 1) parity: 모든 형식이 같은 예측을 내는지 (b64 는 float32 로 양자화)
+    # ─────────────────────────────────────────
+    probs = {}
+    for name, body in bodies.items():
+        item = _model_input(PredictInput.model_validate_json(body))
+        prob, _, _ = engine.predict_arrays(engine.select([item]))
+        probs[name] = float(prob[0])
+    ref = probs["dict"]
+    for name, prob in probs.items():
+        tol = 1e-6 if name.startswith("b64") else 0.0
+        assert abs(prob - ref) <= tol, f"[parity] {name}: {prob} != {ref}"
+    print(f"[parity] OK  prob={ref:.6f}  b64 max diff={max(abs(p - ref) for p in probs.values()):.2e}")
+
+    # ─────────────────────────────────────────
+    # 2) 요청 크기 / 파싱 시간
+    # ─────────────────────────────────────────
+    def parse(body):
+        return engine.select([_model_input(PredictInput.model_validate_json(body))])
+
+    for name, body in bodies.items():
+        t = _time_per_call(lambda: parse(body), 2000)
+        print(f"[{name:12s}] {len(body):6d} bytes   parse={t * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# scripts/bench_db.py
+"""
+alerts DB 혼합 읽기/쓰기 처리량 비교: 기본 SQLite 설정 vs 튜닝(WAL + PRAGMA + 연결 풀).
+
+임시 DB 파일에 reader/writer 스레드를 동시에 돌려서 초당 처리 건수를 잰다.
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_db.py --readers 4 --writers 2 --seconds 5
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.crud.alerts import create_alert, create_alerts, get_alerts
+from backend.database import Base, make_engine
+
+
+def _seed(Session, n):
+    db = Session()
+    base = datetime(2008, 7, 1)
+    create_alerts(db, [
+        {
+            "timestamp": base + timedelta(minutes=i),
+            "product_id": i,
+            "top_sensors": json.dumps(["sensor_001", "sensor_002", "sensor_003"]),
+            "prob": 0.9,
+        }
+        for i in range(n)
+    ])
+    db.close()
+
+
+def run(tuned, readers, writers, seconds, seed_rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{tmp}/bench.db", tuned=tuned)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        _seed(Session, seed_rows)
+
+        counts = {"read": 0, "write": 0, "error": 0}
+        lock = threading.Lock()
+        stop_at = time.perf_counter() + seconds
+
+        def reader():
+            db = Session()
+            n = 0
+            while time.perf_counter() < stop_at:
+                get_alerts(db, limit=50, resolved=False)
+                db.rollback()
+                n += 1
+            db.close()
+            with lock:
+                counts["read"] += n
+
+        def writer():
+            db = Session()
+            n = 0
+            while time.perf_counter() < stop_at:
+                try:
+                    create_alert(db, {
+                        "timestamp": datetime(2008, 11, 25) + timedelta(seconds=n),
+                        "product_id": n,
+                        "top_sensors": "[]",
+                        "prob": 0.8,
+                    })
+                    n += 1
+                except Exception:
+                    db.rollback()
+                    with lock:
+                        counts["error"] += 1
+            db.close()
+            with lock:
+                counts["write"] += n
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer) for _ in range(writers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        engine.dispose()
+
+    return {k: v / seconds for k, v in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--seed-rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    for label, tuned in (("default", False), ("tuned", True)):
+        r = run(tuned, args.readers, args.writers, args.seconds, args.seed_rows)
+        print(
+            f"[{label:7s}] reads/s={r['read']:9.1f}  writes/s={r['write']:8.1f}  "
+            f"errors/s={r['error']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
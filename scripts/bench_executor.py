@@ -0,0 +1,84 @@
+# scripts/bench_executor.py
+"""
+프로세스 풀 추론 처리량: 요청 스레드에서 바로 예측 vs worker 프로세스 N 개.
+
+--threads 개의 스레드가 각자 --batch row 짜리 예측을 반복 (FastAPI threadpool 을 흉내).
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_executor.py --workers 1 2 4 --threads 8 --batch 64 --seconds 5
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import warnings
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+import numpy as np
+import pandas as pd
+
+from backend.services.artifacts import MODELS_DIR
+from backend.services.engine import get_engine
+from backend.services.executor import ProcessInferenceExecutor
+
+MASTER_PARQUET = os.path.join(PROJECT_ROOT, "data", "processed", "base_master_mean.parquet")
+
+
+def _throughput(predict, X40, threads, batch, seconds):
+    done = [0] * threads
+    stop_at = time.perf_counter() + seconds
+
+    def loop(t):
+        rng = np.random.default_rng(t)
+        while time.perf_counter() < stop_at:
+            start = rng.integers(0, len(X40) - batch)
+            predict(X40[start:start + batch])
+            done[t] += batch
+
+    ths = [threading.Thread(target=loop, args=(t,)) for t in range(threads)]
+    t0 = time.perf_counter()
+    for th in ths:
+        th.start()
+    for th in ths:
+        th.join()
+    return sum(done) / (time.perf_counter() - t0)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    engine = get_engine(MODELS_DIR)
+    X40 = pd.read_parquet(MASTER_PARQUET)[engine.core_features].to_numpy(dtype=float)
+    print(f"[env] cpu_count={os.cpu_count()}, threads={args.threads}, batch={args.batch}")
+
+    rps = _throughput(engine.predict_arrays, X40, args.threads, args.batch, args.seconds)
+    print(f"[in-process ] {rps:9.1f} rows/s")
+
+    ref = engine.predict_arrays(X40[:256])
+    for workers in args.workers:
+        executor = ProcessInferenceExecutor(workers, MODELS_DIR, len(engine.core_features))
+        try:
+            executor.warmup()
+            got = executor.predict_arrays(X40[:256], MODELS_DIR)
+            assert all(np.array_equal(a, b) for a, b in zip(ref, got)), "worker 결과가 다릅니다"
+            rps = _throughput(lambda X: executor.predict_arrays(X, MODELS_DIR),
+                              X40, args.threads, args.batch, args.seconds)
+            print(f"[workers={workers:<3d}] {rps:9.1f} rows/s")
+        finally:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# scripts/bench_features.py
+"""
+FeatureEngine(NumPy) vs create_features(pandas) parity 확인 + 지연시간 측정.
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_features.py
+"""
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+from backend.services.pipeline import FEATURE_ENGINE, FINAL_FEATURES, TOP40
+from backend.services.preprocess import create_features, preprocess_top40
+
+CORE_DATASET = os.path.join(PROJECT_ROOT, "results", "stageF", "stageF_core_dataset.parquet")
+
+
+def _time_per_call(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main():
+    df = preprocess_top40(pd.read_parquet(CORE_DATASET)[TOP40])
+    X = df.to_numpy(dtype=float)
+
+    # ─────────────────────────────────────────
+    # 1) parity: row 단위 pandas 결과와 완전히 같은지
+    # ─────────────────────────────────────────
+    ref = create_features(df, rowwise_flags=True)[FINAL_FEATURES].to_numpy(dtype=float)
+    out = FEATURE_ENGINE.transform(X)
+    assert out.shape == ref.shape, (out.shape, ref.shape)
+    assert np.array_equal(out, ref, equal_nan=True), "FeatureEngine 결과가 pandas 와 다릅니다"
+    print(f"[parity] OK  rows={len(X)}, features={out.shape[1]}")
+
+    # ─────────────────────────────────────────
+    # 2) 지연시간: 단건 / 배치
+    # ─────────────────────────────────────────
+    row_df, row_X = df.iloc[[0]], X[:1]
+    t_pd = _time_per_call(lambda: create_features(row_df)[FINAL_FEATURES], 50)
+    t_np = _time_per_call(lambda: FEATURE_ENGINE.transform(row_X), 5000)
+    print(f"[1 row]     pandas={t_pd * 1e6:9.1f} us   numpy={t_np * 1e6:7.1f} us")
+
+    t_pd = _time_per_call(lambda: create_features(df, rowwise_flags=True)[FINAL_FEATURES], 5)
+    t_np = _time_per_call(lambda: FEATURE_ENGINE.transform(X), 200)
+    print(f"[{len(X)} rows] pandas={t_pd * 1e3:9.2f} ms   numpy={t_np * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
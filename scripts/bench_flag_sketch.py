@@ -0,0 +1,103 @@
+# scripts/bench_flag_sketch.py
+"""
+IQR / P95 flag 용 rolling 분위수 sketch 확인.
+
+1) parity: FeatureEngine.transform(flag_quantiles=...) == create_features(flag_quantiles=...)
+2) 정확도: wafer 를 순서대로 흘려보내면서 sketch 분위수 vs 최근 window 개의 정확한 분위수
+3) 비용: wafer 당 sketch 갱신 vs 매 요청마다 window 전체 np.quantile
+4) 상태 저장 → 복원 후 같은 값인지
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_flag_sketch.py --window 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+from backend.services.pipeline import get_pipeline_engine
+from backend.services.preprocess import create_features
+from backend.services.quantile_sketch import FLAG_PROBS, RollingQuantileSketch
+
+CORE_DATASET = os.path.join(PROJECT_ROOT, "results", "stageF", "stageF_core_dataset.parquet")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--window", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = get_pipeline_engine()
+    core = engine.core_features
+    X_clean, _, _ = engine.preprocess(pd.read_parquet(CORE_DATASET)[core].to_numpy(dtype=float))
+    n = len(X_clean)
+
+    # ─────────────────────────────────────────
+    # 1) 정확도 + 비용: 한 건씩 흘려보내기
+    # ─────────────────────────────────────────
+    sketch = RollingQuantileSketch(core, window=args.window)
+    checkpoints = range(2 * args.window, n, args.window // 2)
+    errors = []
+    t_update = 0.0
+    for i in range(n):
+        t0 = time.perf_counter()
+        sketch.update(X_clean[i:i + 1])
+        t_update += time.perf_counter() - t0
+        if i + 1 in checkpoints:
+            recent = X_clean[i + 1 - args.window:i + 1]
+            exact = np.quantile(recent, FLAG_PROBS, axis=0)
+            spread = recent.std(axis=0)
+            spread[spread == 0] = 1.0
+            errors.append(np.abs(sketch.quantiles() - exact) / spread)
+    errors = np.stack(errors)
+    for k, p in enumerate(FLAG_PROBS):
+        print(f"[accuracy] q{p:.2f}: mean |err|={errors[:, k].mean():.3f} std   "
+              f"p95 |err|={np.quantile(errors[:, k], 0.95):.3f} std")
+
+    window = X_clean[-args.window:]
+    t0 = time.perf_counter()
+    for _ in range(200):
+        np.quantile(window, FLAG_PROBS, axis=0)
+    t_exact = (time.perf_counter() - t0) / 200
+    print(f"[cost] sketch update={t_update / n * 1e6:7.1f} us/wafer   "
+          f"exact window quantile={t_exact * 1e6:7.1f} us/request")
+
+    # ─────────────────────────────────────────
+    # 2) parity: NumPy FeatureEngine vs pandas create_features
+    # ─────────────────────────────────────────
+    q = sketch.quantiles()
+    final = engine.final_features
+    ref = create_features(pd.DataFrame(X_clean, columns=core), flag_quantiles=q)[final]
+    out = engine.feature_engine.transform(X_clean, flag_quantiles=q)
+    assert np.array_equal(out, ref.to_numpy(dtype=float)), "flag_quantiles 결과가 pandas 와 다릅니다"
+    flags = [j for j, c in enumerate(final) if c.endswith("_iqr_flag")]
+    print(f"[parity] OK  rows={n}   iqr_flag rate={out[:, flags].mean():.3f} (row 단위 flag 는 항상 0)")
+
+    # ─────────────────────────────────────────
+    # 3) 저장 / 복원
+    # ─────────────────────────────────────────
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "flag_sketch.npz")
+        sketch.save(path)
+        restored = RollingQuantileSketch.load(path, core, window=args.window)
+        assert np.array_equal(restored.quantiles(), sketch.quantiles())
+        sketch.update(X_clean[:100])
+        restored.update(X_clean[:100])
+        assert np.array_equal(restored.quantiles(), sketch.quantiles())
+        print(f"[state] OK  {os.path.getsize(path)} bytes, observed={restored.observed}")
+
+
+if __name__ == "__main__":
+    main()
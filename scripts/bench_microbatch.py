@@ -0,0 +1,83 @@
+# scripts/bench_microbatch.py
+"""
+/api/predict 동시 단건 요청 처리량 / 지연시간: micro-batching 끔 vs 켬.
+
+같은 프로세스에서 httpx.AsyncClient(ASGITransport) 로 --concurrency 개의 클라이언트가
+각자 --requests 건씩 단건 예측을 보낸다. (네트워크/uvicorn 오버헤드 제외)
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_microbatch.py --concurrency 64 --requests 20
+"""
+import argparse
+import asyncio
+import csv
+import os
+import sys
+import time
+import warnings
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+import httpx
+import numpy as np
+
+from backend import config
+from backend.main import app
+from backend.routers.predict import PREDICT_BATCHER
+from backend.services.pipeline import get_pipeline_engine
+
+STREAM_CSV = os.path.join(PROJECT_ROOT, "backend", "data", "raw_stream.csv")
+
+
+def _load_rows():
+    with open(STREAM_CSV, newline="") as f:
+        return [
+            {k: (float(v) if v != "" else None) for k, v in r.items() if k.startswith("sensor_")}
+            for r in csv.DictReader(f)
+        ]
+
+
+async def _run(rows, concurrency, n_requests):
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(w):
+            for i in range(n_requests):
+                body = {"timestamp": "2008-11-25T00:00:00", "product_id": i,
+                        "sensors": rows[(w + i) % len(rows)]}
+                t0 = time.perf_counter()
+                r = await client.post("/api/predict", json=body)
+                latencies.append(time.perf_counter() - t0)
+                r.raise_for_status()
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker(w) for w in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+    lat = np.array(latencies) * 1e3
+    return len(lat) / elapsed, np.percentile(lat, 50), np.percentile(lat, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = _load_rows()
+    get_pipeline_engine()  # 엔진 로드는 측정에서 제외
+
+    for label, enabled in (("per-request", False), ("micro-batch", True)):
+        config.PREDICT_MICROBATCH = enabled
+        asyncio.run(_run(rows, 4, 2))  # warm-up
+        rps, p50, p99 = asyncio.run(_run(rows, args.concurrency, args.requests))
+        print(f"[{label:11s}] {rps:8.1f} req/s   p50={p50:7.1f} ms   p99={p99:7.1f} ms")
+    print(f"[micro-batch] {PREDICT_BATCHER.stats()}")
+
+
+if __name__ == "__main__":
+    main()
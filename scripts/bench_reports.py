@@ -0,0 +1,133 @@
+# scripts/bench_reports.py
+"""
+리포트 / 데모 리셋 쿼리 회귀 체크 (대량 alert 기준).
+
+1) 임시 SQLite DB 에 synthetic alert 를 --rows 개 (기본 100만) 넣고
+2) get_summary_data / delete_demo_data 가 실제로 실행하는 SQL 을 가로채서
+   EXPLAIN QUERY PLAN 이 인덱스를 쓰는지 확인 (full scan 이면 실패)
+3) 각 호출 시간을 출력
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_reports.py --rows 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from backend.crud.alerts import create_alerts, delete_demo_data
+from backend.crud.reports import get_summary_data
+from backend.database import Base, make_engine
+
+REPORT_CALLS = [
+    ("monthly", None),
+    ("monthly", "2008-09"),
+    ("weekly", "2008-09"),
+    ("daily", "2008-09"),
+    ("all", None),
+]
+
+
+def _seed(Session, rows, chunk=50000):
+    rng = random.Random(42)
+    base = datetime(2008, 1, 1)
+    span_min = 60 * 24 * 365 * 2
+    db = Session()
+    t0 = time.perf_counter()
+    for start in range(0, rows, chunk):
+        n = min(chunk, rows - start)
+        batch = []
+        for i in range(n):
+            if i % 100 == 0:
+                ts = datetime(2008, 11, 25) + timedelta(seconds=rng.randint(0, 86399))
+            elif i % 100 == 1:
+                ts = datetime(2025, 1, 1) + timedelta(minutes=rng.randint(0, 60 * 24 * 364))
+            else:
+                ts = base + timedelta(minutes=rng.randint(0, span_min))
+            batch.append({
+                "timestamp": ts,
+                "product_id": start + i,
+                "top_sensors": '["sensor_001", "sensor_002", "sensor_003"]',
+                "prob": 0.9,
+                "resolved": rng.random() < 0.3,
+            })
+        create_alerts(db, batch)
+    db.close()
+    print(f"[seed] {rows} alerts in {time.perf_counter() - t0:.1f}s")
+
+
+class PlanChecker:
+    """실행되는 SELECT/DELETE 를 모아두었다가 EXPLAIN QUERY PLAN 으로 인덱스 사용 여부 확인."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.captured = []
+        event.listen(engine, "before_cursor_execute", self._capture)
+
+    def _capture(self, conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "DELETE")):
+            self.captured.append((statement, parameters))
+
+    def reset(self):
+        self.captured = []
+
+    def assert_indexed(self, label):
+        raw = self.engine.raw_connection()
+        try:
+            for statement, parameters in self.captured:
+                plan = raw.cursor().execute(
+                    "EXPLAIN QUERY PLAN " + statement, parameters
+                ).fetchall()
+                details = [row[-1] for row in plan]
+                full_scans = [d for d in details if d.startswith("SCAN ")]
+                assert not full_scans, f"[{label}] full table scan: {details}\n{statement}"
+                print(f"  plan OK [{label}] {' | '.join(details)}")
+        finally:
+            raw.close()
+        self.reset()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        _seed(Session, args.rows)
+
+        checker = PlanChecker(engine)
+        db = Session()
+
+        for period_type, month in REPORT_CALLS:
+            t0 = time.perf_counter()
+            get_summary_data(db, period_type, month)
+            elapsed = (time.perf_counter() - t0) * 1e3
+            print(f"[report] {period_type:7s} month={month}: {elapsed:8.2f} ms")
+            checker.assert_indexed(f"report {period_type}")
+
+        t0 = time.perf_counter()
+        result = delete_demo_data(db)
+        elapsed = (time.perf_counter() - t0) * 1e3
+        print(f"[reset]  deleted={result['deleted_rows']}: {elapsed:8.2f} ms")
+        checker.assert_indexed("reset")
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# scripts/bench_serialize.py
+"""
+/api/alerts 목록 직렬화 시간 비교 (alert --rows 개, 기본 1만 건) + 결과 동일성 확인.
+
+- pydantic : get_alerts → convert_db_alert → response_model 검증 → jsonable_encoder → json (기존 경로)
+- direct   : get_alert_rows → alert_rows_json (row 튜플에서 바로 bytes)
+
+/api/stream/all_rows 도 기존(jsonable_encoder + json) vs 캐시된 bytes 를 같이 잰다.
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_serialize.py --rows 10000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy.orm import sessionmaker
+
+from backend import schemas
+from backend.crud.alerts import create_alerts, get_alert_rows, get_alerts
+from backend.database import Base, make_engine
+from backend.routers.alerts import convert_db_alert
+from backend.services.serialize import alert_rows_json, orjson
+from backend.services.stream import load_stream_rows, load_stream_rows_json
+
+SENSORS = ["sensor_042", "sensor_332", "sensor_407", "sensor_575", "sensor_574", "sensor_060"]
+
+
+def _seed(Session, rows):
+    rng = random.Random(42)
+    base = datetime(2008, 7, 1)
+    data = []
+    for i in range(rows):
+        resolved = rng.random() < 0.3
+        data.append({
+            "timestamp": base + timedelta(seconds=rng.randint(0, 86400 * 180), microseconds=i % 7 * 1000),
+            "product_id": i,
+            "top_sensors": json.dumps(rng.sample(SENSORS, 3)),
+            "prob": rng.random(),
+            "resolved": resolved,
+            "resolved_at": base + timedelta(days=200) if resolved else None,
+        })
+    db = Session()
+    create_alerts(db, data)
+    db.close()
+
+
+def _time(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = fn()
+    return (time.perf_counter() - t0) / repeat, out
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(f"[json] orjson={'yes' if orjson is not None else 'no (stdlib fallback)'}")
+
+    adapter = TypeAdapter(List[schemas.AlertResponse])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        _seed(Session, args.rows)
+        db = Session()
+
+        def pydantic_path():
+            # FastAPI 의 response_model 처리와 같은 순서: 모델 생성 → 검증 → jsonable_encoder → json
+            items = [convert_db_alert(a) for a in get_alerts(db)]
+            validated = adapter.validate_python([i.model_dump() for i in items])
+            return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+        def direct_path():
+            return alert_rows_json(get_alert_rows(db))
+
+        t_old, old = _time(pydantic_path, args.repeat)
+        t_new, new = _time(direct_path, args.repeat)
+        assert json.loads(old) == json.loads(new), "direct 직렬화 결과가 기존 응답과 다릅니다"
+        print(f"[parity] OK  alerts={args.rows}")
+        per_10k = 10_000 / args.rows
+        print(f"[alerts] pydantic={t_old * 1e3 * per_10k:8.1f} ms / 10k   "
+              f"direct={t_new * 1e3 * per_10k:7.1f} ms / 10k   x{t_old / t_new:.1f}")
+
+        db.close()
+        engine.dispose()
+
+    t_old, old = _time(lambda: json.dumps(jsonable_encoder(load_stream_rows())).encode(), args.repeat)
+    t_new, new = _time(load_stream_rows_json, args.repeat)
+    assert json.loads(old) == json.loads(new)
+    print(f"[all_rows] jsonable_encoder={t_old * 1e3:8.1f} ms   cached bytes={t_new * 1e3:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# scripts/bench_startup.py
+"""
+cold start (import → 첫 예측 완료) 시간 측정. 매 측정마다 새 python 프로세스를 띄운다.
+
+  import   : 앱 모듈 import 까지 (artifact 는 아직 로드 안 됨)
+  ready    : import + 엔진 로드 + 첫 예측 1건까지
+  heavy    : import 직후 이미 올라와 있는 무거운 모듈
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_startup.py --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+
+HEAVY_MODULES = ("pandas", "scipy", "sklearn", "lightgbm", "joblib")
+
+# {import_stmt}: 앱 import, {load}: 엔진 가져오기 (bundle / pickle)
+CHILD = """
+import json, sys, time, warnings
+warnings.filterwarnings("ignore")
+sys.path[:0] = [{root!r}, {src!r}]
+t0 = time.perf_counter()
+{import_stmt}
+t_import = time.perf_counter() - t0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+from backend.services import engine as E
+engine = {load}
+engine.predict_batch([{{"sensor_001": 1.0}}])
+t_ready = time.perf_counter() - t0
+print(json.dumps({{"import": t_import, "ready": t_ready, "heavy": heavy}}))
+"""
+
+CASES = (
+    ("backend.main  / bundle", "import backend.main", "E.get_engine(E.MODELS_DIR)"),
+    ("backend.main  / pickle", "import backend.main", "E.InferenceEngine.from_pickles(E.MODELS_DIR)"),
+    ("monitoring_api / bundle", "import monitoring_api.pipeline as P",
+     "P.get_inference_engine()"),
+)
+
+
+def run_case(import_stmt, load):
+    code = CHILD.format(
+        root=PROJECT_ROOT, src=os.path.join(PROJECT_ROOT, "src"),
+        import_stmt=import_stmt, load=load, heavy=HEAVY_MODULES,
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, import_stmt, load in CASES:
+        runs = [run_case(import_stmt, load) for _ in range(args.repeat)]
+        t_import = statistics.median(r["import"] for r in runs)
+        t_ready = statistics.median(r["ready"] for r in runs)
+        print(
+            f"[{label}] import={t_import * 1e3:7.1f} ms  ready={t_ready * 1e3:7.1f} ms  "
+            f"heavy@import={runs[0]['heavy'] or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# scripts/bench_tree_eval.py
+"""
+TreeEnsemble (NumPy 트리 평가기) vs LightGBM parity + 배치 크기별 지연시간.
+
+- parity: base_master_mean.parquet 전체 (+ NaN 을 섞은 입력) 에서
+          LGBMClassifier.predict_proba(X)[:, 1] 과 1e-6 이내인지
+- 지연시간: 배치 크기 1 ~ 10000 에서
+          sklearn 래퍼 predict_proba / Booster.predict / TreeEnsemble.predict_proba
+
+실행 (프로젝트 루트에서):
+    python scripts/bench_tree_eval.py
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+from backend.services.pipeline import get_pipeline_engine
+from backend.services.tree_eval import TreeEnsemble
+
+MASTER_PARQUET = os.path.join(PROJECT_ROOT, "data", "processed", "base_master_mean.parquet")
+BATCH_SIZES = (1, 10, 100, 1000, 10000)
+
+
+def _time_per_call(fn, budget=1.0, max_repeat=2000):
+    """한 번 돌려보고 budget 초 안에 들어오는 만큼 반복한 평균"""
+    t0 = time.perf_counter()
+    fn()
+    once = time.perf_counter() - t0
+    repeat = int(min(max_repeat, max(1, budget / max(once, 1e-9))))
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--atol", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    engine = get_pipeline_engine()
+    # scaled 입력 기준 원본 모델 (bundle 엔진의 booster 는 scaler 가 접힌 raw 입력용이라 비교 대상 아님)
+    model = engine.model  # sklearn LGBMClassifier (pickle)
+    booster = model.booster_
+
+    t0 = time.perf_counter()
+    trees = TreeEnsemble.from_booster(booster)
+    print(f"[export] trees={trees.n_trees} nodes={len(trees.feature)} leaves={len(trees.leaf_value)} "
+          f"({(time.perf_counter() - t0) * 1e3:.0f} ms)")
+
+    X40 = pd.read_parquet(MASTER_PARQUET)[engine.core_features].to_numpy(dtype=float)
+    X = engine.scale(engine.features(X40))
+
+    # ─────────────────────────────────────────
+    # 1) parity
+    # ─────────────────────────────────────────
+    X_nan = X.copy()
+    X_nan[::3, ::7] = np.nan
+    for label, data in (("scaled", X), ("with NaN", X_nan)):
+        ref = model.predict_proba(data)[:, 1]
+        out = trees.predict_proba(data)
+        diff = np.abs(out - ref).max()
+        assert diff <= args.atol, f"[parity] {label}: max|Δprob|={diff}"
+        flips = int(((out >= engine.threshold) != (ref >= engine.threshold)).sum())
+        print(f"[parity] OK  {label:8s} rows={len(data)} max|Δprob|={diff:.1e} label flips={flips}")
+
+    # ─────────────────────────────────────────
+    # 2) 배치 크기별 지연시간
+    # ─────────────────────────────────────────
+    print(f"{'batch':>6s} {'sklearn':>12s} {'booster':>12s} {'numpy':>12s}   (ms / batch)")
+    for n in BATCH_SIZES:
+        Xb = np.resize(X, (n, X.shape[1]))
+        t_sk = _time_per_call(lambda: model.predict_proba(Xb))
+        t_lgb = _time_per_call(lambda: booster.predict(Xb))
+        t_np = _time_per_call(lambda: trees.predict_proba(Xb))
+        print(f"{n:6d} {t_sk * 1e3:12.3f} {t_lgb * 1e3:12.3f} {t_np * 1e3:12.3f}")
+
+
+if __name__ == "__main__":
+    main()
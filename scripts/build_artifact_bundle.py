@@ -0,0 +1,72 @@
+# scripts/build_artifact_bundle.py
+"""
+pickle/JSON artifact → 배포용 bundle (<models_dir>/bundle/) 생성 + parity 확인.
+
+bundle 은 manifest.json + *.npy (mmap, 트리 배열 포함) + LightGBM text 모델로 구성되고,
+get_engine() 이 pickle 대신 이걸 읽는다. artifact 를 바꾸면 다시 실행할 것.
+
+실행 (프로젝트 루트에서):
+    python scripts/build_artifact_bundle.py                    # backend/models
+    python scripts/build_artifact_bundle.py --models-dir models
+"""
+import argparse
+import os
+import sys
+import warnings
+
+import numpy as np
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+import pandas as pd
+
+from backend.services.engine import InferenceEngine, export_bundle
+
+# models/ (관제 API) 는 같은 artifact 라서 backend/models/bundle 을 같이 읽는다
+DEFAULT_DIRS = (
+    os.path.join(PROJECT_ROOT, "backend", "models"),
+)
+MASTER_PARQUET = os.path.join(PROJECT_ROOT, "data", "processed", "base_master_mean.parquet")
+
+
+def check_parity(models_dir, bundle_dir):
+    """pickle 엔진 vs bundle 엔진: prob / contrib 완전 일치 확인"""
+    ref = InferenceEngine.from_pickles(models_dir)
+    new = InferenceEngine.from_bundle(bundle_dir)
+    X40 = pd.read_parquet(MASTER_PARQUET)[ref.core_features].to_numpy(dtype=float)
+
+    p_ref, y_ref, c_ref = ref.predict_matrix(X40)
+    p_new, y_new, c_new = new.predict_matrix(X40)
+    assert np.array_equal(y_ref, y_new), "bundle 예측 라벨이 pickle 과 다릅니다"
+    assert np.array_equal(c_ref, c_new), "bundle 기여도가 pickle 과 다릅니다"
+
+    # bundle 의 트리 배열 (NumPy 평가기) 확률도 같은지
+    p_tree, y_tree = new.predict_prob(X40)
+    assert np.array_equal(y_ref, y_tree), "TreeEnsemble 예측 라벨이 LightGBM 과 다릅니다"
+    assert np.abs(p_ref - p_tree).max() < 1e-12, "TreeEnsemble 확률이 LightGBM 과 다릅니다"
+
+    # sklearn StandardScaler.transform 과도 같은지
+    X_final = ref.features(X40)
+    assert np.array_equal(ref.scaler.transform(X_final), new.scale(X_final.copy()))
+    print(f"[parity] OK  rows={len(X40)}, max|Δprob|={np.abs(p_ref - p_new).max():.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models-dir", action="append", default=None)
+    args = parser.parse_args()
+
+    for models_dir in args.models_dir or DEFAULT_DIRS:
+        bundle_dir = export_bundle(models_dir)
+        size = sum(os.path.getsize(os.path.join(bundle_dir, f)) for f in os.listdir(bundle_dir))
+        print(f"[bundle] {bundle_dir} ({size / 1024:.0f} KB)")
+        check_parity(models_dir, bundle_dir)
+
+
+if __name__ == "__main__":
+    main()
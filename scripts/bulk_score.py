@@ -0,0 +1,181 @@
+# scripts/bulk_score.py
+"""
+과거 데이터 일괄 재채점 (모델 교체 후 backfill 용).
+
+parquet / CSV / SECOM 원본(secom.data) 을 chunk 단위로 읽어서 API 와 같은 추론 엔진
+(raw → Top40 → 전처리 → 파생변수 → 예측 → top_sensors) 을 프로세스 풀에서 돌리고,
+prob / pred / top_sensors 를 parquet 으로 쓴다.
+
+- 입력은 core 센서 열(+ --keep 열)만 읽는다 (parquet 은 row group 단위 iter_batches, CSV 는 chunksize)
+- 메모리에 올라가는 건 읽는 중인 chunk 1 개 + 채점 중인 chunk --prefetch 개 뿐 (입력 크기와 무관)
+- 출력 row 순서 = 입력 row 순서 ("row" 열 = 입력 파일의 0-based row 번호)
+
+실행 (프로젝트 루트에서):
+    python scripts/bulk_score.py data/processed/base_master_mean.parquet results/rescored.parquet --keep label
+    python scripts/bulk_score.py data/raw/secom/secom.data results/secom_scored.parquet --workers 4
+"""
+import argparse
+import os
+import resource
+import sys
+import time
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from backend.services.artifacts import MODELS_DIR
+from backend.services.compact import FULL_SENSORS
+from backend.services.engine import get_engine
+from backend.services.executor import TOP_K, ProcessInferenceExecutor
+
+# 출력에 새로 만드는 열 (--keep 으로 같은 이름을 복사하면 덮어써지므로 금지)
+OUTPUT_COLUMNS = ("row", "prob", "pred", "top_sensors")
+
+
+# ─────────────────────────────────────────
+# 입력: chunk 단위 읽기
+# ─────────────────────────────────────────
+def _is_secom(path, fmt):
+    return fmt == "secom" or (fmt == "auto" and path.endswith(".data"))
+
+
+def iter_chunks(path, core, keep=(), chunk_rows=8192, fmt="auto"):
+    """입력 파일 → (core 센서 (n, 40) float 행렬, keep 열 DataFrame) chunk 들. 없는 센서 열은 NaN."""
+    wanted = list(core) + [c for c in keep if c not in core]
+
+    if fmt == "parquet" or (fmt == "auto" and path.endswith(".parquet")):
+        pf = pq.ParquetFile(path)
+        present = [c for c in wanted if c in pf.schema_arrow.names]
+        batches = (b.to_pandas() for b in pf.iter_batches(batch_size=chunk_rows, columns=present))
+    elif _is_secom(path, fmt):
+        # secom.data: 공백 구분, 헤더 없음, 590 개 센서 (sensor_001 ~ sensor_590)
+        usecols = [c for c in wanted if c in FULL_SENSORS]
+        batches = pd.read_csv(path, sep=r"\s+", header=None, names=FULL_SENSORS,
+                              usecols=usecols, chunksize=chunk_rows)
+    else:
+        batches = pd.read_csv(path, usecols=lambda c: c in wanted, chunksize=chunk_rows)
+
+    for df in batches:
+        missing = [c for c in keep if c not in df.columns]
+        if missing:
+            raise ValueError(f"[bulk_score] 입력에 --keep 열이 없습니다: {missing}")
+        if df.empty:
+            continue
+        X40 = df.reindex(columns=core).to_numpy(dtype=np.float64)
+        yield X40, df[list(keep)]
+
+
+# ─────────────────────────────────────────
+# 출력: parquet
+# ─────────────────────────────────────────
+def to_table(start, prob, pred, top_idx, names, kept):
+    """채점 결과 chunk → pyarrow Table (row, keep 열..., prob, pred, top_sensors)"""
+    n = len(prob)
+    top = pa.FixedSizeListArray.from_arrays(pa.array(names[top_idx.ravel()], type=pa.string()),
+                                            top_idx.shape[1])
+    columns = {"row": pa.array(np.arange(start, start + n, dtype=np.int64))}
+    for col in kept.columns:
+        columns[col] = pa.Array.from_pandas(kept[col])
+    columns["prob"] = pa.array(prob, type=pa.float64())
+    columns["pred"] = pa.array(pred, type=pa.int8())
+    columns["top_sensors"] = top
+    return pa.table(columns)
+
+
+def _peak_rss_mb(who):
+    # Linux ru_maxrss 단위는 KB
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", help="입력 .parquet / .csv / secom.data")
+    parser.add_argument("output", help="출력 .parquet")
+    parser.add_argument("--format", choices=("auto", "parquet", "csv", "secom"), default="auto")
+    parser.add_argument("--models-dir", default=str(MODELS_DIR))
+    parser.add_argument("--keep", nargs="*", default=[], help="출력에 그대로 복사할 입력 열 (예: label)")
+    parser.add_argument("--chunk-rows", type=int, default=8192, help="한 번에 읽고 채점하는 row 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="추론 worker 프로세스 수 (0 이면 현재 프로세스에서)")
+    parser.add_argument("--shm-rows", type=int, default=1024, help="worker 에 한 번에 보내는 row 수")
+    parser.add_argument("--prefetch", type=int, default=2, help="동시에 채점 중인 chunk 수")
+    args = parser.parse_args()
+    clash = sorted(set(args.keep) & set(OUTPUT_COLUMNS))
+    if clash:
+        parser.error(f"--keep 에 출력 열 이름은 쓸 수 없습니다: {clash}")
+
+    engine = get_engine(args.models_dir)
+    core = engine.core_features
+    names = np.array(core, dtype=object)
+
+    # 1️⃣ 추론기: worker 프로세스 풀 (shared memory 로 주고받음) 또는 현재 프로세스 엔진
+    executor = None
+    if args.workers > 0:
+        executor = ProcessInferenceExecutor(args.workers, args.models_dir, len(core),
+                                            max_rows=args.shm_rows)
+        executor.warmup()
+        predict = lambda X40: executor.predict_arrays(X40, args.models_dir)
+    else:
+        predict = lambda X40: engine.predict_arrays(X40, TOP_K)
+
+    # 2️⃣ 읽기 → 채점 (최대 prefetch 개 동시) → 입력 순서대로 쓰기
+    writer = None
+    pending = deque()
+    n_rows = 0
+    t0 = time.perf_counter()
+
+    def flush_one():
+        nonlocal writer
+        start, kept, future = pending.popleft()
+        table = to_table(start, *future.result(), names, kept)
+        if writer is None:
+            writer = pq.ParquetWriter(args.output, table.schema)
+        writer.write_table(table)
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.prefetch, thread_name_prefix="bulk-score") as pool:
+            for X40, kept in iter_chunks(args.input, core, args.keep, args.chunk_rows, args.format):
+                pending.append((n_rows, kept, pool.submit(predict, X40)))
+                n_rows += len(X40)
+                if len(pending) >= args.prefetch:
+                    flush_one()
+                    elapsed = time.perf_counter() - t0
+                    print(f"[bulk_score] {n_rows:,} rows  {n_rows / elapsed:,.0f} rows/s", end="\r")
+            while pending:
+                flush_one()
+        if writer is None:
+            # 빈 입력: 0 row 라도 같은 열 구성의 parquet 을 남긴다
+            kept = pd.DataFrame({c: pd.Series(dtype=object) for c in args.keep})
+            table = to_table(0, np.empty(0), np.empty(0, dtype=np.int8),
+                             np.empty((0, TOP_K), dtype=np.intp), names, kept)
+            writer = pq.ParquetWriter(args.output, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+        if executor is not None:
+            executor.shutdown()
+
+    # 3️⃣ 결과
+    elapsed = time.perf_counter() - t0
+    print(f"[bulk_score] {args.output}  rows={n_rows:,}  {elapsed:.1f} s  "
+          f"{n_rows / max(elapsed, 1e-9):,.0f} rows/s  (workers={args.workers}, chunk={args.chunk_rows})")
+    print(f"[memory] peak RSS  main={_peak_rss_mb(resource.RUSAGE_SELF):.0f} MB  "
+          f"worker max={_peak_rss_mb(resource.RUSAGE_CHILDREN):.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# scripts/calibrate_cascade.py
+"""
+조기 종료(cascade) 추론 밴드 보정 → <models_dir>/bundle/cascade.json + 조기 종료 비율 / 지연시간 비교.
+
+holdout 은 StageH 노트북과 같은 분할 (stageF_core_dataset, test_size=0.2, stratify=label, random_state=42).
+holdout 에서 앞쪽 k 개 트리 부분 log-odds 로 라벨이 확정되는 밴드를 잡고 (margin 만큼 여유),
+  - holdout: cascade pred == 전체 앙상블 pred (반드시, 아니면 실패)
+  - 전체 데이터: 라벨이 바뀐 wafer 수 (참고용)
+  - 배치 크기별 전체 앙상블 vs cascade 지연시간
+를 출력한다. 관제 API 는 CASCADE_INFERENCE=1 일 때 이 밴드를 쓴다.
+밴드는 row 단위 flag 모델 입력 기준이라 FLAG_SKETCH 분위수가 활성화된 동안에는 쓰지 않는다.
+
+실행 (프로젝트 루트에서, scripts/build_artifact_bundle.py 로 bundle 을 만든 뒤):
+    python scripts/calibrate_cascade.py                    # backend/models
+    python scripts/calibrate_cascade.py --margin 0.5
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+from backend.services.cascade import calibrate_band
+from backend.services.engine import BUNDLE_DIRNAME, InferenceEngine
+
+# models/ (관제 API) 는 같은 artifact 라서 backend/models/bundle 을 같이 읽는다
+DEFAULT_DIRS = (
+    os.path.join(PROJECT_ROOT, "backend", "models"),
+)
+CORE_DATASET = os.path.join(PROJECT_ROOT, "results", "stageF", "stageF_core_dataset.parquet")
+BATCH_SIZES = (1, 16, 256, 1567)
+
+
+def holdout_index(labels, test_size=0.2, seed=42):
+    """StageH 노트북의 train_test_split 과 같은 test 행 번호"""
+    from sklearn.model_selection import train_test_split
+
+    _, test = train_test_split(np.arange(len(labels)), test_size=test_size,
+                               stratify=labels, random_state=seed)
+    return np.sort(test)
+
+
+def _time_per_call(fn, budget=1.0, max_repeat=2000):
+    """한 번 돌려보고 budget 초 안에 들어오는 만큼 반복한 평균"""
+    t0 = time.perf_counter()
+    fn()
+    once = time.perf_counter() - t0
+    repeat = int(min(max_repeat, max(1, budget / max(once, 1e-9))))
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def calibrate(models_dir, margin, candidates, bench):
+    bundle_dir = os.path.join(models_dir, BUNDLE_DIRNAME)
+    engine = InferenceEngine.from_bundle(bundle_dir)
+    trees = engine.tree_ensemble
+
+    df = pd.read_parquet(CORE_DATASET)
+    X40 = df[engine.core_features].to_numpy(dtype=float)
+    X = engine.model_input(X40)
+    test = holdout_index(df["label"].to_numpy())
+
+    # 1) holdout 으로 밴드 보정 → bundle/cascade.json
+    band, report = calibrate_band(trees, X[test], engine.threshold, candidates,
+                                  margin=margin, digest=engine.digest)
+    for row in report:
+        mark = " <" if row["n_trees"] == band.n_trees else ""
+        print(f"[calibrate] k={row['n_trees']:4d}  holdout exit={row['exit_rate']:6.1%}  "
+              f"tree cost={row['tree_cost']:6.1%}{mark}")
+    path = band.save(bundle_dir)
+    print(f"[band] {path}  k={band.n_trees}/{trees.n_trees}  "
+          f"low={band.low:.3f} high={band.high:.3f} (log-odds, margin={margin})")
+
+    # 2) 라벨 비교: holdout 은 반드시 같아야 하고, 전체 데이터는 참고용
+    ref = trees.predict_proba(X) >= engine.threshold
+    prob, exited = band.predict_proba(trees, X)
+    out = prob >= engine.threshold
+    assert np.array_equal(out[test], ref[test]), "holdout 에서 cascade 라벨이 전체 앙상블과 다릅니다"
+    full = trees.predict_proba(X)
+    assert np.array_equal(prob[~exited], full[~exited]), "애매한 wafer 의 prob 이 전체 앙상블과 다릅니다"
+    print(f"[labels] OK  holdout rows={len(test)} exit={exited[test].mean():.1%} flips=0   "
+          f"all rows={len(X)} exit={exited.mean():.1%} flips={int((out != ref).sum())}   "
+          f"max|Δprob| exited={np.abs(prob - full)[exited].max():.3f}")
+
+    # 3) 지연시간 (모델 입력 이후 트리 평가만)
+    if bench:
+        print(f"{'batch':>6s} {'full':>10s} {'cascade':>10s} {'saving':>8s}   (ms / batch)")
+        for n in BATCH_SIZES:
+            Xb = np.resize(X, (n, X.shape[1]))
+            t_full = _time_per_call(lambda: trees.predict_proba(Xb))
+            t_cas = _time_per_call(lambda: band.predict_proba(trees, Xb))
+            print(f"{n:6d} {t_full * 1e3:10.3f} {t_cas * 1e3:10.3f} {1 - t_cas / t_full:8.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models-dir", action="append", default=None)
+    parser.add_argument("--margin", type=float, default=1.0,
+                        help="holdout 경계에서 더 넓힐 log-odds 여유")
+    parser.add_argument("--candidates", type=int, nargs="+", default=list(range(25, 525, 25)))
+    parser.add_argument("--no-bench", action="store_true")
+    args = parser.parse_args()
+
+    for i, models_dir in enumerate(args.models_dir or DEFAULT_DIRS):
+        # 지연시간은 첫 번째 디렉토리에서만 (bundle 내용이 같다)
+        calibrate(models_dir, args.margin, args.candidates, bench=not args.no_bench and i == 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# scripts/check_engine_golden.py
+"""
+공용 InferenceEngine golden-output parity 체크.
+
+번들 데이터(backend/data/raw_stream.csv 40건 + data/processed/base_master_mean.parquet 1567건)를
+  1) backend 경로 (backend.services.pipeline.run_prediction_batch)
+  2) 관제 API 경로 (monitoring_api.pipeline.predict_from_json, 단건 호출)
+로 예측해서 results/stageI/engine_golden.json 과 비교한다.
+prob 는 --atol 이내, pred / top_sensors 는 완전히 같아야 통과.
+
+실행 (프로젝트 루트에서):
+    python scripts/check_engine_golden.py            # 비교
+    python scripts/check_engine_golden.py --update   # golden 다시 쓰기 (artifact 교체 시)
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import warnings
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+for path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+import pandas as pd
+
+from backend.services.pipeline import ENGINE, run_prediction_batch
+
+STREAM_CSV = os.path.join(PROJECT_ROOT, "backend", "data", "raw_stream.csv")
+MASTER_PARQUET = os.path.join(PROJECT_ROOT, "data", "processed", "base_master_mean.parquet")
+GOLDEN_PATH = os.path.join(PROJECT_ROOT, "results", "stageI", "engine_golden.json")
+
+
+def load_bundled_rows():
+    """(source, raw dict) 리스트. 빈 값은 None (스트림 replay 와 같은 규칙)"""
+    rows = []
+    with open(STREAM_CSV, newline="") as f:
+        for r in csv.DictReader(f):
+            rows.append(("raw_stream", {
+                k: (float(v) if v != "" else None)
+                for k, v in r.items() if k.startswith("sensor_")
+            }))
+
+    df = pd.read_parquet(MASTER_PARQUET)
+    sensor_cols = [c for c in df.columns if c.startswith("sensor_")]
+    for rec in df[sensor_cols].to_dict(orient="records"):
+        rows.append(("base_master_mean", rec))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--update", action="store_true")
+    parser.add_argument("--atol", type=float, default=1e-9)
+    args = parser.parse_args()
+
+    rows = load_bundled_rows()
+    backend_out = run_prediction_batch([raw for _, raw in rows])
+
+    if args.update:
+        os.makedirs(os.path.dirname(GOLDEN_PATH), exist_ok=True)
+        with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+            json.dump({
+                "artifact_digest": ENGINE.digest,
+                "rows": [dict(source=src, **out) for (src, _), out in zip(rows, backend_out)],
+            }, f, indent=1)
+        print(f"[golden] wrote {len(rows)} rows → {GOLDEN_PATH}")
+        return
+
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        golden = json.load(f)
+    if golden["artifact_digest"] != ENGINE.digest:
+        print("[golden] WARNING: artifact digest 가 golden 생성 시점과 다릅니다")
+    expected = golden["rows"]
+    assert len(expected) == len(rows), (len(expected), len(rows))
+
+    from monitoring_api.pipeline import predict_from_json
+    logging.disable(logging.INFO)  # 단건 호출마다 찍히는 INFO 로그 생략
+
+    failures = 0
+    max_diff = {"backend": 0.0, "monitoring_api": 0.0}
+    for i, ((src, raw), exp, got) in enumerate(zip(rows, expected, backend_out)):
+        mon = predict_from_json(raw)
+        checks = (
+            ("backend", got["prob"], got["pred"], got["top_sensors"]),
+            ("monitoring_api", mon["prob_defect"], mon["pred_label"], exp["top_sensors"]),
+        )
+        for name, prob, pred, top in checks:
+            diff = abs(prob - exp["prob"])
+            max_diff[name] = max(max_diff[name], diff)
+            if diff > args.atol or pred != exp["pred"] or top != exp["top_sensors"]:
+                failures += 1
+                print(f"  FAIL {name} row={i} ({src}) prob={prob} golden={exp['prob']}")
+
+    for name, diff in max_diff.items():
+        print(f"[golden] {name:15s} rows={len(rows)} max|Δprob|={diff:.2e}")
+    assert failures == 0, f"{failures} 건이 golden 과 다릅니다"
+    print("[golden] OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# scripts/check_scaler_fold.py
+"""
+StandardScaler 를 모델 threshold 에 접은 bundle parity 체크 + 스케일링 생략 효과 측정.
+
+base_master_mean.parquet 전체에서
+  - 기준: MODEL.predict_proba(SCALER.transform(X))          (pickle, scaled 입력)
+  - 접은 모델: bundle booster / TreeEnsemble 에 raw 파생변수 X 를 바로 넣은 결과
+가 leaf 단위까지 같은지 확인한다. 접힌 threshold 바로 위/아래(±1 ulp) 값과 NaN 이 섞인 입력도 확인.
+
+실행 (프로젝트 루트에서, scripts/build_artifact_bundle.py 로 bundle 을 만든 뒤):
+    python scripts/check_scaler_fold.py
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+from backend.services.engine import BUNDLE_DIRNAME, InferenceEngine
+
+MODELS_DIR = os.path.join(PROJECT_ROOT, "backend", "models")
+MASTER_PARQUET = os.path.join(PROJECT_ROOT, "data", "processed", "base_master_mean.parquet")
+
+
+def _time_per_call(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def _check(label, ref, folded, X_scaled, X_raw):
+    """같은 입력을 scaled / raw 로 넣었을 때 leaf 와 확률이 같은지"""
+    leaf_ref = ref.model.booster_.predict(X_scaled, pred_leaf=True)
+    leaf_new = folded.booster.predict(X_raw, pred_leaf=True)
+    assert np.array_equal(leaf_ref, leaf_new), f"[{label}] booster leaf 가 다릅니다"
+    leaf_np = folded.tree_ensemble.leaf_indices(X_raw)
+    assert np.array_equal(ref.tree_ensemble.leaf_indices(X_scaled), leaf_np), f"[{label}] TreeEnsemble leaf 가 다릅니다"
+
+    p_ref = ref.model.predict_proba(X_scaled)[:, 1]
+    p_lgb = folded.booster.predict(X_raw)
+    p_np = folded.tree_ensemble.predict_proba(X_raw)
+    print(f"[parity] OK  {label:14s} rows={len(X_raw)}  "
+          f"max|Δprob| booster={np.abs(p_ref - p_lgb).max():.1e} numpy={np.abs(p_ref - p_np).max():.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models-dir", default=MODELS_DIR)
+    args = parser.parse_args()
+
+    ref = InferenceEngine.from_pickles(args.models_dir)
+    folded = InferenceEngine.from_bundle(os.path.join(args.models_dir, BUNDLE_DIRNAME))
+    assert folded.scaler_folded, "bundle 에 scaler 가 접혀 있지 않습니다 (build_artifact_bundle.py 다시 실행)"
+
+    X40 = pd.read_parquet(MASTER_PARQUET)[ref.core_features].to_numpy(dtype=float)
+    X_raw = ref.features(X40)
+
+    # 1) base_master_mean 전체: MODEL.predict_proba(SCALER.transform(X)) vs 접은 모델(X)
+    _check("base_master", ref, folded, ref.scaler.transform(X_raw), X_raw)
+
+    # 2) 접힌 threshold 바로 위 / 위치 / 아래 (±1 ulp) 값
+    trees = folded.tree_ensemble
+    rng = np.random.default_rng(0)
+    node = rng.integers(0, len(trees.feature), 5000)
+    X_edge = np.resize(X_raw, (len(node), X_raw.shape[1]))
+    X_edge[np.arange(len(node)), trees.feature[node]] = (
+        trees.threshold[node] + rng.integers(-1, 2, len(node)) * np.spacing(trees.threshold[node])
+    )
+    _check("threshold ±ulp", ref, folded, ref.scaler.transform(X_edge), X_edge)
+
+    # 3) NaN: scaled 공간의 NaN → 0.0 == raw 공간의 NaN → scaler mean
+    X_nan = X_raw.copy()
+    X_nan[::2, ::5] = np.nan
+    X_nan_raw = X_nan.copy()
+    _check("with NaN", ref, folded, ref.scaler.transform(X_nan),
+           np.where(np.isnan(X_nan_raw), folded.scaler_mean, X_nan_raw))
+
+    # 4) 엔진 전체 경로 (prob / pred / contrib)
+    p_ref, y_ref, c_ref = ref.predict_matrix(X40)
+    p_new, y_new, c_new = folded.predict_matrix(X40)
+    assert np.array_equal(y_ref, y_new) and np.array_equal(c_ref, c_new)
+    print(f"[engine] OK  pred / contrib identical, max|Δprob|={np.abs(p_ref - p_new).max():.1e}")
+
+    # 5) 모델 입력 만들기: 스케일링 vs NaN 채우기만
+    for n in (1, 64, len(X40)):
+        Xb = X40[:n]
+        repeat = max(20, 20000 // n)
+        t_ref = _time_per_call(lambda: ref.model_input(Xb), repeat)
+        t_new = _time_per_call(lambda: folded.model_input(Xb), repeat)
+        print(f"[model_input] rows={n:5d}  scaled={t_ref * 1e6:8.1f} us   folded={t_new * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
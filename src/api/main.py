@@ -1,14 +1,19 @@
 # src/monitoring_api/api/main.py
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
-from ..pipeline import predict_from_json
+from .. import config
+from ..pipeline import FLAG_SKETCHES, predict_from_json_batch
 from ..logging_utils import get_logger
 
+# ..pipeline 이 프로젝트 루트를 import 경로에 추가한 뒤에 import
+from backend.services.batcher import MicroBatcher
+from backend.services.compact import CompactInputError, decode_b64, decode_values
+
 logger = get_logger()
 
 app = FastAPI(
@@ -19,13 +24,30 @@ app = FastAPI(
 
 
 class PredictRequest(BaseModel):
-    payload: Dict[str, Any]
+    payload: Optional[Dict[str, Any]] = None
+    # compact 입력 (payload 대신 둘 중 하나, backend /api/predict 와 같은 형식)
+    layout: Literal["core", "full"] = "core"
+    values: Optional[List[Optional[float]]] = None
+    values_b64: Optional[str] = None
 
 
 class PredictResponse(BaseModel):
     prob_defect: float
     pred_label: int
     threshold: float
+    model_version: str
+
+
+@app.on_event("startup")
+def startup_event():
+    # rolling 분위수 sketch 는 worker 1 개만 (다른 worker 가 이미 잡고 있으면 여기서 시작 실패)
+    FLAG_SKETCHES.claim()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    # rolling 분위수 sketch 상태 저장 (SAVE_EVERY 사이에 쌓인 관측치가 재시작 때 사라지지 않게)
+    FLAG_SKETCHES.save()
 
 
 @app.get("/health")
@@ -33,11 +55,41 @@ def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+# 동시에 들어온 /predict 요청을 최대 PREDICT_BATCH_WINDOW_MS / PREDICT_BATCH_MAX_ROWS 건까지 모아서 한 번에 예측
+_BATCHER = MicroBatcher(
+    predict_from_json_batch,
+    max_batch=config.PREDICT_BATCH_MAX_ROWS,
+    max_wait_ms=config.PREDICT_BATCH_WINDOW_MS,
+)
+
+
+def _model_input(req: PredictRequest):
+    given = [f for f in ("payload", "values", "values_b64") if getattr(req, f) is not None]
+    if len(given) != 1:
+        raise HTTPException(
+            status_code=422,
+            detail="payload, values, values_b64 중 정확히 하나만 보내야 합니다.",
+        )
+    if req.payload is not None:
+        return req.payload
+
+    # core layout 길이는 predict_from_json_batch 에서 활성 엔진 기준으로 확인 (여기서 엔진 로드를 기다리지 않도록)
+    try:
+        if req.values is not None:
+            return decode_values(req.values, req.layout)
+        return decode_b64(req.values_b64, req.layout)
+    except CompactInputError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
 @app.post("/predict", response_model=PredictResponse)
-def predict(req: PredictRequest):
+async def predict(req: PredictRequest):
+    item = _model_input(req)
     try:
-        result = predict_from_json(req.payload)
+        result = await _BATCHER.submit(item)
         return result
+    except CompactInputError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         logger.exception("Prediction error")
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -5,6 +5,7 @@ ZeroQ Factory 관제용 백엔드 패키지.
 - artifacts: 모델/스케일러/threshold 로더
 - features: 전처리 + 파생 피처
 - schema: 입력 스키마 정의 및 유효성 검사
+- engine: backend 와 공유하는 추론 엔진 (backend/services/engine.py)
 - pipeline: end-to-end 예측 파이프라인
 - api: FastAPI 엔드포인트
 
@@ -4,8 +4,6 @@ import json
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-import joblib
-
 from .config import MODEL_DIR
 from .logging_utils import get_logger
 
@@ -25,6 +23,8 @@ def _load_model(path: Path = MODEL_PATH):
     if not path.exists():
         raise FileNotFoundError(f"[artifacts] 모델 파일을 찾을 수 없습니다: {path}")
     logger.info(f"[artifacts] 모델 로딩: {path}")
+    import joblib
+
     model = joblib.load(path)
     return model
 
@@ -33,6 +33,8 @@ def _load_scaler(path: Path = SCALER_PATH):
     if not path.exists():
         raise FileNotFoundError(f"[artifacts] 스케일러 파일을 찾을 수 없습니다: {path}")
     logger.info(f"[artifacts] 스케일러 로딩: {path}")
+    import joblib
+
     scaler = joblib.load(path)
     return scaler
 
@@ -145,19 +147,23 @@ from typing import Any, List, Optional, Tuple
 
 def load_artifacts() -> Tuple[Any, Any, float, Optional[List[str]], Optional[List[str]]]:
     """
-    모델, 스케일러, threshold, core feature 리스트(40개), full feature 리스트(329개)를 함께 로드.
+    모델, 스케일러, threshold, core feature 리스트(40개), full feature 리스트(329개)를 함께 반환.
+    파일을 다시 읽지 않고 공용 추론 엔진(engine.get_inference_engine)이 들고 있는 객체를 돌려준다.
     """
-    model = _load_model()
-    scaler = _load_scaler()
-    threshold = _load_threshold()
+    from .engine import get_inference_engine
 
-    core_feature_list = _load_feature_list()         # stageI_final_features.json (40개)
-    full_feature_list = _load_full_feature_list()    # stageI_full_feature_list.json (329개)
+    engine = get_inference_engine()
 
     logger.info(
         "[artifacts] Artifacts loaded: "
-        f"threshold={threshold}, "
-        f"core_feature_list_len={0 if core_feature_list is None else len(core_feature_list)}, "
-        f"full_feature_list_len={0 if full_feature_list is None else len(full_feature_list)}"
+        f"threshold={engine.threshold}, "
+        f"core_feature_list_len={len(engine.core_features)}, "
+        f"full_feature_list_len={len(engine.final_features)}"
+    )
+    return (
+        engine.model,
+        engine.scaler,
+        engine.threshold,
+        engine.core_features,
+        engine.final_features,
     )
-    return model, scaler, threshold, core_feature_list, full_feature_list
\ No newline at end of file
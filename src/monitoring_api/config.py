@@ -1,4 +1,5 @@
 # src/monitoring_api/config.py
+import os
 from pathlib import Path
 
 # 일종의 경로 설명서 역할을 하는 설정 파일
@@ -19,6 +20,30 @@ PROJECT_ROOT: Path = Path(__file__).resolve().parents[2]
 # 모델 디렉토리
 MODEL_DIR: Path = PROJECT_ROOT / "models"
 
+# 배포용 bundle: backend 와 같은 artifact 라서 backend/models/bundle 을 같이 읽는다
+# (models/ 의 artifact 가 달라지면 digest 가 맞지 않아 models/ 의 pickle 에서 로드)
+BUNDLE_DIR: Path = PROJECT_ROOT / "backend" / "models" / "bundle"
+
+# 모델 레지스트리: 기본 버전 이름(MODEL_DIR 자체) + 추가 버전 디렉토리 (MODEL_DIR/versions/<version>/)
+MODEL_DEFAULT_VERSION: str = "stageI"
+MODEL_VERSIONS_DIR: Path = MODEL_DIR / "versions"
+
+# IQR / P95 flag 용 rolling 분위수 sketch (backend 의 FLAG_SKETCH* 설정과 같은 의미, worker 1 개로만 실행)
+FLAG_SKETCH: bool = os.getenv("FLAG_SKETCH", "0") == "1"
+FLAG_SKETCH_WINDOW: int = int(os.getenv("FLAG_SKETCH_WINDOW", "500"))
+FLAG_SKETCH_MIN_COUNT: int = int(os.getenv("FLAG_SKETCH_MIN_COUNT", "50"))
+FLAG_SKETCH_PATH: Path = PROJECT_ROOT / "results" / "monitoring_flag_sketch.npz"
+FLAG_SKETCH_SAVE_EVERY: int = 256
+
+# /predict 단건 요청 micro-batching (backend 의 PREDICT_BATCH_* 설정과 같은 의미)
+# 동시에 들어온 요청을 최대 PREDICT_BATCH_WINDOW_MS 동안 (또는 PREDICT_BATCH_MAX_ROWS 개까지) 모아서 한 번에 예측
+PREDICT_BATCH_WINDOW_MS: float = float(os.getenv("PREDICT_BATCH_WINDOW_MS", "2"))
+PREDICT_BATCH_MAX_ROWS: int = int(os.getenv("PREDICT_BATCH_MAX_ROWS", "64"))
+
+# 조기 종료(cascade) 추론: 1 이면 bundle 의 cascade.json 밴드로 threshold 에서 먼 wafer 는 앞쪽 트리만 평가
+# (밴드는 scripts/calibrate_cascade.py 로 holdout 에서 보정, 없거나 FLAG_SKETCH 분위수를 쓰는 중이면 항상 전체 앙상블)
+CASCADE_INFERENCE: bool = os.getenv("CASCADE_INFERENCE", "0") == "1"
+
 # 각 sensor별 mean&std&median의 저장되어있는 파일 경로
 SENSOR_STATS_PATH: Path = MODEL_DIR / "sensors_mean_std_median.json"
 
@@ -0,0 +1,45 @@
+# src/monitoring_api/engine.py
+from __future__ import annotations
+
+import sys
+from typing import Tuple
+
+from .config import BUNDLE_DIR, MODEL_DEFAULT_VERSION, MODEL_DIR, MODEL_VERSIONS_DIR, PROJECT_ROOT
+
+# backend/services/engine.py 를 같이 쓰기 위해 프로젝트 루트를 import 경로에 추가
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services.artifacts import load_sensor_stats  # noqa: E402
+from backend.services.engine import InferenceEngine  # noqa: E402
+from backend.services.registry import ModelRegistry  # noqa: E402
+
+# load_sensor_stats 는 features.py 가 이 모듈을 통해 가져다 쓴다 (프로젝트 루트 경로 설정 이후 import)
+__all__ = [
+    "InferenceEngine",
+    "MODEL_REGISTRY",
+    "get_active_engine",
+    "get_inference_engine",
+    "load_sensor_stats",
+]
+
+# models/ 기준 모델 버전 레지스트리 (backend 와 같은 ModelRegistry, 기본 버전은 backend 의 bundle 을 같이 사용)
+MODEL_REGISTRY = ModelRegistry(
+    default_dir=MODEL_DIR,
+    default_version=MODEL_DEFAULT_VERSION,
+    versions_dir=MODEL_VERSIONS_DIR,
+    bundle_dir=BUNDLE_DIR,
+)
+
+
+def get_active_engine() -> Tuple[str, InferenceEngine]:
+    """(활성 모델 버전, 엔진). 요청마다 한 번만 잡아서 끝까지 같은 버전으로 예측한다."""
+    return MODEL_REGISTRY.active()
+
+
+def get_inference_engine() -> InferenceEngine:
+    """
+    models/ 기준 공용 추론 엔진 (활성 버전).
+    artifact 내용이 같으면 backend 와 같은 객체를 공유한다 (한 프로세스에서 두 앱을 띄울 때).
+    """
+    return get_active_engine()[1]
@@ -8,15 +8,24 @@ import pandas as pd
 from .logging_utils import get_logger
 from .artifacts import _load_feature_list  # core feature 리스트 로더 재사용
 
-import json
-from pathlib import Path
+from functools import lru_cache
 
-# 수정; # from .config import SENSOR_STATS_PATH <- 이렇게 해도 됨
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-STATS_PATH = PROJECT_ROOT / "models" / "sensors_mean_std_median.json"
+from .config import SENSOR_STATS_PATH
 
-with open(STATS_PATH, "r", encoding="utf-8") as f:
-    SENSOR_STATS = json.load(f)
+
+@lru_cache(maxsize=1)
+def _default_sensor_stats() -> dict:
+    """models/sensors_mean_std_median.json (처음 쓸 때 한 번만 로드, 공용 엔진과 같은 캐시)"""
+    from .engine import load_sensor_stats
+
+    return load_sensor_stats(SENSOR_STATS_PATH.parent)
+
+
+def __getattr__(name):
+    # 예전 모듈 상수 SENSOR_STATS 호환 (import 시점 로드 대신 접근할 때 로드)
+    if name == "SENSOR_STATS":
+        return _default_sensor_stats()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 logger = get_logger(__name__)
@@ -81,6 +90,42 @@ def select_core_features_from_raw(df_raw: pd.DataFrame) -> pd.DataFrame:
     return df_sel
 
 
+# --------------------------------------------------------------
+# 통계 테이블: SENSOR_STATS dict → 컬럼 순서에 맞춘 mean/std/median 배열
+# --------------------------------------------------------------
+_STATS_TABLE_CACHE: dict = {}
+
+
+def _stats_tables(columns: List[str], stats_dict: dict):
+    """
+    columns 순서의 mean / std / median float64 배열을 만든다.
+    기본 SENSOR_STATS 기준 테이블은 컬럼 구성별로 캐시해서 요청마다 dict 를 다시 보지 않는다.
+
+    - JSON 에 없는 값은 NaN (mean/median 은 호출하는 쪽에서 현재 데이터로 fallback)
+    - std 가 0/결측이거나 mean 이 없으면 std=inf → z=0 이 되어 이상치 처리 생략
+    """
+    cacheable = stats_dict is _default_sensor_stats()
+    key = tuple(columns)
+    if cacheable and key in _STATS_TABLE_CACHE:
+        return _STATS_TABLE_CACHE[key]
+
+    def _get(col, name):
+        value = stats_dict.get(col, {}).get(name, None)
+        return np.nan if value is None else float(value)
+
+    mean = np.array([_get(c, "mean") for c in columns], dtype=float)
+    std = np.array([_get(c, "std") for c in columns], dtype=float)
+    median = np.array([_get(c, "median") for c in columns], dtype=float)
+
+    valid = (std > 0) & ~np.isnan(mean)
+    std = np.where(valid, std, np.inf)
+
+    tables = (mean, std, median)
+    if cacheable:
+        _STATS_TABLE_CACHE[key] = tables
+    return tables
+
+
 # --------------------------------------------------------------
 # 2. mean 버전 전처리 (NaN 대치 + Z-score 기반 이상치 → median 대치)
 # --------------------------------------------------------------
@@ -113,33 +158,28 @@ def preprocess_mean_version(
 
     # 통계 딕셔너리 설정 (외부에서 주입 가능, 기본은 글로벌 SENSOR_STATS 사용)
     if stats_dict is None:
-        stats_dict = SENSOR_STATS
+        stats_dict = _default_sensor_stats()
 
-    X = df.copy()
+    columns = list(df.columns)
+    mean, std, median = _stats_tables(columns, stats_dict)
+
+    # 입력 dtype(float32) 그대로 계산해야 기존 컬럼별 pandas 연산과 값이 같다
+    X = df.to_numpy(dtype="float32", copy=True)
 
     # --------------------------------------------------
     # 1) mean 대치 (학습 시 저장해둔 mean 사용)
+    #    JSON 에 mean 이 없는 컬럼만 현재 데이터 기준 mean 으로 fallback
     # --------------------------------------------------
-    nan_before = int(X.isna().sum().sum())
+    nan_mask = np.isnan(X)
+    nan_before = int(nan_mask.sum())
 
     if nan_before > 0:
-        for col in X.columns:
-            if not X[col].isnull().any():
-                continue
-
-            # JSON에서 mean 가져오기 시도
-            mean_val = None
-            if stats_dict is not None and col in stats_dict:
-                mean_val = stats_dict[col].get("mean", None)
-
-            # 그래도 못 찾으면 현재 데이터 기준 mean fallback
-            if mean_val is None or pd.isna(mean_val):
-                mean_val = X[col].mean()
+        fill = mean
+        if np.isnan(mean).any():
+            fill = np.where(np.isnan(mean), np.nanmean(X, axis=0), mean)
+        np.copyto(X, fill.astype(X.dtype), where=nan_mask)
 
-            # chained-assignment 방지: inplace 대신 대입
-            X[col] = X[col].fillna(mean_val)
-
-    nan_after = int(X.isna().sum().sum())
+    nan_after = int(np.isnan(X).sum())
     logger.info(
         "[features] mean 대치 완료: "
         f"NaN before={nan_before}, NaN after={nan_after}"
@@ -148,45 +188,25 @@ def preprocess_mean_version(
     # --------------------------------------------------
     # 2) Z-score 기반 이상치 완화 (|z| > threshold → median 대치)
     #    z 계산할 때도 stats_dict에 저장된 mean/std 사용
+    #    (std 가 0/결측이거나 mean 이 없는 컬럼은 std=inf → z=0 으로 스킵)
     # --------------------------------------------------
-    replaced_total = 0
-
-    for col in X.columns:
-        # stats_dict에 해당 컬럼 정보가 없으면 스킵
-        if stats_dict is None or col not in stats_dict:
-            continue
-
-        col_stats = stats_dict[col]
-        col_mean = col_stats.get("mean", None)
-        col_std = col_stats.get("std", None)
-        col_median = col_stats.get("median", None)
-
-        # std가 0이거나 결측이면 Z-score 의미 없으므로 스킵
-        if col_std is None or col_std == 0 or pd.isna(col_std):
-            continue
-        if col_mean is None or pd.isna(col_mean):
-            continue
-
-        # 학습 분포 기준 Z-score 계산
-        z = (X[col] - col_mean) / col_std
-        mask = z.abs() > z_threshold
+    with np.errstate(invalid="ignore"):
+        z = (X - mean.astype(X.dtype)) / std.astype(X.dtype)
+    mask = np.abs(z) > z_threshold
+    replaced_total = int(mask.sum())
 
-        if not mask.any():
-            continue
-
-        # median이 JSON에 없다면, 마지막 fallback으로 현재 데이터 기준 median
-        if col_median is None or pd.isna(col_median):
-            col_median = X[col].median()
-
-        X.loc[mask, col] = col_median
-        replaced_total += int(mask.sum())
+    if replaced_total > 0:
+        # median 이 JSON 에 없다면, 마지막 fallback 으로 현재 데이터 기준 median
+        if np.isnan(median).any():
+            median = np.where(np.isnan(median), np.nanmedian(X, axis=0), median)
+        np.copyto(X, median.astype(X.dtype), where=mask)
 
     logger.info(
         "[features] Z-score 이상치 완화 완료: "
         f"총 대치된 값 개수={replaced_total}, Z_THRESHOLD={z_threshold}"
     )
 
-    return X.astype("float32")
+    return pd.DataFrame(X, columns=columns, index=df.index)
 
 
 
@@ -201,7 +221,7 @@ def add_engineered_features(df: pd.DataFrame) -> pd.DataFrame:
     포함 내용:
       - 절대값 파생: col_abs
       - 제곱 파생: col_sq
-      - 로그 파생: col_log (양수값 기준 log1p, 전체 데이터셋 기준 조건)
+      - 로그 파생: col_log (log1p(max(x, 0)))
       - 중요 상위 10개 센서 간 차이/비율: c1_minus_c2, c1_ratio_c2
       - IQR 기반 이상치 플래그: col_iqr_flag
       - 상위 95% 이상 플래그: col_p95_flag
@@ -218,24 +238,23 @@ def add_engineered_features(df: pd.DataFrame) -> pd.DataFrame:
 
     # 여기서 df 는 이미 core 40개 + 전처리(mean/Z-score)까지 끝난 상태라고 가정
     X = df.copy()
-    X_fe = X.copy()
+
+    # 컬럼을 하나씩 X_fe 에 붙이면 DataFrame fragmentation(PerformanceWarning)이
+    # 생기므로 파생 컬럼은 dict 에 모았다가 마지막에 한 번만 concat
+    new_cols = {}
 
     # ----- 3-1. 절대값 파생 -----
     for col in X.columns:
-        X_fe[f"{col}_abs"] = np.abs(X[col])
+        new_cols[f"{col}_abs"] = np.abs(X[col])
 
     # ----- 3-2. 제곱 파생 -----
     for col in X.columns:
-        X_fe[f"{col}_sq"] = X[col] ** 2
+        new_cols[f"{col}_sq"] = X[col] ** 2
 
-    # ----- 3-3. 로그 파생 (양수만 대상) -----
-    # StageG 노트북과 동일하게, "데이터셋 전체 기준 양수 값이 1개 이상" 이면 log 컬럼 생성
+    # ----- 3-3. 로그 파생 (log1p(max(x, 0))) -----
+    # 데이터에 양수가 있는지와 관계없이 항상 생성 (backend / 공용 엔진과 같은 컬럼 구성)
     for col in X.columns:
-        col_values = X[col]
-        # 한 row 만 들어와도, 값이 양수면 로그 피처 생성
-        if (col_values > 0).sum() > 0:
-            clipped = np.clip(col_values, a_min=0, a_max=None)
-            X_fe[f"{col}_log"] = np.log1p(clipped)
+        new_cols[f"{col}_log"] = np.log1p(np.clip(X[col], a_min=0, a_max=None))
 
     # ----- 3-4. 중요 상위 10개 센서만 조합 (차이/비율) -----
     top_k = 10
@@ -244,8 +263,8 @@ def add_engineered_features(df: pd.DataFrame) -> pd.DataFrame:
     for i in range(len(important_cols)):
         for j in range(i + 1, len(important_cols)):
             c1, c2 = important_cols[i], important_cols[j]
-            X_fe[f"{c1}_minus_{c2}"] = X[c1] - X[c2]
-            X_fe[f"{c1}_ratio_{c2}"] = X[c1] / (X[c2] + 1e-5)
+            new_cols[f"{c1}_minus_{c2}"] = X[c1] - X[c2]
+            new_cols[f"{c1}_ratio_{c2}"] = X[c1] / (X[c2] + 1e-5)
 
     # ----- 3-5. IQR 기반 이상치 플래그 -----
     # StageG 코드처럼 조건 없이 항상 flag 컬럼 생성
@@ -257,13 +276,15 @@ def add_engineered_features(df: pd.DataFrame) -> pd.DataFrame:
 
         lower = Q1 - 1.5 * IQR
         upper = Q3 + 1.5 * IQR
-        X_fe[f"{col}_iqr_flag"] = ((series < lower) | (series > upper)).astype(int)
+        new_cols[f"{col}_iqr_flag"] = ((series < lower) | (series > upper)).astype(int)
 
     # ----- 3-6. 상위 95% 이상 플래그 -----
     for col in X.columns:
         series = X[col]
         p95 = series.quantile(0.95)
-        X_fe[f"{col}_p95_flag"] = (series >= p95).astype(int)
+        new_cols[f"{col}_p95_flag"] = (series >= p95).astype(int)
+
+    X_fe = pd.concat([X, pd.DataFrame(new_cols, index=X.index)], axis=1)
 
     logger.info(
         "[features] 파생 피처 생성 완료: "
@@ -273,26 +294,45 @@ def add_engineered_features(df: pd.DataFrame) -> pd.DataFrame:
 
 
 # --------------------------------------------------------------
-# 최종 오케스트레이터: pipeline 에서 이 함수만 호출
+# core 센서 행렬: 공용 추론 엔진 입력
 # --------------------------------------------------------------
-def build_features_from_raw(df_raw: pd.DataFrame) -> pd.DataFrame:
+def select_core_matrix(df_raw: pd.DataFrame, core_features: List[str]) -> np.ndarray:
     """
-    관제에서 들어온 raw DataFrame → 모델/학습용 feature DataFrame 변환.
+    raw DataFrame → core_features 순서의 (N, 40) float64 행렬.
+    없는 컬럼 / 숫자가 아닌 값은 NaN (전처리에서 mean 대치).
+    """
+    missing = [c for c in core_features if c not in df_raw.columns]
+    if missing:
+        logger.warning(
+            "[features] raw 데이터에 존재하지 않는 core feature 가 있습니다. "
+            f"missing={missing[:5]} (총 {len(missing)}개)"
+        )
+    df_sel = df_raw.reindex(columns=core_features).apply(pd.to_numeric, errors="coerce")
+    return df_sel.to_numpy(dtype=float)
 
-    내부 단계:
-      1) select_core_features_from_raw: core feature 선택 + numeric 정리
-      2) preprocess_mean_version: mean 대치 + Z-score 이상치 완화
-      3) add_engineered_features: StageG 파생 피처 생성
 
-    반환:
-      - 모델/스케일러에 바로 넣을 수 있는 feature DataFrame
-      - 실제 추론 시에는 pipeline 에서 feature_list 에 맞춰 최종 컬럼을 선택/정렬한다.
+# --------------------------------------------------------------
+# 최종 오케스트레이터: pipeline 과 같은 공용 엔진으로 feature 생성
+# --------------------------------------------------------------
+def build_features_from_raw(df_raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    관제에서 들어온 raw DataFrame → 모델 입력 순서의 feature DataFrame 변환.
+
+    backend 와 같은 InferenceEngine 으로
+      1) core feature 선택 (select_core_matrix)
+      2) mean 대치 + Z-score 이상치 완화
+      3) StageG 파생 피처 (row 단위 flag)
+    를 수행하고, stageI_full_feature_list.json 순서의 329개 컬럼을 반환한다.
     """
+    from .engine import get_inference_engine
+
     logger.info(f"[features] build_features_from_raw 시작: raw_shape={df_raw.shape}")
 
-    df_core = select_core_features_from_raw(df_raw)
-    df_pre = preprocess_mean_version(df_core)
-    df_fe = add_engineered_features(df_pre)
+    engine = get_inference_engine()
+    X40 = select_core_matrix(df_raw, engine.core_features)
+    df_fe = pd.DataFrame(
+        engine.features(X40), columns=engine.final_features, index=df_raw.index
+    )
 
     logger.info(f"[features] build_features_from_raw 완료: final_shape={df_fe.shape}")
-    return df_fe
\ No newline at end of file
+    return df_fe
@@ -1,53 +1,50 @@
 # src/monitoring_api/pipeline.py
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
-import pandas as pd
 
-from .artifacts import load_artifacts
-from .features import build_features_from_raw
+from . import config
+from .engine import get_active_engine
+from .features import select_core_matrix
 from .logging_utils import get_logger
 from .schema import parse_and_validate
 
+# .engine 이 프로젝트 루트를 import 경로에 추가한 뒤에 import
+from backend.services.compact import SensorVector
+from backend.services.quantile_sketch import FlagSketchStore
+
 logger = get_logger()
 
 # API 모듈의 엔진
-
-# 애플리케이션 시작 시 한 번만 artifact 로드
-# main.py 에서도 load_artifacts() 를 호출하지만,
-# 여기서도 호출해서 전역 변수에 저장해 둠
-_MODEL, _SCALER, _THRESHOLD, _CORE_FEATURE_LIST, _FULL_FEATURE_LIST = load_artifacts()
-
-logger.info(
-    f"Artifacts loaded: threshold={_THRESHOLD}, "
-    f"core_feature_list_len={0 if _CORE_FEATURE_LIST is None else len(_CORE_FEATURE_LIST)}, "
-    f"full_feature_list_len={0 if _FULL_FEATURE_LIST is None else len(_FULL_FEATURE_LIST)}"
+# backend 와 같은 InferenceEngine 을 첫 요청 때 로드해서 공유 (import 시점에는 로드하지 않음)
+
+# IQR / P95 flag 용 rolling 분위수 (FLAG_SKETCH=1 일 때만)
+FLAG_SKETCHES = FlagSketchStore(
+    path=config.FLAG_SKETCH_PATH,
+    window=config.FLAG_SKETCH_WINDOW,
+    min_count=config.FLAG_SKETCH_MIN_COUNT,
+    save_every=config.FLAG_SKETCH_SAVE_EVERY,
+    enabled=config.FLAG_SKETCH,
 )
 
 
-def _prepare_input_matrix(df_features: pd.DataFrame) -> np.ndarray:
+def _predict_prob(engine, X40):
     """
-    df_features 를 모델 입력 형태의 numpy 배열로 변환.
-
-    - FULL feature 리스트(_FULL_FEATURE_LIST)가 존재하면
-      그 순서에 맞게 reindex (StageG/StageH 학습 시점의 컬럼 구조와 동일하게 맞춤)
+    (N, 40) → (prob, pred). 관제 API 는 기여도를 쓰지 않으므로 NumPy 트리 평가기(predict_prob) 사용.
+    rolling 분위수 flag 는 이번 입력을 넣기 전 상태 기준으로 예측 후 갱신.
+    CASCADE_INFERENCE 면 threshold 에서 먼 wafer 는 앞쪽 트리만으로 확정 (조기 종료).
     """
-    if _FULL_FEATURE_LIST is not None:
-        missing = [c for c in _FULL_FEATURE_LIST if c not in df_features.columns]
-        if missing:
-            # 완전히 똑같이 맞추는 게 베스트지만,
-            # 혹시 빠진 게 있으면 NaN 컬럼으로 채워넣고 경고만 띄움
-            logger.warning(
-                f"모델이 기대하는 full feature 중 누락된 컬럼이 있습니다. "
-                f"예시 missing={missing[:5]} (총 {len(missing)}개)"
-            )
-
-        df_features = df_features.reindex(columns=_FULL_FEATURE_LIST)
-
-    X = df_features.to_numpy().astype("float32")
-    return X
+    sketch = FLAG_SKETCHES.get(engine.core_features)
+    if sketch is None:
+        return engine.predict_prob(X40, cascade=config.CASCADE_INFERENCE)
+    # 전처리는 한 번만: 예측과 분위수 갱신에 같은 행렬
+    X_clean = engine.preprocess(X40)[0]
+    out = engine.predict_prob(X_clean, flag_quantiles=sketch.quantiles(),
+                              cascade=config.CASCADE_INFERENCE, preprocessed=True)
+    FLAG_SKETCHES.observe(sketch, X_clean)
+    return out
 
 
 def predict_from_json(json_payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -65,7 +62,8 @@ def predict_from_json(json_payload: Dict[str, Any]) -> Dict[str, Any]:
         {
             "prob_defect": float,  # 불량일 확률
             "pred_label": int,     # 0(정상) / 1(불량)
-            "threshold": float
+            "threshold": float,
+            "model_version": str   # 예측한 모델 버전
         }
     """
     logger.info(f"Received payload keys: {list(json_payload.keys())}")
@@ -73,34 +71,62 @@ def predict_from_json(json_payload: Dict[str, Any]) -> Dict[str, Any]:
     # 1) JSON 파싱 & 유효성 검사
     df_raw = parse_and_validate(json_payload)
 
-    # 2) 전처리 + 파생 피처 생성
-    df_features = build_features_from_raw(df_raw) #df_fe를 여기서 받음
-
-    # 3) 스케일링
-    X = _prepare_input_matrix(df_features)
-    X_scaled = _SCALER.transform(X)
-
-    # 4) 예측 확률 (양성 클래스 기준)
-    if hasattr(_MODEL, "predict_proba"):
-        prob = float(_MODEL.predict_proba(X_scaled)[0, 1])
-    elif hasattr(_MODEL, "decision_function"):
-        # decision_function 출력값을 시그모이드로 변환 (예비용)
-        score = float(_MODEL.decision_function(X_scaled)[0])
-        prob = 1.0 / (1.0 + np.exp(-score))
-    else:
-        # 이진 예측만 가능한 모델인 경우,
-        # 일단 0/1 예측 후, 그 값을 확률처럼 사용
-        pred_raw = int(_MODEL.predict(X_scaled)[0])
-        prob = float(pred_raw)
-
-    # 5) threshold 로 최종 라벨 결정
-    pred_label = int(prob >= _THRESHOLD)
+    # 2) core 센서 선택 → (1, 40)
+    model_version, engine = get_active_engine()
+    X40 = select_core_matrix(df_raw, engine.core_features)
+
+    # 3) 전처리 + 파생 피처 + 스케일링 + 예측 (backend 와 같은 엔진)
+    prob_arr, pred_arr = _predict_prob(engine, X40)
+    prob = float(prob_arr[0])
+
+    # 4) threshold 로 최종 라벨 결정
+    pred_label = int(pred_arr[0])
 
     result: Dict[str, Any] = {
         "prob_defect": prob,
         "pred_label": pred_label,
-        "threshold": float(_THRESHOLD),
+        "threshold": float(engine.threshold),
+        "model_version": model_version,
     }
 
     logger.info(f"Prediction result: {result}")
-    return result
\ No newline at end of file
+    return result
+
+def predict_from_json_batch(
+    json_payloads: List[Union[Dict[str, Any], SensorVector]],
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    여러 payload 를 한 번의 엔진 호출로 예측 (micro-batcher 용).
+
+    payload 는 JSON dict 또는 이미 디코딩된 compact 입력(SensorVector) 이다.
+    payload 별 파싱/유효성 검사는 따로 하고, 실패한 payload 자리에는 예외 객체를 넣어서
+    다른 payload 의 예측에는 영향이 없게 한다. 결과 형식은 predict_from_json 과 같다.
+    """
+    model_version, engine = get_active_engine()
+
+    results: List[Union[Dict[str, Any], Exception]] = [None] * len(json_payloads)
+    rows, positions = [], []
+    for i, payload in enumerate(json_payloads):
+        try:
+            if isinstance(payload, SensorVector):
+                # compact 입력은 DataFrame 을 거치지 않고 바로 (1, 40)
+                rows.append(engine.select([payload]))
+            else:
+                df_raw = parse_and_validate(payload)
+                rows.append(select_core_matrix(df_raw, engine.core_features))
+            positions.append(i)
+        except Exception as e:
+            results[i] = e
+
+    if rows:
+        prob_arr, pred_arr = _predict_prob(engine, np.vstack(rows))
+        for i, prob, pred in zip(positions, prob_arr, pred_arr):
+            results[i] = {
+                "prob_defect": float(prob),
+                "pred_label": int(pred),
+                "threshold": float(engine.threshold),
+                "model_version": model_version,
+            }
+
+    logger.info(f"Batch prediction: size={len(json_payloads)}, failed={len(json_payloads) - len(rows)}")
+    return results